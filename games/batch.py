@@ -0,0 +1,304 @@
+"""Run many headless episodes of a game with a bot and summarise them.
+
+    python -m games.batch flappybird --episodes 1000
+    python -m games.batch pong --set ai_speed=5 --episodes 200 --workers 8
+    python -m games.batch --config sweep.json --out results.json
+
+A config file is JSON with any of the command line settings plus the
+constants to try, e.g.
+
+    {"game": "flappybird", "episodes": 500,
+     "params": {"GAME_SPEED": 4},
+     "sweep": {"PIPE_GAP": [180, 200, 220], "GRAVITY": [0.7, 0.8]}}
+
+Every combination in ``sweep`` (on top of ``params``) is run with the same
+episode seeds, so differences between rows come from the constants rather
+than from luck.
+"""
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_EPISODES = 100
+DEFAULT_MAX_FRAMES = 36000  # Ten minutes of 60 Hz steps
+DEFAULT_SIZE = '1024x768'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-simulate a game with a bot")
+    parser.add_argument('game', nargs='?', help="registry key, e.g. flappybird")
+    parser.add_argument('--bot', help="policy from games.bots (default depends on the game)")
+    parser.add_argument('--episodes', type=int, help=f"episodes per setting ({DEFAULT_EPISODES})")
+    parser.add_argument('--max-frames', type=int,
+                        help=f"steps before an episode is cut off ({DEFAULT_MAX_FRAMES})")
+    parser.add_argument('--seed', type=int, help="seed of the first episode (0)")
+    parser.add_argument('--size', help=f"window size the game lays out for ({DEFAULT_SIZE})")
+    parser.add_argument('--workers', type=int, help="worker processes (one per CPU)")
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help="override a game attribute; may be repeated")
+    parser.add_argument('--config', metavar='PATH', help="JSON settings and parameter sweep")
+    parser.add_argument('--out', metavar='PATH', help="write the full results as JSON")
+    return parser.parse_args(argv)
+
+
+def parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def expand_sweep(params, sweep):
+    """Every combination of ``sweep`` values, each merged over ``params``."""
+    names = list(sweep)
+    combos = []
+    for values in itertools.product(*(sweep[name] for name in names)):
+        combo = dict(params)
+        combo.update(zip(names, values))
+        combos.append(combo)
+    return combos
+
+
+def init_worker(size):
+    # Each worker gets its own invisible display and silent mixer
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    import pygame
+    from utils.display import window
+    pygame.init()
+    window.ensure_mode(size)
+
+
+def apply_params(game, params):
+    for name, value in params.items():
+        if not hasattr(game, name):
+            raise AttributeError(f"{type(game).__name__} has no attribute {name!r}")
+        setattr(game, name, value)
+
+
+def same_kind(current, value):
+    # Numbers may be swapped for numbers (ints for floats and back), but
+    # not for bools; anything else must keep its type
+    number = (int, float)
+    if isinstance(current, bool) or isinstance(value, bool):
+        return isinstance(current, bool) and isinstance(value, bool)
+    if isinstance(current, number):
+        return isinstance(value, number)
+    return isinstance(value, type(current))
+
+
+def check_params(key, combos):
+    """Problems with the constants in ``combos``, checked on a fresh game."""
+    from games import registry
+    game = registry.get_game(key).create()
+    problems = []
+    for name in sorted({name for combo in combos for name in combo}):
+        if not hasattr(game, name):
+            problems.append(f"{type(game).__name__} has no attribute {name!r}")
+            continue
+        current = getattr(game, name)
+        if callable(current):
+            problems.append(f"{name} is a method, not a constant")
+            continue
+        for value in sorted({json.dumps(combo[name]) for combo in combos if name in combo}):
+            if not same_kind(current, json.loads(value)):
+                problems.append(f"{name}={value} does not match its current value {current!r}")
+    return problems
+
+
+def run_episode(job):
+    """Play one episode in a worker; returns a dict of its measurements."""
+    import random
+    from games import registry
+    from games.bots import BotInput, get_bot
+    from utils.game_base import GameBase
+
+    combo, key, params, bot, seed, max_frames = job
+    GameBase.default_seed = seed
+    GameBase.adaptive_quality = False
+    start = time.perf_counter()
+    frames = 0
+    try:
+        game = registry.get_game(key).create()
+        # Constants first so the reset builds the round from them, then again
+        # in case the reset put a tuned starting value (e.g. snake_speed) back
+        apply_params(game, params)
+        game.reset_game()
+        apply_params(game, params)
+        game.input = BotInput(get_bot(bot), game, random.Random(seed))
+
+        while frames < max_frames and not getattr(game, 'game_over', False):
+            if not game.step(draw=False):
+                break
+            frames += 1
+    except Exception as e:
+        # One bad setting must not take the rest of the batch down with it
+        return {
+            'combo': combo,
+            'params': params,
+            'seed': seed,
+            'frames': frames,
+            'error': f"{type(e).__name__}: {e}",
+        }
+    elapsed = time.perf_counter() - start
+    return {
+        'combo': combo,
+        'seed': seed,
+        'frames': frames,
+        'survival_s': game.game_time / 1000,
+        'score': game.final_score(),
+        'game_over': bool(getattr(game, 'game_over', False)),
+        'elapsed_s': elapsed,
+    }
+
+
+def describe(values):
+    from utils.profiler import percentile
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    return {
+        'mean': statistics.fmean(ordered),
+        'stdev': statistics.pstdev(ordered),
+        'min': ordered[0],
+        'p10': percentile(ordered, 0.10),
+        'p50': percentile(ordered, 0.50),
+        'p90': percentile(ordered, 0.90),
+        'max': ordered[-1],
+    }
+
+
+def summarize(params, runs):
+    failures = [run for run in runs if 'error' in run]
+    episodes = [run for run in runs if 'error' not in run]
+    scores = [episode['score'] for episode in episodes if episode['score'] is not None]
+    # Each distinct error once, with the first seed that hit it
+    errors = {}
+    for run in failures:
+        errors.setdefault(run['error'], run['seed'])
+    histogram = {}
+    for score in scores:
+        histogram[score] = histogram.get(score, 0) + 1
+    frames = sum(episode['frames'] for episode in episodes)
+    busy = sum(episode['elapsed_s'] for episode in episodes)
+    return {
+        'params': params,
+        'episodes': len(episodes),
+        'failed': len(failures),
+        'errors': [{'seed': seed, 'error': error} for error, seed in list(errors.items())[:5]],
+        'game_overs': sum(episode['game_over'] for episode in episodes),
+        'survival_s': describe([episode['survival_s'] for episode in episodes]),
+        'score': dict(describe(scores), histogram={str(k): histogram[k] for k in sorted(histogram)}),
+        # Per worker: how fast one process steps this game with drawing off
+        'steps_per_s': frames / busy if busy else 0.0,
+        'episodes_per_s': len(episodes) / busy if busy else 0.0,
+    }
+
+
+def print_table(summaries):
+    print(f"{'params':<40} {'eps':>5} {'fail':>5} {'over':>5} {'surv p50':>9} {'surv p90':>9} "
+          f"{'score':>7} {'p90':>6} {'steps/s':>9}")
+    for row in summaries:
+        params = ', '.join(f"{name}={value}" for name, value in row['params'].items()) or '(defaults)'
+        survival, score = row['survival_s'], row['score']
+        print(f"{params:<40.40} {row['episodes']:>5} {row['failed']:>5} {row['game_overs']:>5} "
+              f"{survival.get('p50', 0):>9.1f} {survival.get('p90', 0):>9.1f} "
+              f"{score.get('mean', 0):>7.2f} {score.get('p90', 0):>6} {row['steps_per_s']:>9.0f}")
+    for row in summaries:
+        for failure in row['errors']:
+            params = ', '.join(f"{name}={value}" for name, value in row['params'].items()) or '(defaults)'
+            print(f"  {params}: seed {failure['seed']} failed with {failure['error']}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+
+    def setting(name, default):
+        value = getattr(args, name)
+        return value if value is not None else config.get(name, default)
+
+    from games import registry
+    from games.bots import DEFAULT_BOTS, get_bot
+    from utils.display import parse_size
+
+    key = setting('game', None)
+    spec = registry.get_game(key)
+    if spec is None:
+        print(f"Unknown game {key!r}; choose from {', '.join(game.key for game in registry.GAMES)}")
+        return 2
+    if spec.external:
+        print(f"{spec.name} runs in its own process and cannot be simulated")
+        return 2
+    bot = setting('bot', DEFAULT_BOTS.get(spec.key, 'random'))
+    if get_bot(bot) is None:
+        print(f"Unknown bot {bot!r}")
+        return 2
+
+    episodes = setting('episodes', DEFAULT_EPISODES)
+    max_frames = setting('max_frames', DEFAULT_MAX_FRAMES)
+    first_seed = setting('seed', 0)
+    size = parse_size(setting('size', DEFAULT_SIZE))
+    workers = setting('workers', None) or os.cpu_count()
+    params = dict(config.get('params', {}))
+    for item in args.set:
+        name, _, value = item.partition('=')
+        params[name] = parse_value(value)
+    combos = expand_sweep(params, config.get('sweep', {}))
+
+    jobs = [(combo, spec.key, combo_params, bot, first_seed + episode, max_frames)
+            for combo, combo_params in enumerate(combos)
+            for episode in range(episodes)]
+    print(f"{spec.name}: {len(combos)} setting(s) x {episodes} episodes with the "
+          f"{bot!r} bot on {workers} worker(s)")
+
+    start = time.perf_counter()
+    results = [[] for _ in combos]
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(size,)) as pool:
+        # Names and types are checked on a real instance before any episode
+        # runs, since most constants are only set in the game's __init__
+        problems = pool.submit(check_params, spec.key, combos).result()
+        if problems:
+            for problem in problems:
+                print(f"Bad setting: {problem}")
+            return 2
+        chunk = max(1, len(jobs) // (workers * 8))
+        for result in pool.map(run_episode, jobs, chunksize=chunk):
+            results[result['combo']].append(result)
+    wall = time.perf_counter() - start
+
+    summaries = [summarize(combo_params, episodes) for combo_params, episodes in zip(combos, results)]
+    print_table(summaries)
+    failed = sum(row['failed'] for row in summaries)
+    print(f"{len(jobs)} episodes in {wall:.1f} s ({len(jobs) / wall:.1f} episodes/s)"
+          + (f", {failed} failed" if failed else ""))
+
+    if args.out:
+        report = {
+            'game': spec.key,
+            'bot': bot,
+            'episodes': episodes,
+            'max_frames': max_frames,
+            'first_seed': first_seed,
+            'size': list(size),
+            'workers': workers,
+            'wall_s': wall,
+            'settings': summaries,
+            'runs': results,
+        }
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Simple scripted players for headless runs.
+
+A policy is a function ``policy(game, rng)`` returning the set of keys it
+wants held this frame. ``BotInput`` turns changes in that set into
+KEYDOWN/KEYUP events, so a policy taps a key by returning it for one
+frame and leaving it out the next.
+"""
+import pygame
+from utils.input_source import KeyState
+
+
+class BotInput:
+    """Input source driven by a policy instead of a keyboard."""
+
+    def __init__(self, policy, game, rng):
+        self.policy = policy
+        self.game = game
+        self.rng = rng
+        self.held = set()
+
+    def get_events(self):
+        pygame.event.clear()
+        keys = set(self.policy(self.game, self.rng))
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='')
+                  for key in keys - self.held]
+        events += [pygame.event.Event(pygame.KEYUP, key=key, mod=0)
+                   for key in self.held - keys]
+        self.held = keys
+        return events
+
+    def get_pressed(self):
+        return KeyState(self.held)
+
+    def next_frame(self, steps=1):
+        pass
+
+
+def idle(game, rng):
+    return ()
+
+
+def random_keys(game, rng):
+    # Mashes the keys every game understands; a baseline for the others
+    if rng.random() < 0.1:
+        return (rng.choice((pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT,
+                            pygame.K_RIGHT, pygame.K_SPACE)),)
+    return ()
+
+
+def flappy(game, rng):
+    # Every flap is a fresh press, so let go for a frame after each one
+    if game.game_over or pygame.K_SPACE in game.input.held:
+        return ()
+    if game.begin:
+        return (pygame.K_SPACE,)
+    # Flap once the bird is falling past the middle of the next gap
+    bird = game.bird.rect
+    ahead = [pipe for pipe in game.pipe_group if not pipe.inverted and pipe.rect.right > bird.left]
+    if ahead:
+        gap_bottom = min(ahead, key=lambda pipe: pipe.rect.x).rect.top
+        target = gap_bottom - game.PIPE_GAP * 0.35
+    else:
+        target = game.height / 2
+    # Aim is a little off each frame, like a human's, so a tighter gap or
+    # heavier bird actually shows up in the results
+    target += rng.gauss(0, game.PIPE_GAP * 0.2)
+    if game.bird.speed > 0 and bird.bottom > target:
+        return (pygame.K_SPACE,)
+    return ()
+
+
+def pong(game, rng):
+    # Keep the paddle centred on the ball, with a little dead zone
+    ball_y = game.ball_pos[1] + game.ball_size / 2
+    paddle = game.player_paddle.centery
+    if ball_y < paddle - 10:
+        return (pygame.K_UP,)
+    if ball_y > paddle + 10:
+        return (pygame.K_DOWN,)
+    return ()
+
+
+def brickbaker(game, rng):
+    # Follow the ball, but only while it is coming down
+    paddle = game.paddle_x + game.paddle_width / 2
+    target = game.ball_x if game.ball_dy > 0 else game.width / 2
+    if target < paddle - game.paddle_width / 4:
+        return (pygame.K_LEFT,)
+    if target > paddle + game.paddle_width / 4:
+        return (pygame.K_RIGHT,)
+    return ()
+
+
+SNAKE_KEYS = {
+    (1, 0): pygame.K_RIGHT,
+    (-1, 0): pygame.K_LEFT,
+    (0, 1): pygame.K_DOWN,
+    (0, -1): pygame.K_UP,
+}
+
+
+def snake(game, rng):
+    # Greedy: the safe move that gets closest to the food
+    if game.game_over:
+        return ()
+    cell = game.cell_size
+    head_x, head_y = game.snake[0]
+    current = (game.direction[0] // cell, game.direction[1] // cell)
+    body = set(game.snake[:-1])
+    best = None
+    for move in SNAKE_KEYS:
+        if move == (-current[0], -current[1]):
+            continue
+        x, y = head_x + move[0] * cell, head_y + move[1] * cell
+        if not (0 <= x < game.width and 0 <= y < game.height) or (x, y) in body:
+            continue
+        distance = abs(x - game.food[0]) + abs(y - game.food[1])
+        if best is None or distance < best[0]:
+            best = (distance, move)
+    if best is None or best[1] == current:
+        return ()
+    return (SNAKE_KEYS[best[1]],)
+
+
+BOTS = {
+    'idle': idle,
+    'random': random_keys,
+    'flappy': flappy,
+    'pong': pong,
+    'brickbaker': brickbaker,
+    'snake': snake,
+}
+
+# Bot used for a game when none is named
+DEFAULT_BOTS = {
+    'flappybird': 'flappy',
+    'pong': 'pong',
+    'brickbaker': 'brickbaker',
+    'snake': 'snake',
+}
+
+
+def get_bot(name):
+    """Return the policy registered under ``name``, or None."""
+    return BOTS.get(name)
@@ -1,8 +1,19 @@
+import struct
 import pygame
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Counter
 import math  # Added for angle calculations
 
+# ball x/y/dx/dy, ball speed, speed multiplier, speed timer, paddle x,
+# lives, score, game over; followed by a bitmap of the remaining bricks
+BRICKBAKER_STATE = struct.Struct('<8dBH?')
+
+
 class BrickbakerGame(GameBase):
+    game_key = 'brickbaker'
+    rewindable = True
+
     def __init__(self):
         super().__init__(title="Brickbaker")
         
@@ -14,15 +25,8 @@ class BrickbakerGame(GameBase):
         # Ball properties - scaled with screen size
         self.ball_radius = min(self.width, self.height) // 80
         self.initial_ball_speed = min(self.width, self.height) // 160
-        self.ball_speed = self.initial_ball_speed
-        self.ball_dx = self.ball_speed
-        self.ball_dy = -self.ball_speed
-        self.ball_x = self.width // 2
-        self.ball_y = self.height // 2
         
         # Speed increase properties
-        self.start_time = pygame.time.get_ticks()
-        self.speed_multiplier = 1.0
         self.speed_increase_rate = 0.25  # 10% increase every 30 seconds
         self.speed_check_interval = 10000  # 30 seconds in milliseconds
         
@@ -37,22 +41,42 @@ class BrickbakerGame(GameBase):
         # Paddle properties - scaled with screen size
         self.paddle_width = self.width // 8
         self.paddle_height = self.height // 30
-        self.paddle_x = self.width // 2 - self.paddle_width // 2
         self.paddle_y = int(self.height * 0.85)
         self.paddle_vel = self.width // 120  # Smoother movement speed
         
+        # Lives, speed multiplier and score, each re-rendered only on change
+        hud_size = self.height // 20
+        self.lives_counter = Counter("Lives: {}", size=hud_size, pos=(20, 20))
+        self.speed_counter = Counter("Speed: x{:.1f}", 1.0, size=hud_size, pos=(20, 50))
+        self.score_counter = Counter("Score: {}", size=hud_size, pos=(20, 80))
+        
+        self.bloc_rect = []
+        self.reset_game()
+
+    def reset_game(self):
+        # Ball starts in the middle heading up and to the right
+        self.ball_speed = self.initial_ball_speed
+        self.ball_dx = self.ball_speed
+        self.ball_dy = -self.ball_speed
+        self.ball_x = self.width // 2
+        self.ball_y = self.height // 2
+        self.speed_timer = 0  # Simulated ms since the last speed-up
+        self.speed_multiplier = 1.0
+        self.paddle_x = self.width // 2 - self.paddle_width // 2
+        
         # Game state
         self.lives = 3
-        self.bloc_rect = []
+        self.score = 0
         self.game_over = False
-        self.last_time = pygame.time.get_ticks()
-        self.dt = 0  # Delta time for smooth movement
         
         # Initialize bricks
         self.build_level()
+        self.remember_positions()
+        self.start_round()
 
     def build_level(self):
-        self.bloc_rect.clear()
+        # The full layout is kept so snapshots can store bricks as a bitmap
+        self.level_bricks = []
         start_x = (self.width - (self.columns * (self.brick_width + self.gap))) // 2
         
         for i in range(self.rows):
@@ -60,48 +84,71 @@ class BrickbakerGame(GameBase):
                 x = start_x + j * (self.brick_width + self.gap)
                 y = self.gap + i * (self.brick_height + self.gap)
                 bloc = pygame.Rect(x, y, self.brick_width, self.brick_height)
-                self.bloc_rect.append(bloc)
+                self.level_bricks.append(bloc)
+        self.bloc_rect[:] = self.level_bricks
+
+    def snapshot(self):
+        alive = set(map(id, self.bloc_rect))
+        bitmap = sum(1 << i for i, bloc in enumerate(self.level_bricks) if id(bloc) in alive)
+        state = BRICKBAKER_STATE.pack(self.ball_x, self.ball_y, self.ball_dx, self.ball_dy,
+                                      self.ball_speed, self.speed_multiplier, self.speed_timer,
+                                      self.paddle_x, self.lives, self.score, self.game_over)
+        return state + bitmap.to_bytes((len(self.level_bricks) + 7) // 8, 'little')
+
+    def restore(self, data):
+        (self.ball_x, self.ball_y, self.ball_dx, self.ball_dy, self.ball_speed,
+         self.speed_multiplier, self.speed_timer, self.paddle_x, self.lives, self.score,
+         self.game_over) = BRICKBAKER_STATE.unpack_from(data)
+        bitmap = int.from_bytes(data[BRICKBAKER_STATE.size:], 'little')
+        self.bloc_rect[:] = [bloc for i, bloc in enumerate(self.level_bricks) if bitmap >> i & 1]
+        self.remember_positions()
 
     def handle_events(self):
-        if super().handle_events():
+        events = self.poll_events()
+        if super().handle_events(events):
             return True
-            
-        # Calculate delta time for smooth movement
-        current_time = pygame.time.get_ticks()
-        self.dt = (current_time - self.last_time) / 1000.0  # Convert to seconds
-        self.last_time = current_time
-            
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.paddle_x >= 0:
-            self.paddle_x -= self.paddle_vel * self.dt * 60  # Scale by 60 to maintain consistent speed
-        elif keys[pygame.K_RIGHT] and self.paddle_x <= self.width - self.paddle_width:
-            self.paddle_x += self.paddle_vel * self.dt * 60
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r and self.game_over:
-                    self.__init__()
+                    self.reset_game()
         
         return False
 
+    def remember_positions(self):
+        # Positions at the start of a step, which draw() interpolates from
+        self.prev_ball = (self.ball_x, self.ball_y)
+        self.prev_paddle_x = self.paddle_x
+
     def update(self):
+        self.remember_positions()
         if self.paused or self.game_over:
             return
 
+        # Velocities are in pixels per 1/60 s; every step is the same length,
+        # so a slow frame can no longer move the ball through a brick
+        scale = self.step_ms * 60 / 1000
+
+        keys = self.input.get_pressed()
+        if keys[pygame.K_LEFT] and self.paddle_x >= 0:
+            self.paddle_x -= self.paddle_vel * scale
+        elif keys[pygame.K_RIGHT] and self.paddle_x <= self.width - self.paddle_width:
+            self.paddle_x += self.paddle_vel * scale
+
         # Increase ball speed over time
-        elapsed_time = pygame.time.get_ticks() - self.start_time
-        if elapsed_time >= self.speed_check_interval:
+        self.speed_timer += self.step_ms
+        if self.speed_timer >= self.speed_check_interval:
             self.speed_multiplier += self.speed_increase_rate
             self.ball_speed = self.initial_ball_speed * self.speed_multiplier
             # Preserve direction while updating speed
             angle = math.atan2(self.ball_dy, self.ball_dx)
             self.ball_dx = self.ball_speed * math.cos(angle)
             self.ball_dy = self.ball_speed * math.sin(angle)
-            self.start_time = pygame.time.get_ticks()
+            self.speed_timer = 0
 
-        # Update ball position with delta time
-        self.ball_x += self.ball_dx * self.dt * 60
-        self.ball_y += self.ball_dy * self.dt * 60
+        # Update ball position
+        self.ball_x += self.ball_dx * scale
+        self.ball_y += self.ball_dy * scale
 
         # Ball collision with walls
         if self.ball_x - self.ball_radius <= 0 or self.ball_x + self.ball_radius >= self.width:
@@ -130,6 +177,7 @@ class BrickbakerGame(GameBase):
                 self.reset_ball()
             else:
                 self.game_over = True
+                self.submit_score(self.score)
 
         # Check brick collisions
         ball_rect = pygame.Rect(self.ball_x - self.ball_radius, self.ball_y - self.ball_radius, 
@@ -137,6 +185,7 @@ class BrickbakerGame(GameBase):
         for bloc in self.bloc_rect[:]:
             if ball_rect.colliderect(bloc):
                 self.bloc_rect.remove(bloc)
+                self.score += 1
                 # Determine bounce direction based on collision side
                 if abs(ball_rect.bottom - bloc.top) < 10 or abs(ball_rect.top - bloc.bottom) < 10:
                     self.ball_dy = -self.ball_dy
@@ -151,8 +200,9 @@ class BrickbakerGame(GameBase):
         self.ball_dx = self.ball_speed * math.cos(angle)
         self.ball_dy = -self.ball_speed * math.sin(angle)  # Negative to go up
         self.paddle_x = self.width // 2 - self.paddle_width // 2
+        self.remember_positions()
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         self.screen.fill(self.BLACK)
 
         # Draw bricks
@@ -160,20 +210,26 @@ class BrickbakerGame(GameBase):
             pygame.draw.rect(self.screen, self.green, bloc)
 
         # Draw ball
-        pygame.draw.circle(self.screen, self.WHITE, (int(self.ball_x), int(self.ball_y)), self.ball_radius)
+        ball_x = self.interpolate(self.prev_ball[0], self.ball_x, alpha)
+        ball_y = self.interpolate(self.prev_ball[1], self.ball_y, alpha)
+        pygame.draw.circle(self.screen, self.WHITE, (int(ball_x), int(ball_y)), self.ball_radius)
         
         # Draw paddle
-        pygame.draw.rect(self.screen, self.yellow, (self.paddle_x, self.paddle_y, self.paddle_width, self.paddle_height))
+        paddle_x = self.interpolate(self.prev_paddle_x, self.paddle_x, alpha)
+        pygame.draw.rect(self.screen, self.yellow, (paddle_x, self.paddle_y, self.paddle_width, self.paddle_height))
 
         # Draw lives and speed multiplier
-        font = pygame.font.Font(None, self.height // 20)
-        lives_text = font.render(f"Lives: {self.lives}", True, (255, 255, 255))
-        speed_text = font.render(f"Speed: x{self.speed_multiplier:.1f}", True, (255, 255, 255))
-        self.screen.blit(lives_text, (20, 20))
-        self.screen.blit(speed_text, (20, 50))
+        hud_size = self.height // 20
+        for counter, value in ((self.lives_counter, self.lives),
+                               (self.speed_counter, self.speed_multiplier),
+                               (self.score_counter, self.score)):
+            counter.size = hud_size
+            counter.set(value)
+        self.lives_counter.draw(self.screen)
+        self.speed_counter.draw(self.screen)
+        self.score_counter.draw(self.screen)
 
         if self.game_over:
-            font = pygame.font.Font(None, self.height // 10)
-            text = font.render("Game Over! Press R to Restart", True, self.WHITE)
+            text = render_text("Game Over! Press R to Restart", self.height // 10, self.WHITE)
             text_rect = text.get_rect(center=(self.width/2, self.height/2))
             self.screen.blit(text, text_rect)
\ No newline at end of file
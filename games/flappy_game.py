@@ -1,10 +1,39 @@
+import struct
 import pygame
-import random
-import time
 from pygame.locals import *
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Counter
+from utils import assets
+
+# bird y, speed, flap frame; begin, game over, score, pipe timer, both
+# ground x positions and the pipe count, followed by one PIPE_STATE per pipe
+FLAPPY_STATE = struct.Struct('<idB??dd2hB')
+PIPE_STATE = struct.Struct('<hh??')
 
 class FlappyGame(GameBase):
+    game_key = 'flappybird'
+    rewindable = True
+    IMAGES = [
+        'assets/sprites/background-day.png',
+        'assets/sprites/message.png',
+        'assets/sprites/gameover.png',
+        'assets/sprites/pipe-green.png',
+        'assets/sprites/base.png',
+    ] + [f'assets/sprites/bluebird-{flap}flap.png' for flap in ('up', 'mid', 'down')]
+    SOUNDS = ['assets/audio/wing.wav', 'assets/audio/hit.wav']
+    # Rotating the bird image every step is the costliest per-step work; the
+    # cheap tier draws the upright frames. Collisions use the rotated mask in
+    # both, so the tier never changes how a run plays out
+    QUALITY_TIERS = (
+        ('full', {'rotate_bird': True}),
+        ('upright bird', {'rotate_bird': False}),
+    )
+
+    @classmethod
+    def preload_assets(cls):
+        assets.preload(cls.IMAGES, cls.SOUNDS)
+
     def __init__(self):
         super().__init__(title="Flappy Bird")
         
@@ -17,11 +46,12 @@ class FlappyGame(GameBase):
         self.PIPE_HEIGHT = self.height
         self.PIPE_GAP = self.height // 3.5  # Reduced gap size for more challenge
         self.pipe_interval = 1800  # Slightly reduced time between pipes
+        self.rotate_bird = True
         
         # Load audio
         pygame.mixer.init()
-        self.wing_sound = pygame.mixer.Sound('assets/audio/wing.wav')
-        self.hit_sound = pygame.mixer.Sound('assets/audio/hit.wav')
+        self.wing_sound = assets.load_sound('assets/audio/wing.wav')
+        self.hit_sound = assets.load_sound('assets/audio/hit.wav')
         
         # Initialize sprite groups
         self.bird_group = pygame.sprite.Group()
@@ -29,27 +59,38 @@ class FlappyGame(GameBase):
         self.ground_group = pygame.sprite.Group()
         
         # Load background and scale to window size
-        self.BACKGROUND = pygame.image.load('assets/sprites/background-day.png')
-        self.BACKGROUND = pygame.transform.scale(self.BACKGROUND, (self.width, self.height))
+        self.BACKGROUND = assets.load_image('assets/sprites/background-day.png',
+                                            size=(self.width, self.height))
         
-        self.BEGIN_IMAGE = pygame.image.load('assets/sprites/message.png').convert_alpha()
-        self.BEGIN_IMAGE = pygame.transform.scale(self.BEGIN_IMAGE, (self.width//2, self.height//2))
+        self.BEGIN_IMAGE = assets.load_image('assets/sprites/message.png', alpha=True,
+                                             size=(self.width//2, self.height//2))
         
-        self.GAME_OVER_IMAGE = pygame.image.load('assets/sprites/gameover.png').convert_alpha()
-        self.GAME_OVER_IMAGE = pygame.transform.scale(self.GAME_OVER_IMAGE, (self.width//2, self.height//4))
+        self.GAME_OVER_IMAGE = assets.load_image('assets/sprites/gameover.png', alpha=True,
+                                                 size=(self.width//2, self.height//4))
         
+        self.font_size = 64
+        self.score_counter = Counter(size=self.font_size, pos=(self.width//2, 50), anchor='center')
+        
+        # Initialize game objects
+        self.reset_game()
+    
+    def reset_game(self):
         # Game state
         self.begin = True
         self.game_over = False
         self.score = 0
-        self.font = pygame.font.Font(None, 64)
-        
-        # Initialize game objects
+        self.bird_group.empty()
+        self.pipe_group.empty()
+        self.ground_group.empty()
         self.init_game()
+        self.start_round()
     
     def init_game(self):
         # Create bird
         self.bird = Bird(self.width, self.height)
+        # The tuning constants drive the sprites so they can be swept
+        self.bird.gravity = self.GRAVITY
+        self.bird.jump_speed = -self.SPEED
         self.bird_group.add(self.bird)
         
         # Create ground
@@ -58,7 +99,6 @@ class FlappyGame(GameBase):
             self.ground_group.add(ground)
         
         # Create initial pipes
-        self.next_pipe_time = 0
         self.create_pipe_pair()
     
     def create_pipe_pair(self):
@@ -74,11 +114,14 @@ class FlappyGame(GameBase):
         
         # More varied position for the gap
         variance = self.height // 8  # Add some extra randomness to positions
-        adjusted_min = max(min_top_height, min_top_height + random.randint(-variance, variance))
-        adjusted_max = min(max_top_height, max_top_height + random.randint(-variance, variance))
+        adjusted_min = max(min_top_height, min_top_height + self.rng.randint(-variance, variance))
+        adjusted_max = min(max_top_height, max_top_height + self.rng.randint(-variance, variance))
+        # A wide gap leaves little room, so the variance can push the top
+        # below the bottom; truncation keeps a fractional gap valid too
+        adjusted_max = max(adjusted_min, int(adjusted_max))
         
         # Pick a random bottom for the top pipe
-        top_pipe_bottom = random.randint(adjusted_min, adjusted_max)
+        top_pipe_bottom = self.rng.randint(adjusted_min, adjusted_max)
         # The bottom pipe starts at (top pipe bottom + gap)
         bottom_pipe_top = top_pipe_bottom + gap
         
@@ -103,15 +146,55 @@ class FlappyGame(GameBase):
             full_height=self.PIPE_HEIGHT
         )
         
+        top_pipe.movement_speed = bottom_pipe.movement_speed = self.GAME_SPEED
+        
         # Add both to the pipe group
         self.pipe_group.add(top_pipe)
         self.pipe_group.add(bottom_pipe)
         
-        # Record the time for spacing out future pipes
-        self.next_pipe_time = pygame.time.get_ticks()
+        # Restart the countdown to the next pair
+        self.pipe_timer = 0
     
+    def final_score(self):
+        # Each gap is counted by both of its pipes
+        return int(self.score)
+
+    def snapshot(self):
+        bird = self.bird
+        grounds = self.ground_group.sprites()
+        pipes = self.pipe_group.sprites()
+        data = [FLAPPY_STATE.pack(bird.rect.y, bird.speed, bird.current_image, self.begin,
+                                  self.game_over, self.score, self.pipe_timer,
+                                  grounds[0].rect.x, grounds[1].rect.x, len(pipes))]
+        for pipe in pipes:
+            data.append(PIPE_STATE.pack(pipe.rect.x, pipe.rect.y, pipe.inverted, pipe.scored))
+        return b''.join(data)
+
+    def restore(self, data):
+        (self.bird.rect.y, self.bird.speed, self.bird.current_image, self.begin,
+         self.game_over, self.score, self.pipe_timer, ground_a, ground_b,
+         count) = FLAPPY_STATE.unpack_from(data)
+        grounds = self.ground_group.sprites()
+        grounds[0].rect.x, grounds[1].rect.x = ground_a, ground_b
+        self.bird.pose(self.rotate_bird)
+
+        # Reuse the existing pipe sprites where possible; flipping and masking
+        # a fresh one costs more than moving an old one into place
+        old = self.pipe_group.sprites()
+        self.pipe_group.empty()
+        for i in range(count):
+            x, y, inverted, scored = PIPE_STATE.unpack_from(data, FLAPPY_STATE.size + i * PIPE_STATE.size)
+            if i < len(old) and old[i].inverted == inverted:
+                pipe = old[i]
+            else:
+                pipe = Pipe(inverted, x, 0, self.PIPE_WIDTH, self.PIPE_HEIGHT)
+                pipe.movement_speed = self.GAME_SPEED
+            pipe.rect.topleft = (x, y)
+            pipe.scored = scored
+            self.pipe_group.add(pipe)
+
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == QUIT:
                 self.running = False
                 return True
@@ -125,7 +208,7 @@ class FlappyGame(GameBase):
                     if self.begin:
                         self.begin = False
                     elif self.game_over:
-                        self.__init__()  # Reset the game by re-initializing
+                        self.reset_game()
                     else:
                         self.bird.bump()
                         pygame.mixer.Sound.play(self.wing_sound)
@@ -134,18 +217,17 @@ class FlappyGame(GameBase):
     def update(self):
         if self.paused:
             return
-
-        current_time = pygame.time.get_ticks()
         
         if self.begin:
             # Bird flaps in place, ground moves
             self.bird.begin()
             self.ground_group.update()
         elif not self.game_over:
-            # Create new pipes periodically
-            if current_time - self.next_pipe_time >= self.pipe_interval:
+            # Create new pipes periodically, counted in simulated time so
+            # spacing does not depend on the frame rate
+            self.pipe_timer += self.step_ms
+            if self.pipe_timer >= self.pipe_interval:
                 self.create_pipe_pair()
-                self.next_pipe_time = current_time
 
             # Remove off-screen pipes
             for pipe in self.pipe_group.sprites():
@@ -159,7 +241,7 @@ class FlappyGame(GameBase):
                     pipe.scored = True
 
             # Update sprites
-            self.bird_group.update()
+            self.bird_group.update(self.rotate_bird)
             self.ground_group.update()
             self.pipe_group.update()
 
@@ -168,8 +250,9 @@ class FlappyGame(GameBase):
                     pygame.sprite.groupcollide(self.bird_group, self.pipe_group, False, False, pygame.sprite.collide_mask)):
                 pygame.mixer.Sound.play(self.hit_sound)
                 self.game_over = True
+                self.submit_score(self.final_score())
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         # Draw background
         self.screen.blit(self.BACKGROUND, (0, 0))
         
@@ -184,27 +267,28 @@ class FlappyGame(GameBase):
         elif self.game_over:
             gameover_rect = self.GAME_OVER_IMAGE.get_rect(center=(self.width//2, self.height//3))
             self.screen.blit(self.GAME_OVER_IMAGE, gameover_rect)
-            restart_text = self.font.render("Press SPACE to restart", True, (255, 255, 255))
+            restart_text = render_text("Press SPACE to restart", self.font_size, (255, 255, 255))
             restart_rect = restart_text.get_rect(center=(self.width//2, self.height//2))
             self.screen.blit(restart_text, restart_rect)
         
         # Draw score
         if not self.begin:
-            score_text = self.font.render(str(int(self.score)), True, (255, 255, 255))
-            score_rect = score_text.get_rect(center=(self.width//2, 50))
-            self.screen.blit(score_text, score_rect)
-        
-        if self.paused:
-            self.draw_pause_menu()
-        
-        pygame.display.flip()
+            self.score_counter.set(int(self.score))
+            self.score_counter.move((self.width//2, 50))
+            self.score_counter.draw(self.screen)
+
 
 class Bird(pygame.sprite.Sprite):
+    # Collision masks of the rotated frames, keyed by (frame size, frame,
+    # angle); the bird only ever takes a few dozen distinct speeds
+    rotated_masks = {}
+    MAX_ROTATED_MASKS = 512
+
     def __init__(self, screen_width, screen_height):
         pygame.sprite.Sprite.__init__(self)
         
         # Load and scale bird images
-        self.images = [pygame.image.load(f'assets/sprites/bluebird-{flap}flap.png').convert_alpha()
+        self.images = [assets.load_image(f'assets/sprites/bluebird-{flap}flap.png', alpha=True)
                       for flap in ('up', 'mid', 'down')]
         scale_factor = screen_height // 24 / self.images[0].get_height()  # Make bird smaller
         self.images = [pygame.transform.scale(img, 
@@ -225,18 +309,15 @@ class Bird(pygame.sprite.Sprite):
         self.jump_speed = -8   # Reduced jump strength
         self.max_speed = 10    # Reduced max downward speed
     
-    def update(self):
+    def update(self, rotate=True):
         # Update bird animation
         self.current_image = (self.current_image + 1) % 3
-        self.image = self.images[self.current_image]
         
         # Apply gravity
         self.speed = min(self.speed + self.gravity, self.max_speed)
         self.rect.y += self.speed
         
-        # Rotate based on speed
-        self.image = pygame.transform.rotate(self.images[self.current_image], -self.speed * 2)
-        self.mask = pygame.mask.from_surface(self.image)
+        self.pose(rotate)
     
     def bump(self):
         # Bird jumps upward
@@ -247,13 +328,30 @@ class Bird(pygame.sprite.Sprite):
         self.current_image = (self.current_image + 1) % 3
         self.image = self.images[self.current_image]
 
+    def pose(self, rotate=True):
+        # Tilt based on speed; without ``rotate`` only the drawn frame stays
+        # upright, the mask is always the tilted one
+        frame = self.images[self.current_image]
+        angle = -self.speed * 2
+        key = (frame.get_size(), self.current_image, angle)
+        mask = self.rotated_masks.get(key)
+        image = None
+        if rotate or mask is None:
+            image = pygame.transform.rotate(frame, angle)
+        if mask is None:
+            if len(self.rotated_masks) >= self.MAX_ROTATED_MASKS:
+                self.rotated_masks.clear()
+            mask = self.rotated_masks[key] = pygame.mask.from_surface(image)
+        self.mask = mask
+        self.image = image if rotate else frame
+
 class Pipe(pygame.sprite.Sprite):
     def __init__(self, inverted, xpos, y_pos, width, full_height):
         pygame.sprite.Sprite.__init__(self)
         
-        self.image = pygame.image.load('assets/sprites/pipe-green.png').convert_alpha()
-        # Scale the pipe to the full height
-        self.image = pygame.transform.scale(self.image, (width, full_height))
+        # Scaled pipe image is shared between all pipes of the same size
+        self.image = assets.load_image('assets/sprites/pipe-green.png', alpha=True,
+                                       size=(width, full_height))
         
         self.inverted = inverted
         self.scored = False
@@ -282,8 +380,8 @@ class Ground(pygame.sprite.Sprite):
     def __init__(self, xpos, screen_width, screen_height, ground_height):
         pygame.sprite.Sprite.__init__(self)
         
-        self.image = pygame.image.load('assets/sprites/base.png').convert_alpha()
-        self.image = pygame.transform.scale(self.image, (screen_width, ground_height))
+        self.image = assets.load_image('assets/sprites/base.png', alpha=True,
+                                       size=(screen_width, ground_height))
         self.mask = pygame.mask.from_surface(self.image)
         
         self.rect = self.image.get_rect()
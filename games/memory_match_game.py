@@ -1,10 +1,25 @@
 import pygame
-import random
 import time
 import os
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Counter
+from utils import assets
 
 class MemoryMatchGame(GameBase):
+    game_key = 'memorymatch'
+    SOUNDS = [os.path.join('assets', 'sounds', 'memory_match', name)
+              for name in ('flip.mp3', 'match.mp3', 'failed.mp3')]
+    # Antialiased text is blended per pixel; aliased text is a plain blit
+    QUALITY_TIERS = (
+        ('full', {'text_antialias': True}),
+        ('aliased text', {'text_antialias': False}),
+    )
+
+    @classmethod
+    def preload_assets(cls):
+        assets.preload(sounds=cls.SOUNDS)
+
     def __init__(self):
         super().__init__(title="Memory Match")
         
@@ -12,6 +27,8 @@ class MemoryMatchGame(GameBase):
         self.CARD_BACK = (50, 50, 150)
         self.CARD_FRONT = (200, 200, 200)
         self.MATCHED_COLOR = (100, 255, 100)
+        self.text_antialias = True
+        self.moves_counter = Counter("Moves: {}", size=36, color=self.WHITE, pos=(20, 20))
         
         # Game settings
         self.GRID_SIZE = 4  # 4x4 grid
@@ -31,23 +48,18 @@ class MemoryMatchGame(GameBase):
         # Load sounds
         pygame.mixer.init()
         try:
-            self.flip_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'memory_match', 'flip.mp3'))
-            self.match_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'memory_match', 'match.mp3'))
-            self.fail_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'memory_match', 'failed.mp3'))
+            self.flip_sound, self.match_sound, self.fail_sound = [
+                assets.load_sound(path) for path in self.SOUNDS]
             # Set volume
             for sound in [self.flip_sound, self.match_sound, self.fail_sound]:
                 sound.set_volume(0.3)
         except Exception as e:
             print(f"Could not load Memory Match sound files: {e}")
-        
-        # Add selected card tracking for keyboard navigation
-        self.selected_row = 0
-        self.selected_col = 0
     
     def reset_game(self):
         # Create card values (pairs of numbers)
         values = list(range(1, (self.GRID_SIZE * self.GRID_SIZE) // 2 + 1)) * 2
-        random.shuffle(values)
+        self.rng.shuffle(values)
         
         # Initialize cards
         self.cards = []
@@ -68,19 +80,21 @@ class MemoryMatchGame(GameBase):
         
         self.moves = 0
         self.game_over = False
+        self.selected_row = 0
+        self.selected_col = 0
         self.last_flip_time = 0
         self.flip_delay = 1000  # 1 second delay when cards don't match
+        self.start_round()
     
     def handle_events(self):
         # Get all events before any processing
-        events = pygame.event.get()
+        events = self.poll_events()
         
         # Handle game events first
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not self.paused:
                 # Left click
-                mouse_pos = pygame.mouse.get_pos()
-                self.handle_click(mouse_pos)
+                self.handle_click(event.pos)
                 continue
                 
             elif event.type == pygame.KEYDOWN and not self.paused:
@@ -102,8 +116,7 @@ class MemoryMatchGame(GameBase):
                     self.selected_row = (self.selected_row + 1) % self.GRID_SIZE
                     continue
                 elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    current_time = pygame.time.get_ticks()
-                    if current_time - self.last_flip_time >= self.flip_delay:
+                    if self.game_time - self.last_flip_time >= self.flip_delay:
                         # Select card with keyboard
                         card_index = self.selected_row * self.GRID_SIZE + self.selected_col
                         self.handle_card_selection(card_index)
@@ -162,11 +175,16 @@ class MemoryMatchGame(GameBase):
                     # Check for game over
                     if len(self.matched) == len(self.cards):
                         self.game_over = True
+                        # Fewer moves is better; the leaderboard sorts ascending
+                        self.submit_score(self.final_score())
                 else:
                     # No match
-                    self.last_flip_time = pygame.time.get_ticks()
+                    self.last_flip_time = self.game_time
                     self.fail_sound.play()
     
+    def final_score(self):
+        return self.moves
+
     def handle_click(self, pos):
         """Handle mouse click at position"""
         for card in self.cards:
@@ -179,11 +197,10 @@ class MemoryMatchGame(GameBase):
             return
             
         # Check if we should flip cards back
-        current_time = pygame.time.get_ticks()
-        if len(self.flipped) == 2 and current_time - self.last_flip_time >= self.flip_delay:
+        if len(self.flipped) == 2 and self.game_time - self.last_flip_time >= self.flip_delay:
             self.flipped = []
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         self.screen.fill(self.BLACK)
         
         # Draw cards
@@ -205,34 +222,28 @@ class MemoryMatchGame(GameBase):
             
             # Draw card value if it's flipped or matched
             if card['index'] in self.flipped or card['index'] in self.matched:
-                font = pygame.font.Font(None, self.CARD_WIDTH // 2)
-                text = font.render(str(card['value']), True, self.BLACK)
+                text = render_text(str(card['value']), self.CARD_WIDTH // 2, self.BLACK, self.text_antialias)
                 text_rect = text.get_rect(center=card['rect'].center)
                 self.screen.blit(text, text_rect)
         
         # Draw moves counter
-        moves_text = pygame.font.Font(None, 36).render(f"Moves: {self.moves}", True, self.WHITE)
-        self.screen.blit(moves_text, (20, 20))
+        self.moves_counter.antialias = self.text_antialias
+        self.moves_counter.set(self.moves)
+        self.moves_counter.draw(self.screen)
         
         # Draw instructions
         if not self.game_over:
             instructions = "Arrow Keys/WASD to move  |  Enter/Space to select"
-            inst_text = pygame.font.Font(None, 28).render(instructions, True, self.GRAY)
+            inst_text = render_text(instructions, 28, self.GRAY, self.text_antialias)
             inst_rect = inst_text.get_rect(center=(self.width//2, self.height - 30))
             self.screen.blit(inst_text, inst_rect)
         
         # Draw game over message
         if self.game_over:
-            font = pygame.font.Font(None, 64)
-            text = font.render(f"You Won in {self.moves} moves!", True, self.WHITE)
+            text = render_text(f"You Won in {self.moves} moves!", 64, self.WHITE, self.text_antialias)
             text_rect = text.get_rect(center=(self.width//2, 50))
             self.screen.blit(text, text_rect)
             
-            restart_text = pygame.font.Font(None, 36).render("Press R to Play Again", True, self.GRAY)
+            restart_text = render_text("Press R to Play Again", 36, self.GRAY, self.text_antialias)
             restart_rect = restart_text.get_rect(center=(self.width//2, self.height - 50))
             self.screen.blit(restart_text, restart_rect)
-        
-        if self.paused:
-            self.draw_pause_menu()
-        
-        pygame.display.flip()
\ No newline at end of file
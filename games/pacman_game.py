@@ -3,12 +3,19 @@ import sys
 import os
 import subprocess
 from utils.game_base import GameBase
+from utils.display import window
+from utils.text_cache import render_text
 
 class PacmanGame(GameBase):
+    # Runs as a separate process; there is nothing worth keeping warm
+    poolable = False
+
     def __init__(self):
         super().__init__(title="Pacman")
     
     def setup_display(self):
+        super().setup_display()
+
         # Set icon for the Pacman game window
         try:
             icon_path = os.path.join('assets', 'images', 'pacman.png')
@@ -19,12 +26,9 @@ class PacmanGame(GameBase):
             print(f"Could not load Pacman icon: {e}")
         
         # Set proper caption
-        pygame.display.set_caption("Pacman")
+        window.set_caption("Pacman")
     
     def run(self):
-        # Close the current pygame window to avoid conflicts
-        pygame.display.quit()
-        
         # Get path to the run.py in the Pacman_main directory
         run_script_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Pacman_main', 'run.py')
         
@@ -33,11 +37,17 @@ class PacmanGame(GameBase):
             print(f"Launching Pacman from: {run_script_path}")
             process = subprocess.Popen([sys.executable, run_script_path], 
                                       cwd=os.path.dirname(run_script_path))
-            # Wait for the process to complete
-            process.wait()
+            self.draw()
+            self.present()
+            # Keep the shared window alive (and responsive) instead of closing
+            # it; input meant for the launcher is dropped while Pacman runs
+            while process.poll() is None:
+                pygame.event.get()
+                self.clock.tick(10)
         except Exception as e:
             print(f"Error launching Pacman game: {e}")
-        finally:
-            # Reinitialize pygame display for the launcher
-            pygame.display.init()
-            self.setup_display()
\ No newline at end of file
+
+    def draw(self, alpha=1.0):
+        self.screen.fill(self.BLACK)
+        notice = render_text("Playing Pacman...", 36, self.WHITE)
+        self.screen.blit(notice, notice.get_rect(center=(self.width // 2, self.height // 2)))
@@ -1,9 +1,20 @@
+import struct
 import pygame
-import random
 import math  # Add math module import
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Counter
+
+# ball x/y, ball velocity x/y, paddle ys, scores, game over
+PONG_STATE = struct.Struct('<4d2h2B?')
+
 
 class PongGame(GameBase):
+    game_key = 'pong'
+    pause_menu = False
+    rewindable = True
+    dirty_rects = True
+
     def __init__(self):
         super().__init__(title="Pong")
         
@@ -22,10 +33,12 @@ class PongGame(GameBase):
         
         self.reset_game()
         
-        # Initialize game font
-        self.game_font = pygame.font.Font(None, 36)
-        self.clock = pygame.time.Clock()
-        self.FPS = 60
+        # Game font size
+        self.game_font_size = 36
+        self.player_counter = Counter(size=self.game_font_size, color=self.SCORE_COLOR,
+                                      pos=(self.width//4, 20))
+        self.ai_counter = Counter(size=self.game_font_size, color=self.SCORE_COLOR,
+                                  pos=(3*self.width//4, 20))
         
     def reset_game(self):
         # Paddles initial position
@@ -44,16 +57,39 @@ class PongGame(GameBase):
         self.ai_score = 0
         self.game_over = False
         self.paused = False
+        self.remember_positions()
+        self.invalidate()
+        self.start_round()
         
     def serve_ball(self):
         self.ball_pos = [self.width//2, self.height//2]
         # Random angle between -45 and 45 degrees
-        angle = random.uniform(-0.785, 0.785)  # in radians
-        direction = 1 if random.random() > 0.5 else -1
+        angle = self.rng.uniform(-0.785, 0.785)  # in radians
+        direction = 1 if self.rng.random() > 0.5 else -1
         self.ball_vel = [
             direction * self.ball_speed * math.cos(angle),  # Use math.cos instead of pygame.math.cos
             self.ball_speed * math.sin(angle)  # Use math.sin instead of pygame.math.sin
         ]
+        # A serve is a jump, not motion to interpolate
+        self.prev_ball_pos = list(self.ball_pos)
+
+    def snapshot(self):
+        return PONG_STATE.pack(self.ball_pos[0], self.ball_pos[1], self.ball_vel[0], self.ball_vel[1],
+                               self.player_paddle.y, self.ai_paddle.y,
+                               self.player_score, self.ai_score, self.game_over)
+
+    def restore(self, data):
+        (ball_x, ball_y, vel_x, vel_y, self.player_paddle.y, self.ai_paddle.y,
+         self.player_score, self.ai_score, self.game_over) = PONG_STATE.unpack(data)
+        self.ball_pos = [ball_x, ball_y]
+        self.ball_vel = [vel_x, vel_y]
+        self.remember_positions()
+
+    def remember_positions(self):
+        # Positions at the start of a step, which draw() interpolates from
+        self.prev_ball_pos = list(self.ball_pos)
+        self.prev_player_y = self.player_paddle.y
+        self.prev_ai_y = self.ai_paddle.y
     
     def update_ai(self):
         # Simple AI that follows the ball
@@ -68,7 +104,7 @@ class PongGame(GameBase):
             self.ai_paddle.clamp_ip(self.screen.get_rect())
     
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return True
             
@@ -78,21 +114,22 @@ class PongGame(GameBase):
                 elif event.key == pygame.K_r and self.game_over:
                     self.reset_game()
         
-        if not self.game_over and not self.paused:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
-                self.player_paddle.y -= self.paddle_speed
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                self.player_paddle.y += self.paddle_speed
-            
-            # Keep paddle on screen
-            self.player_paddle.clamp_ip(self.screen.get_rect())
-        
         return False
     
     def update(self):
+        self.remember_positions()
         if self.game_over or self.paused:
             return
+
+        # Move the player's paddle once per step, not once per frame
+        keys = self.input.get_pressed()
+        if keys[pygame.K_w] or keys[pygame.K_UP]:
+            self.player_paddle.y -= self.paddle_speed
+        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+            self.player_paddle.y += self.paddle_speed
+        
+        # Keep paddle on screen
+        self.player_paddle.clamp_ip(self.screen.get_rect())
             
         # Update AI
         self.update_ai()
@@ -113,19 +150,20 @@ class PongGame(GameBase):
             self.ball_pos[0] = self.player_paddle.right
             self.ball_vel[0] = abs(self.ball_vel[0]) * 1.1  # Increase speed slightly
             # Add some randomness to y velocity
-            self.ball_vel[1] += random.uniform(-1, 1)
+            self.ball_vel[1] += self.rng.uniform(-1, 1)
             
         elif ball_rect.colliderect(self.ai_paddle):
             self.ball_pos[0] = self.ai_paddle.left - self.ball_size
             self.ball_vel[0] = -abs(self.ball_vel[0]) * 1.1  # Increase speed slightly
             # Add some randomness to y velocity
-            self.ball_vel[1] += random.uniform(-1, 1)
+            self.ball_vel[1] += self.rng.uniform(-1, 1)
         
         # Scoring
         if self.ball_pos[0] < 0:
             self.ai_score += 1
             if self.ai_score >= 11:
                 self.game_over = True
+                self.submit_score(self.final_score())
             else:
                 self.serve_ball()
                 
@@ -133,48 +171,54 @@ class PongGame(GameBase):
             self.player_score += 1
             if self.player_score >= 11:
                 self.game_over = True
+                self.submit_score(self.final_score())
             else:
                 self.serve_ball()
     
-    def draw(self):
+    def final_score(self):
+        return self.player_score
+
+    def moving_rects(self, alpha):
+        # Paddles and ball where they are between the last two steps
+        player_paddle = self.player_paddle.copy()
+        player_paddle.y = round(self.interpolate(self.prev_player_y, self.player_paddle.y, alpha))
+        ai_paddle = self.ai_paddle.copy()
+        ai_paddle.y = round(self.interpolate(self.prev_ai_y, self.ai_paddle.y, alpha))
+        ball_x = self.interpolate(self.prev_ball_pos[0], self.ball_pos[0], alpha)
+        ball_y = self.interpolate(self.prev_ball_pos[1], self.ball_pos[1], alpha)
+        ball = pygame.Rect(ball_x, ball_y, self.ball_size, self.ball_size)
+        return [player_paddle, ai_paddle, ball]
+
+    def scene_state(self):
+        return (self.player_score, self.ai_score, self.game_over, self.paused)
+
+    def draw(self, alpha=1.0):
         self.screen.fill(self.BLACK)
         
-        # Draw paddles
-        pygame.draw.rect(self.screen, self.PADDLE_COLOR, self.player_paddle)
-        pygame.draw.rect(self.screen, self.PADDLE_COLOR, self.ai_paddle)
-        
-        # Draw ball
-        pygame.draw.rect(self.screen, self.BALL_COLOR,
-                        (self.ball_pos[0], self.ball_pos[1],
-                         self.ball_size, self.ball_size))
+        # Draw paddles and ball
+        player_paddle, ai_paddle, ball = self.moving_rects(alpha)
+        pygame.draw.rect(self.screen, self.PADDLE_COLOR, player_paddle)
+        pygame.draw.rect(self.screen, self.PADDLE_COLOR, ai_paddle)
+        pygame.draw.rect(self.screen, self.BALL_COLOR, ball)
         
-        # Draw center line
-        pygame.draw.line(self.screen, self.PADDLE_COLOR,
-                        (self.width//2, 0), (self.width//2, self.height),
-                        2)
+        # Draw center line; filled as a rect because thick lines are drawn
+        # differently when clipped, which shows up in dirty-rect frames
+        self.screen.fill(self.PADDLE_COLOR, (self.width//2, 0, 2, self.height))
         
         # Draw scores
-        player_text = self.game_font.render(str(self.player_score), True, self.SCORE_COLOR)
-        ai_text = self.game_font.render(str(self.ai_score), True, self.SCORE_COLOR)
-        self.screen.blit(player_text, (self.width//4, 20))
-        self.screen.blit(ai_text, (3*self.width//4, 20))
+        self.player_counter.set(self.player_score)
+        self.ai_counter.set(self.ai_score)
+        self.player_counter.move((self.width//4, 20))
+        self.ai_counter.move((3*self.width//4, 20))
+        self.player_counter.draw(self.screen)
+        self.ai_counter.draw(self.screen)
         
         if self.game_over:
             winner = "Player Wins!" if self.player_score > self.ai_score else "Computer Wins!"
-            game_over_text = self.game_font.render(f'{winner} Press R to Restart', True, self.SCORE_COLOR)
+            game_over_text = render_text(f'{winner} Press R to Restart', self.game_font_size, self.SCORE_COLOR)
             game_over_rect = game_over_text.get_rect(center=(self.width//2, self.height//2))
             self.screen.blit(game_over_text, game_over_rect)
         elif self.paused:
-            pause_text = self.game_font.render('PAUSED', True, self.SCORE_COLOR)
+            pause_text = render_text('PAUSED', self.game_font_size, self.SCORE_COLOR)
             pause_rect = pause_text.get_rect(center=(self.width//2, self.height//2))
             self.screen.blit(pause_text, pause_rect)
-        
-        pygame.display.flip()
-    
-    def run(self):
-        while self.running:
-            if self.handle_events():
-                break
-            self.update()
-            self.draw()
-            self.clock.tick(self.FPS)
\ No newline at end of file
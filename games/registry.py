@@ -0,0 +1,94 @@
+import importlib
+import threading
+
+
+class GameSpec:
+    """Launcher metadata for one game; the module is imported on demand."""
+
+    def __init__(self, key, name, module, class_name, color, icon=None,
+                 category='Games', scored=True, lower_is_better=False, external=False):
+        self.key = key
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.color = color
+        self.icon = icon if icon is not None else f"{key}.png"
+        self.category = category
+        # Leaderboard metadata, readable without importing the game
+        self.scored = scored
+        self.lower_is_better = lower_is_better
+        # Runs in its own process rather than in the launcher's window
+        self.external = external
+
+    def load(self):
+        module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+    def create(self):
+        return self.load()()
+
+
+GAMES = [
+    GameSpec('snake', 'Snake', 'games.snake_game', 'SnakeGame', (52, 168, 83)),
+    GameSpec('pacman', 'Pacman', 'games.pacman_game', 'PacmanGame', (251, 188, 4),
+             scored=False, external=True),
+    GameSpec('pong', 'Pong', 'games.pong_game', 'PongGame', (66, 133, 244)),
+    GameSpec('tictactoe', 'Tic Tac Toe', 'games.tictactoe_game', 'TicTacToeGame', (149, 97, 226),
+             scored=False),
+    GameSpec('brickbaker', 'Brick Baker', 'games.brickbaker_game', 'BrickbakerGame', (234, 67, 53)),
+    GameSpec('flappybird', 'Flappy Bird', 'games.flappy_game', 'FlappyGame', (66, 133, 244)),
+    GameSpec('memorymatch', 'Memory Match', 'games.memory_match_game', 'MemoryMatchGame', (149, 97, 226),
+             lower_is_better=True),
+]
+
+_by_key = {spec.key: spec for spec in GAMES}
+
+
+def get_game(key):
+    return _by_key.get(key)
+
+
+def by_category():
+    categories = {}
+    for spec in GAMES:
+        categories.setdefault(spec.category, []).append(spec)
+    return categories
+
+
+class Prewarmer:
+    """Imports a game's module and preloads its assets on a worker thread.
+
+    Each game is warmed at most once; failures are reported and otherwise
+    ignored since launching will simply do the work itself.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = set()
+        self.threads = {}
+
+    def request(self, key):
+        spec = get_game(key)
+        if spec is None:
+            return
+        with self.lock:
+            if key in self.started:
+                return
+            self.started.add(key)
+        thread = threading.Thread(target=self._warm, args=(spec,),
+                                  name=f"prewarm-{key}", daemon=True)
+        self.threads[key] = thread
+        thread.start()
+
+    def is_warm(self, key):
+        thread = self.threads.get(key)
+        return thread is not None and not thread.is_alive()
+
+    def _warm(self, spec):
+        try:
+            game_class = spec.load()
+            preload = getattr(game_class, 'preload_assets', None)
+            if preload is not None:
+                preload()
+        except Exception as e:
+            print(f"Could not prewarm {spec.name}: {e}")
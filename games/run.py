@@ -0,0 +1,151 @@
+"""Run a single game outside the launcher.
+
+    python -m games.run snake
+    python -m games.run snake --headless --frames 100000
+    python -m games.run pong --headless --frames 5000 --seed 42
+    python -m games.run flappybird --headless --frames 5000 --keys 0:space,30:space
+    python -m games.run snake --record session.gcinput
+    python -m games.run --replay session.gcinput
+    python -m games.run brickbaker --resolution 640x360 --scale nearest
+"""
+import argparse
+import os
+import sys
+import time
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run one game directly")
+    parser.add_argument('game', nargs='?', help="registry key, e.g. snake or pong")
+    parser.add_argument('--headless', action='store_true',
+                        help="no window or audio device; step frames uncapped")
+    parser.add_argument('--frames', type=int, default=1000,
+                        help="frames to step in headless mode")
+    parser.add_argument('--no-draw', action='store_true',
+                        help="skip drawing as well (headless only)")
+    parser.add_argument('--keys', default='',
+                        help="scripted key taps, FRAME:KEY[:HOLD],... (headless only)")
+    parser.add_argument('--size', default='1024x768',
+                        help="window size as WIDTHxHEIGHT")
+    parser.add_argument('--resolution', metavar='WxH',
+                        help="draw at this fixed size and scale it to the window")
+    parser.add_argument('--scale', choices=('nearest', 'smooth'), default='smooth',
+                        help="filter used to scale --resolution to the window")
+    parser.add_argument('--fixed-quality', action='store_true',
+                        help="never lower drawing quality to hold the frame rate")
+    parser.add_argument('--seed', type=int,
+                        help="seed the game's rng so the run can be reproduced")
+    parser.add_argument('--record', metavar='PATH',
+                        help="record this session's input to PATH")
+    parser.add_argument('--replay', metavar='PATH',
+                        help="replay a recording headlessly at full speed")
+    parser.add_argument('--capture', metavar='DIR',
+                        help="capture the screen to DIR from the first frame (F9 toggles)")
+    parser.add_argument('--capture-format', choices=('png', 'gif', 'apng'), default='png',
+                        help="PNG sequence, or an animated GIF/APNG (needs Pillow)")
+    parser.add_argument('--profile', metavar='PREFIX',
+                        help="write per-phase frame timings to PREFIX-<game>.csv/.json")
+    parser.add_argument('--allocs', metavar='PREFIX',
+                        help="trace allocations and GC pauses to PREFIX-<game>-allocs.json (slow)")
+    return parser.parse_args(argv)
+
+
+def save_recording(game, path):
+    if not path:
+        return
+    game.input.finish()
+    game.input.recorder.save(path)
+    print(f"Recorded {game.input.recorder.frame_count} frames to {path}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.replay and args.record:
+        print("--record and --replay cannot be combined")
+        return 2
+    if args.replay:
+        args.headless = True
+    if args.headless:
+        # Must be set before pygame initialises video and audio
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    import pygame
+    from games import registry
+    from utils.display import parse_size, window
+    from utils.capture import capture
+    from utils.game_base import GameBase
+    from utils.input_source import NullInput, ScriptedInput
+    from utils.input_log import InputLog, InputRecorder, RecordingInput, ReplayInput
+
+    size = parse_size(args.size)
+    log = None
+    if args.replay:
+        log = InputLog.load(args.replay)
+        args.game = args.game or log.game_key
+        # The recording only reproduces with the same seed and layout
+        args.seed = log.seed
+        size = log.size
+
+    spec = registry.get_game(args.game)
+    if spec is None:
+        print(f"Unknown game {args.game!r}; choose from "
+              f"{', '.join(game.key for game in registry.GAMES)}")
+        return 2
+    if args.headless and spec.external:
+        print(f"{spec.name} runs in its own process and cannot be run headless")
+        return 2
+
+    if args.profile:
+        GameBase.profile_prefix = args.profile
+    if args.allocs:
+        GameBase.alloc_prefix = args.allocs
+    if args.seed is not None:
+        GameBase.default_seed = args.seed
+    if args.resolution:
+        GameBase.logical_size = parse_size(args.resolution)
+    GameBase.scale_filter = args.scale
+    GameBase.adaptive_quality = not args.fixed_quality
+
+    pygame.init()
+    window.ensure_mode(size)
+    game = spec.create()
+
+    if args.headless and log is None:
+        game.input = ScriptedInput.from_taps(args.keys) if args.keys else NullInput()
+    elif log is not None:
+        game.input = ReplayInput(log)
+    if args.record:
+        recorder = InputRecorder(spec.key, game.seed, game.screen.get_size())
+        game.input = RecordingInput(game.input, recorder)
+
+    if not args.headless:
+        if args.capture:
+            capture.out_dir = args.capture
+            capture.fmt = args.capture_format
+            game.toggle_capture()
+        game.run()
+        capture.stop(wait=True)
+        pygame.quit()
+        save_recording(game, args.record)
+        return 0
+
+    start = time.perf_counter()
+    if log is None:
+        frames = game.run_headless(args.frames, draw=not args.no_draw)
+    else:
+        frames = game.run_replay(draw=not args.no_draw)
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    save_recording(game, args.record)
+
+    if hasattr(game, 'score'):
+        print(f"Final score: {game.score}")
+    print(f"{spec.name} (seed {game.seed}): {frames} frames in {elapsed:.3f} s "
+          f"({frames / elapsed if elapsed else 0:.0f} fps, "
+          f"{elapsed / max(frames, 1) * 1e6:.1f} us/frame)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
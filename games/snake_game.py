@@ -1,8 +1,19 @@
+import struct
 import pygame
-import random
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Counter
+
+# direction x/y, food x/y, score, speed, game over, segment count
+SNAKE_STATE = struct.Struct('<hhhhHB?H')
+
 
 class SnakeGame(GameBase):
+    game_key = 'snake'
+    pause_menu = False
+    rewindable = True
+    dirty_rects = True
+
     def __init__(self):
         super().__init__(title="Snake")
         # Make cell size smaller and ensure it divides screen dimensions evenly
@@ -25,23 +36,22 @@ class SnakeGame(GameBase):
         self.FOOD_COLOR = (255, 0, 0)
         self.SCORE_COLOR = (255, 255, 255)
         
-        # Initialize game font
-        self.game_font = pygame.font.Font(None, 36)
-        
-        # Initialize clock for controlling game speed
-        self.clock = pygame.time.Clock()
+        # Game font size
+        self.game_font_size = 36
+        self.score_counter = Counter('Score: {}', size=self.game_font_size, color=self.SCORE_COLOR,
+                                     pos=(10, 10))
         
     def spawn_food(self):
         while True:
             # Ensure food spawns on grid
-            grid_x = random.randrange(0, self.grid_width)
-            grid_y = random.randrange(0, self.grid_height)
+            grid_x = self.rng.randrange(0, self.grid_width)
+            grid_y = self.rng.randrange(0, self.grid_height)
             pos = (grid_x * self.cell_size, grid_y * self.cell_size)
             if pos not in self.snake:
                 return pos
     
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return True
             
@@ -74,9 +84,11 @@ class SnakeGame(GameBase):
             new_head[1] < 0 or new_head[1] >= self.height or
             new_head in self.snake[:-1]):  # Don't count tail collision when moving
             self.game_over = True
+            self.submit_score(self.score)
             return
         
         self.snake.insert(0, new_head)
+        self.mark_dirty(self.cell_rect(new_head))
         
         # Check if food is eaten - using grid-aligned positions
         food_rect = pygame.Rect(self.food[0], self.food[1], self.cell_size, self.cell_size)
@@ -84,14 +96,23 @@ class SnakeGame(GameBase):
         
         if food_rect.colliderect(head_rect):
             self.score += 1
+            self.mark_dirty(self.cell_rect(self.food))
             self.food = self.spawn_food()
+            self.mark_dirty(self.cell_rect(self.food))
             # Increase speed every 5 points
             if self.score % 5 == 0:
                 self.snake_speed = min(20, self.snake_speed + 1)
         else:
-            self.snake.pop()
+            self.mark_dirty(self.cell_rect(self.snake.pop()))
+
+    def cell_rect(self, pos):
+        return pygame.Rect(pos[0], pos[1], self.cell_size, self.cell_size)
+
+    def scene_state(self):
+        # Cells are reported from update(); only the text needs a full frame
+        return (self.score, self.game_over, self.paused)
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         self.screen.fill(self.BLACK)
         
         # Draw snake
@@ -104,20 +125,32 @@ class SnakeGame(GameBase):
                         (self.food[0], self.food[1], self.cell_size - 2, self.cell_size - 2))
         
         # Draw score
-        score_text = self.game_font.render(f'Score: {self.score}', True, self.SCORE_COLOR)
-        self.screen.blit(score_text, (10, 10))
+        self.score_counter.set(self.score)
+        self.score_counter.draw(self.screen)
         
         if self.game_over:
-            game_over_text = self.game_font.render('Game Over! Press R to Restart', True, self.SCORE_COLOR)
+            game_over_text = render_text('Game Over! Press R to Restart', self.game_font_size, self.SCORE_COLOR)
             game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(game_over_text, game_over_rect)
         elif self.paused:
-            pause_text = self.game_font.render('PAUSED', True, self.SCORE_COLOR)
+            pause_text = render_text('PAUSED', self.game_font_size, self.SCORE_COLOR)
             pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(pause_text, pause_rect)
-        
-        pygame.display.flip()
     
+    def snapshot(self):
+        head = SNAKE_STATE.pack(self.direction[0], self.direction[1], self.food[0], self.food[1],
+                                self.score, self.snake_speed, self.game_over, len(self.snake))
+        segments = [coord for segment in self.snake for coord in segment]
+        return head + struct.pack(f'<{len(segments)}h', *segments)
+
+    def restore(self, data):
+        dx, dy, food_x, food_y, self.score, self.snake_speed, self.game_over, length = \
+            SNAKE_STATE.unpack_from(data)
+        self.direction = [dx, dy]
+        self.food = (food_x, food_y)
+        coords = struct.unpack_from(f'<{length * 2}h', data, SNAKE_STATE.size)
+        self.snake = list(zip(coords[::2], coords[1::2]))
+
     def reset_game(self):
         self.snake = [(self.width // 2, self.height // 2)]
         self.direction = [self.cell_size, 0]
@@ -125,11 +158,8 @@ class SnakeGame(GameBase):
         self.score = 0
         self.game_over = False
         self.snake_speed = 10
-    
-    def run(self):
-        while self.running:
-            if self.handle_events():
-                break
-            self.update()
-            self.draw()
-            self.clock.tick(self.snake_speed)  # Control game speed
\ No newline at end of file
+        self.invalidate()
+        self.start_round()
+
+    def update_rate(self):
+        return self.snake_speed  # Moves per second
@@ -1,5 +1,7 @@
 import pygame
 from utils.game_base import GameBase
+from utils.text_cache import render_text
+from utils.hud import Hud, Label, Overlay
 
 class TicTacToeGame(GameBase):
     def __init__(self, board_size=3):
@@ -14,7 +16,7 @@ class TicTacToeGame(GameBase):
         self.board_size = board_size
         self.selected_cell = [0, 0]  # For keyboard navigation
         self.paused = False
-        self.game_font = None  # Will be set in reset_board
+        self.game_font_size = None  # Will be set in reset_board
         
         super().__init__(title="Tic Tac Toe")
         self.setup_size_selection()
@@ -24,7 +26,7 @@ class TicTacToeGame(GameBase):
         """Initialize the size selection menu"""
         self.size_options = [3, 4, 5]
         self.selected_size = 0  # Index in size_options
-        self.menu_font = pygame.font.Font(None, 48)
+        self.menu_font_size = 48
         
     def handle_size_selection(self, events):
         """Handle input for size selection menu"""
@@ -46,13 +48,13 @@ class TicTacToeGame(GameBase):
     def draw_size_selection(self):
         """Draw the size selection menu"""
         self.screen.fill(self.BLACK)
-        title = self.menu_font.render("Select Board Size", True, self.WHITE)
+        title = render_text("Select Board Size", self.menu_font_size, self.WHITE)
         title_rect = title.get_rect(center=(self.width // 2, 150))
         self.screen.blit(title, title_rect)
         
         for i, size in enumerate(self.size_options):
             color = self.WHITE if i == self.selected_size else self.GRID_COLOR
-            text = self.menu_font.render(f"{size}x{size}", True, color)
+            text = render_text(f"{size}x{size}", self.menu_font_size, color)
             rect = text.get_rect(center=(self.width // 2, 250 + i * 60))
             
             # Draw selection indicator
@@ -62,8 +64,7 @@ class TicTacToeGame(GameBase):
             self.screen.blit(text, rect)
         
         # Draw instructions
-        instruction_font = pygame.font.Font(None, 32)
-        instructions = instruction_font.render("Use UP/DOWN arrows to select, ENTER to start", True, self.GRID_COLOR)
+        instructions = render_text("Use UP/DOWN arrows to select, ENTER to start", 32, self.GRID_COLOR)
         inst_rect = instructions.get_rect(center=(self.width // 2, self.height - 100))
         self.screen.blit(instructions, inst_rect)
 
@@ -77,33 +78,18 @@ class TicTacToeGame(GameBase):
                     self.reset_game()
                     self.paused = False
 
-    def draw_pause_menu(self):
-        """Draw the pause menu"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Menu text
-        pause_font = pygame.font.Font(None, 48)
-        text_color = self.WHITE
-        
-        # Draw "PAUSED" text
-        paused_text = pause_font.render("PAUSED", True, text_color)
-        text_rect = paused_text.get_rect(center=(self.width // 2, self.height // 2 - 40))
-        self.screen.blit(paused_text, text_rect)
-        
-        # Draw instructions
-        instruction_font = pygame.font.Font(None, 32)
+    def build_pause_layer(self):
+        """Pause screen: title and key hints over the dimmed board"""
+        center_x, center_y = self.width // 2, self.height // 2
+        hud = Hud(Overlay(self.BLACK, 128),
+                  Label("PAUSED", 48, self.WHITE, (center_x, center_y - 40), 'center'))
         instructions = [
             "Press ESC to resume",
             "Press R to restart",
         ]
-        
         for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, text_color)
-            rect = text.get_rect(center=(self.width // 2, self.height // 2 + 20 + i * 40))
-            self.screen.blit(text, rect)
+            hud.add(Label(instruction, 32, self.WHITE, (center_x, center_y + 20 + i * 40), 'center'))
+        return hud
 
     def reset_board(self):
         """Initialize or reset board, game state and recalc grid dimensions."""
@@ -121,16 +107,20 @@ class TicTacToeGame(GameBase):
         self.grid_x = (self.width - self.grid_size) // 2
         self.grid_y = (self.height - self.grid_size) // 2
         
-        # Initialize the game font with appropriate size
-        self.game_font = pygame.font.Font(None, self.cell_size // 2)
+        # Game font size scales with the cell size
+        self.game_font_size = self.cell_size // 2
     
+    def relaunch(self):
+        super().relaunch()
+        # A new session starts from the board size menu
+        self.size_selected = False
+        self.selected_cell = [0, 0]
+
     def change_grid_size(self, new_size):
         """Change the board size and reset the game."""
         self.board_size = new_size
         self.win_condition = new_size  # Modify this if you want a different win condition
         self.reset_board()
-        # Update font size based on new cell size
-        self.game_font = pygame.font.Font(None, self.cell_size // 2)
     
     def reset_game(self):
         """Reset the game (board and state)."""
@@ -153,7 +143,7 @@ class TicTacToeGame(GameBase):
             self.make_move(row, col)
     
     def handle_events(self):
-        events = pygame.event.get()
+        events = self.poll_events()
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
@@ -260,10 +250,9 @@ class TicTacToeGame(GameBase):
     def is_board_full(self):
         return all(cell != '' for row in self.board for cell in row)
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         if not self.size_selected:
             self.draw_size_selection()
-            pygame.display.flip()
             return
 
         self.screen.fill(self.BLACK)
@@ -300,7 +289,7 @@ class TicTacToeGame(GameBase):
                 cell = self.board[y][x]
                 if cell:
                     color = self.X_COLOR if cell == 'X' else self.O_COLOR
-                    text = self.game_font.render(cell, True, color)
+                    text = render_text(cell, self.game_font_size, color)
                     text_rect = text.get_rect(center=(
                         self.grid_x + x * self.cell_size + self.cell_size // 2,
                         self.grid_y + y * self.cell_size + self.cell_size // 2
@@ -313,21 +302,17 @@ class TicTacToeGame(GameBase):
                 msg = f"Player {self.winner} wins!"
             else:
                 msg = "It's a tie!"
-            game_over_text = self.game_font.render(msg, True, self.WHITE)
-            restart_text = self.game_font.render("Press R to Restart", True, self.GRID_COLOR)
+            game_over_text = render_text(msg, self.game_font_size, self.WHITE)
+            restart_text = render_text("Press R to Restart", self.game_font_size, self.GRID_COLOR)
             game_over_rect = game_over_text.get_rect(center=(self.width // 2, 50))
             restart_rect = restart_text.get_rect(center=(self.width // 2, self.height - 50))
             self.screen.blit(game_over_text, game_over_rect)
             self.screen.blit(restart_text, restart_rect)
         else:
-            turn_text = self.game_font.render(f"Player {self.current_player}'s Turn", True, self.WHITE)
-            controls_text = self.game_font.render("Arrows/WASD: move, Space/Enter: select", True, self.GRID_COLOR)
+            turn_text = render_text(f"Player {self.current_player}'s Turn", self.game_font_size, self.WHITE)
+            controls_text = render_text("Arrows/WASD: move, Space/Enter: select", self.game_font_size, self.GRID_COLOR)
             turn_rect = turn_text.get_rect(center=(self.width // 2, 50))
             controls_rect = controls_text.get_rect(center=(self.width // 2, self.height - 50))
             self.screen.blit(turn_text, turn_rect)
             self.screen.blit(controls_text, controls_rect)
-        
-        if self.paused:
-            self.draw_pause_menu()
-        
-        pygame.display.flip()
+
@@ -1,18 +1,39 @@
+from utils.startup import trace  # Imported first so the trace sees every import
 import pygame
 import sys
 import os
+import argparse
+import threading
+import time
 from pygame import mixer
 import math
-import hashlib  # For simple password hashing
-
-# Initialize Pygame
-pygame.init()
-mixer.init()
+from utils.layers import Compositor
+from utils.display import parse_size, window
+from utils.frame_scheduler import FrameScheduler
+from utils.virtual_grid import VirtualGrid
+from utils.text_cache import get_font, render_text
+from games import registry
+from utils import assets
+from utils.game_pool import GamePool
+from utils.accounts import AccountError, AccountService
+from utils.input_log import InputRecorder, RecordingInput
+from utils.quality import QualityGovernor
+from utils.capture import FORMATS as CAPTURE_FORMATS, capture
+from utils import scores
+
+trace.end('import')
 
 # Constants
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+IDLE_FPS = 15  # Launcher tick rate while only the title pulse is animating
+PREWARM_DELAY_MS = 300  # Cursor dwell time before a game is warmed in the background
+# Memory budget for game instances kept warm between launches
+GAME_POOL_BUDGET_MB = int(os.environ.get('GAME_POOL_BUDGET_MB', 64))
+LOGIN_BUDGET_MS = 500  # Cold start to first interactive login frame
+ACCOUNTS_DB = os.path.join('data', 'accounts.db')
+SCORES_DB = os.path.join('data', 'scores.db')
 
 # Colors
 DARK_BG = (18, 18, 18)
@@ -27,23 +48,35 @@ ACCENT_YELLOW = (251, 188, 4)
 ACCENT_PURPLE = (149, 97, 226)
 TRANSPARENT = (0, 0, 0, 0)
 
+# Icons already reported missing, so rebuilt tiles do not repeat the warning
+_missing_icons = set()
+
 class InputBox:
     def __init__(self, x, y, width, height, text='', is_password=False):
         self.rect = pygame.Rect(x, y, width, height)
         self.color = WHITE
         self.text = text
         self.is_password = is_password
-        self.font = pygame.font.Font(None, 32)
-        self.txt_surface = self.font.render(text, True, self.color)
         self.active = False
+        self.render()
+
+    def render(self):
+        # Bake text and border into one surface; only called when the text
+        # or focus changes
+        display_text = '*' * len(self.text) if self.is_password else self.text
+        self.txt_surface = render_text(display_text, 32, self.color)
+        width = max(self.rect.width, self.txt_surface.get_width() + 5)
+        self.surface = pygame.Surface((width, self.rect.height), pygame.SRCALPHA)
+        self.surface.blit(self.txt_surface, (5, 5))
+        pygame.draw.rect(self.surface, self.color, (0, 0, self.rect.width, self.rect.height), 2)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.active = True
-            else:
-                self.active = False
-            self.color = ACCENT_BLUE if self.active else WHITE
+            active = self.rect.collidepoint(event.pos)
+            if active != self.active:
+                self.active = active
+                self.color = ACCENT_BLUE if self.active else WHITE
+                self.render()
         if event.type == pygame.KEYDOWN:
             if self.active:
                 if event.key == pygame.K_RETURN:
@@ -52,15 +85,11 @@ class InputBox:
                     self.text = self.text[:-1]
                 else:
                     self.text += event.unicode
-                display_text = '*' * len(self.text) if self.is_password else self.text
-                self.txt_surface = self.font.render(display_text, True, self.color)
+                self.render()
         return False
 
     def draw(self, screen):
-        display_text = '*' * len(self.text) if self.is_password else self.text
-        self.txt_surface = self.font.render(display_text, True, self.color)
-        screen.blit(self.txt_surface, (self.rect.x+5, self.rect.y+5))
-        pygame.draw.rect(screen, self.color, self.rect, 2)
+        screen.blit(self.surface, self.rect.topleft)
 
 class Button:
     def __init__(self, x, y, width, height, text, color, icon_path=None):
@@ -71,43 +100,62 @@ class Button:
         self.original_color = self.color
         # Calculate hover color with bounds checking
         self.hover_color = tuple(min(255, c + 30) for c in self.color)
-        self.font = pygame.font.Font(None, 32)
         self.icon = None
         self.is_hovered = False
         self.is_selected = False
         self.animation_progress = 0
+        # Pre-rendered looks keyed by (animation step, selected)
+        self.frames = {}
         
-        # Try to load icon if provided
-        if icon_path:
+        # Try to load icon if provided; tiles are rebuilt as they scroll into
+        # view, so icons come from the shared asset cache
+        if icon_path and icon_path not in _missing_icons:
             try:
-                self.icon = pygame.image.load(os.path.join('assets', 'images', icon_path))
-                self.icon = pygame.transform.scale(self.icon, (32, 32))
-            except:
+                self.icon = assets.load_image(os.path.join('assets', 'images', icon_path),
+                                              alpha=True, size=(32, 32))
+            except Exception:
+                _missing_icons.add(icon_path)
                 print(f"Could not load icon: {icon_path}")
 
+    def update(self):
+        # Step the hover animation; returns True when the button needs a redraw
+        target = 1 if self.is_hovered or self.is_selected else 0
+        if self.animation_progress == target:
+            return False
+        step = 0.1 if target else -0.1
+        self.animation_progress = round(max(0, min(1, self.animation_progress + step)), 1)
+        return True
+
     def draw(self, surface):
-        # Draw button background with animation
-        self.animation_progress = min(1, self.animation_progress + (0.1 if self.is_hovered or self.is_selected else -0.1))
-        current_color = self.interpolate_color(self.original_color, self.hover_color, self.animation_progress)
-        
-        # Draw rounded rectangle with ensured valid color
-        pygame.draw.rect(surface, current_color, self.rect, border_radius=10)
-        
-        # Draw selection indicator
-        if self.is_selected:
-            pygame.draw.rect(surface, WHITE, self.rect, width=3, border_radius=10)
-        
-        # Draw icon if available
+        key = (int(round(self.animation_progress * 10)), self.is_selected)
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = self.frames[key] = self.bake(key[0] / 10, key[1])
+        surface.blit(frame, self.rect.topleft)
+
+    def bake(self, progress, selected):
+        # Render one animation step (background, border, icon and label)
+        # onto its own surface so that drawing the button is a single blit
+        rect = pygame.Rect((0, 0), self.rect.size)
+        text_surface = render_text(self.text, 32, WHITE)
         if self.icon:
-            icon_rect = self.icon.get_rect(midleft=(self.rect.left + 20, self.rect.centery))
-            surface.blit(self.icon, icon_rect)
-            text_surface = self.font.render(self.text, True, WHITE)
-            text_rect = text_surface.get_rect(midleft=(self.rect.left + 70, self.rect.centery))
+            text_rect = text_surface.get_rect(midleft=(rect.left + 70, rect.centery))
         else:
-            text_surface = self.font.render(self.text, True, WHITE)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-        
-        surface.blit(text_surface, text_rect)
+            text_rect = text_surface.get_rect(center=rect.center)
+        # Long labels may run past the edge, as they always have
+        frame = pygame.Surface((max(rect.width, text_rect.right), rect.height), pygame.SRCALPHA)
+
+        current_color = self.interpolate_color(self.original_color, self.hover_color, progress)
+        pygame.draw.rect(frame, current_color, rect, border_radius=10)
+
+        # Draw selection indicator
+        if selected:
+            pygame.draw.rect(frame, WHITE, rect, width=3, border_radius=10)
+
+        if self.icon:
+            frame.blit(self.icon, self.icon.get_rect(midleft=(rect.left + 20, rect.centery)))
+        frame.blit(text_surface, text_rect)
+        return frame
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -124,10 +172,13 @@ class Button:
                     for c1, c2 in zip(color1, color2))
 
 class LoginScreen:
-    def __init__(self, screen):
+    def __init__(self, screen, accounts):
         self.screen = screen
+        self.accounts = accounts
         self.running = True
-        self.clock = pygame.time.Clock()
+        # Nothing on the login screen animates on its own, so it can sleep
+        # until input arrives
+        self.scheduler = FrameScheduler(FPS, idle_fps=0)
         
         # Create input boxes for username and password
         box_width = 200
@@ -140,20 +191,32 @@ class LoginScreen:
         self.password_box = InputBox(center_x - box_width//2, center_y + 20, 
                                    box_width, box_height, is_password=True)
         
-        self.login_button = Button(center_x - 100//2, center_y + 100, 
+        self.login_button = Button(center_x - 100 - 10, center_y + 100, 
                                  100, 40, "Login", ACCENT_BLUE)
+        self.register_button = Button(center_x + 10, center_y + 100,
+                                    100, 40, "Register", ACCENT_GREEN)
         
         self.error_message = ""
-        self.error_timer = 0
+        self.error_until = 0
         self.logged_in = False
         self.username = ""
 
-    def handle_events(self):
-        for event in pygame.event.get():
+        # Password hashing runs on the account worker; while a request is in
+        # flight the form is locked and a spinner is shown
+        self.pending = None
+        self.pending_action = None
+        self.pending_username = ""
+        self.spinner_angle = 0
+
+    def handle_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return False
             
+            if self.pending is not None:
+                continue
+            
             # Handle input box events
             username_enter = self.username_box.handle_event(event)
             password_enter = self.password_box.handle_event(event)
@@ -162,39 +225,77 @@ class LoginScreen:
             if username_enter or password_enter:
                 self.try_login()
             
-            # Handle login button
+            # Handle login and register buttons
             if self.login_button.handle_event(event):
                 self.try_login()
+            elif self.register_button.handle_event(event):
+                self.try_login(register=True)
                 
         return True
 
-    def try_login(self):
-        username = self.username_box.text
+    def show_error(self, message):
+        self.error_message = message
+        self.error_until = time.perf_counter() + 2.0
+
+    def try_login(self, register=False):
+        username = self.username_box.text.strip()
         password = self.password_box.text
         
         if not username or not password:
-            self.error_message = "Please enter both username and password"
-            self.error_timer = 60
+            self.show_error("Please enter both username and password")
             return
         
-        # For this simple implementation, we'll accept any non-empty username/password
+        if register:
+            self.pending = self.accounts.register(username, password)
+        else:
+            self.pending = self.accounts.login(username, password)
+        self.pending_action = 'register' if register else 'login'
+        self.pending_username = username
+        self.error_message = ""
+
+    def check_pending(self):
+        if self.pending is None or not self.pending.done():
+            return
+        future, action = self.pending, self.pending_action
+        self.pending = None
+        try:
+            result = future.result()
+        except AccountError as e:
+            self.show_error(str(e))
+            return
+        except Exception as e:
+            print(f"Account lookup failed: {e}")
+            self.show_error("Could not reach the account store")
+            return
+
+        if action == 'login' and not result:
+            self.show_error("Invalid username or password")
+            return
         self.logged_in = True
-        self.username = username
+        self.username = self.pending_username
+
+    def draw_spinner(self):
+        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 170)
+        rect = pygame.Rect(0, 0, 28, 28)
+        rect.center = center
+        start = math.radians(self.spinner_angle)
+        pygame.draw.arc(self.screen, ACCENT_BLUE, rect, start, start + math.pi * 1.5, 3)
+        label = "Creating account..." if self.pending_action == 'register' else "Checking credentials..."
+        text = render_text(label, 28, LIGHT_GRAY)
+        self.screen.blit(text, text.get_rect(midleft=(center[0] + 24, center[1])))
 
     def draw(self):
         # Draw background
         self.screen.fill(DARK_BG)
         
         # Draw title
-        title_font = pygame.font.Font(None, 72)
-        title = title_font.render("Game Center Login", True, WHITE)
+        title = render_text("Game Center Login", 72, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
         self.screen.blit(title, title_rect)
         
         # Draw labels
-        label_font = pygame.font.Font(None, 32)
-        username_label = label_font.render("Username:", True, WHITE)
-        password_label = label_font.render("Password:", True, WHITE)
+        username_label = render_text("Username:", 32, WHITE)
+        password_label = render_text("Password:", 32, WHITE)
         
         self.screen.blit(username_label, (self.username_box.rect.x, self.username_box.rect.y - 30))
         self.screen.blit(password_label, (self.password_box.rect.x, self.password_box.rect.y - 30))
@@ -203,55 +304,147 @@ class LoginScreen:
         self.username_box.draw(self.screen)
         self.password_box.draw(self.screen)
         
-        # Draw login button
+        # Draw login and register buttons
         self.login_button.draw(self.screen)
+        self.register_button.draw(self.screen)
+        
+        if self.pending is not None:
+            self.draw_spinner()
         
         # Draw error message if any
-        if self.error_timer > 0:
-            error_font = pygame.font.Font(None, 28)
-            error_text = error_font.render(self.error_message, True, ACCENT_RED)
+        if self.error_message:
+            error_text = render_text(self.error_message, 28, ACCENT_RED)
             error_rect = error_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 160))
             self.screen.blit(error_text, error_rect)
-            self.error_timer -= 1
         
         pygame.display.flip()
 
+    def update(self):
+        # Returns True while something on screen is still animating
+        self.check_pending()
+        animating = self.login_button.update()
+        animating = self.register_button.update() or animating
+        if self.pending is not None:
+            self.spinner_angle = (self.spinner_angle - 6 * self.scheduler.dt * FPS / 1000) % 360
+            animating = True
+        if self.error_message and time.perf_counter() >= self.error_until:
+            self.error_message = ""
+        return animating
+
+    def idle_timeout(self):
+        # Wake up in time to clear the error message, otherwise sleep until input
+        if self.error_message:
+            return (self.error_until - time.perf_counter()) * 1000
+        return None
+
     def run(self):
+        self.draw()
+        trace.mark('login interactive')
+        animating = False
         while self.running and not self.logged_in:
-            if not self.handle_events():
+            events = self.scheduler.poll(animating, self.idle_timeout())
+            if not self.handle_events(events):
                 return False
+            animating = self.update()
             self.draw()
-            self.clock.tick(FPS)
         return True
 
+class BackgroundMusic:
+    """Initialises the mixer and loads the launcher music off the main thread."""
+
+    def __init__(self, path, volume=0.3):
+        self.path = path
+        self.volume = volume
+        self.loaded = False
+        self.thread = threading.Thread(target=self.load, name='audio-init', daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def load(self):
+        with trace.phase('audio'):
+            try:
+                if not mixer.get_init():
+                    mixer.init()
+                mixer.music.load(self.path)
+                self.loaded = True
+            except Exception as e:
+                print(f"Could not load background music: {e}")
+
+    def wait(self):
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def play(self):
+        self.wait()
+        if self.loaded:
+            mixer.music.play(-1)  # Loop indefinitely
+            mixer.music.set_volume(self.volume)  # Set lower volume
+
 class GameLauncher:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Game Center")
-        self.clock = pygame.time.Clock()
+    # The background layer is only re-rendered on a change, but at large
+    # sizes that re-render is the launcher's slowest frame
+    QUALITY_TIERS = (
+        ('full', {'background_gradient': True, 'background_grid': True}),
+        ('no grid', {'background_gradient': True, 'background_grid': False}),
+        ('flat background', {'background_gradient': False, 'background_grid': False}),
+    )
+    adaptive_quality = True
+
+    def __init__(self, music=None, username=None, record_dir=None):
+        with trace.phase('display'):
+            self.screen = window.ensure_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.width, self.height = self.screen.get_size()
+        self.is_fullscreen = False
+        self.update_caption()
+        self.scheduler = FrameScheduler(FPS, IDLE_FPS)
+        self.animating = True
         self.running = True
         self.current_game = None
         self.scroll_offset = 0
         self.target_scroll = 0
         self.animation_time = 0
         self.selected_game_index = 0  # Track selected game
-        self.controls_font = pygame.font.Font(None, 24)
         self.username = ""
+        self.prewarmer = registry.Prewarmer()
+        self.game_pool = GamePool(GAME_POOL_BUDGET_MB * 1024 * 1024)
+        self.prewarm_focus = None
+        self.prewarm_since = 0
+        self.music = music
+        self.record_dir = record_dir
+        self.games_played = 0
+        self.background_gradient = True
+        self.background_grid = True
+        self.quality = None
+        if self.adaptive_quality:
+            self.quality = QualityGovernor("Game Center", self.QUALITY_TIERS, FPS, self.apply_quality)
+        self.accounts = AccountService(ACCOUNTS_DB)
+        self.score_store = scores.open_store(SCORES_DB)
+        self.leaderboard = scores.LeaderboardCache(self.score_store)
+        self.leaderboard_version = -1
+
+        # Warm the fonts the login screen needs before its first frame
+        with trace.phase('font'):
+            for size in (72, 32, 28):
+                get_font(size)
         
-        # Show login screen first
-        login_screen = LoginScreen(self.screen)
-        if login_screen.run():
-            self.username = login_screen.username
+        # Show login screen first, unless a user was given (benchmarks)
+        if username is None:
+            login_screen = LoginScreen(self.screen, self.accounts)
+            if login_screen.run():
+                username = login_screen.username
+        if username is not None:
+            self.username = username
+            if self.music is not None:
+                self.music.play()
+            # Audio is up by now, so this only brings up the remaining
+            # subsystems (timer, joystick) on the main thread
+            pygame.init()
+            trace.report('login interactive', LOGIN_BUDGET_MS)
+
             # Create categories and buttons
             self.setup_game_buttons()
-
-            # Load background music
-            try:
-                mixer.music.load(os.path.join('assets', 'sounds', 'background.wav'))
-                mixer.music.play(-1)  # Loop indefinitely
-                mixer.music.set_volume(0.3)  # Set lower volume
-            except Exception as e:
-                print(f"Could not load background music: {e}")
+            self.setup_layers()
         else:
             self.running = False
 
@@ -259,80 +452,136 @@ class GameLauncher:
         button_width = 200
         button_height = 200
         spacing = 20
-        grid_start_x = (SCREEN_WIDTH - (button_width * 3 + spacing * 2)) // 2
-        grid_start_y = 150
-        
-        self.categories = {
-            'Games': [
-                ('Snake', ACCENT_GREEN),
-                ('Pacman', ACCENT_YELLOW),
-                ('Pong', ACCENT_BLUE),
-                ('Tic Tac Toe', ACCENT_PURPLE),
-                ('Brick Baker', ACCENT_RED),
-                ('Flappy Bird', ACCENT_BLUE),
-                ('Memory Match', ACCENT_PURPLE)
-            ]
-        }
-        
-        self.buttons = {}
-        self.game_buttons = []  # Keep track of game buttons separately
-        current_x = grid_start_x
-        current_y = grid_start_y
         games_per_row = 3
+        grid_start_x = (self.width - (button_width * games_per_row + spacing * (games_per_row - 1))) // 2
+        grid_start_y = 150
         
-        for category, games in self.categories.items():
-            current_y += spacing
-            for i, (game_name, color) in enumerate(games):
-                row = i // games_per_row
-                col = i % games_per_row
-                x = grid_start_x + col * (button_width + spacing)
-                y = grid_start_y + row * (button_height + spacing)
-                
-                button_key = game_name.lower().replace(' ', '')
-                self.buttons[button_key] = Button(
-                    x, y, button_width, button_height,
-                    game_name, color, f"{button_key}.png"
-                )
-                self.game_buttons.append(button_key)
-            current_y += spacing
+        self.categories = registry.by_category()
+        # Keys of every game in grid order; tiles are only built for the
+        # handful of entries that are actually on screen
+        self.game_buttons = [spec.key for games in self.categories.values() for spec in games]
+        self.grid = VirtualGrid(
+            len(self.game_buttons), games_per_row, button_width, button_height, spacing,
+            (grid_start_x, grid_start_y),
+            # Tiles scroll underneath the header rather than over the title
+            (0, grid_start_y - 20, self.width, self.height - 90 - (grid_start_y - 20))
+        )
+        self.tiles = {}
 
         # Add exit button at the bottom
-        self.buttons['exit'] = Button(
-            SCREEN_WIDTH - 200 - 50,
-            SCREEN_HEIGHT - 50 - 30,
+        self.exit_button = Button(
+            self.width - 200 - 50,
+            self.height - 50 - 30,
             200, 50,
             "Exit Game Center", (40, 40, 40)
         )
         
         # Set initial selection
         self.update_selected_game(0)
+        self.sync_tiles()
+
+    def make_tile(self, index):
+        spec = registry.get_game(self.game_buttons[index])
+        rect = self.grid.tile_rect(index, self.scroll_offset)
+        tile = Button(rect.x, rect.y, rect.width, rect.height, spec.name, spec.color, spec.icon)
+        tile.is_selected = index == self.selected_game_index
+        tile.is_hovered = tile.rect.collidepoint(pygame.mouse.get_pos())
+        return tile
+
+    def sync_tiles(self):
+        # Build tiles scrolled into view, drop those scrolled out and position
+        # the rest from the current scroll offset
+        changed = False
+        visible = self.grid.visible_range(self.scroll_offset)
+        for index in list(self.tiles):
+            if index not in visible:
+                del self.tiles[index]
+                changed = True
+        for index in visible:
+            tile = self.tiles.get(index)
+            if tile is None:
+                self.tiles[index] = self.make_tile(index)
+                changed = True
+                continue
+            y = self.grid.tile_rect(index, self.scroll_offset).y
+            if tile.rect.y != y:
+                tile.rect.y = y
+                changed = True
+        return changed
+
+    def setup_layers(self):
+        # Static background, animated title and buttons are composited
+        # separately so that idle frames only cost a few blits
+        self.compositor = Compositor()
+        self.compositor.add_layer('background', self.draw_background)
+        self.compositor.add_layer('title', self.draw_title, cached=False)
+        self.compositor.add_layer('buttons', self.draw_buttons, transparent=True)
+        self.compositor.add_layer('leaderboard', self.draw_leaderboard, transparent=True)
+
+    def relayout(self):
+        # Rebuild size-dependent state after a fullscreen toggle or resize
+        self.width, self.height = self.screen.get_size()
+        selected = self.selected_game_index
+        self.scroll_offset = 0
+        self.target_scroll = 0
+        self.setup_game_buttons()
+        self.update_selected_game(selected)
+        self.compositor.resize((self.width, self.height))
+
+    def toggle_fullscreen(self):
+        self.is_fullscreen = not self.is_fullscreen
+        if self.is_fullscreen:
+            self.screen = window.ensure_mode(fullscreen=True)
+        else:
+            self.screen = window.ensure_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.relayout()
+
+    def sync_display(self):
+        # Games share the window and may have changed its mode; adopt
+        # whatever is showing rather than switching back
+        self.screen = window.surface
+        self.is_fullscreen = window.fullscreen
+        self.update_caption()
+        if self.screen.get_size() != (self.width, self.height):
+            self.relayout()
+        self.compositor.invalidate()
 
     def update_selected_game(self, index):
         # Clear previous selection
-        for button in self.buttons.values():
-            button.is_selected = False
+        previous = self.tiles.get(self.selected_game_index)
+        if previous is not None:
+            previous.is_selected = False
             
-        # Set new selection
+        # Set new selection and scroll it into view
         if 0 <= index < len(self.game_buttons):
             self.selected_game_index = index
-            self.buttons[self.game_buttons[index]].is_selected = True
+            tile = self.tiles.get(index)
+            if tile is not None:
+                tile.is_selected = True
+            self.target_scroll = self.grid.scroll_to_show(index, self.target_scroll)
+
+        if hasattr(self, 'compositor'):
+            self.compositor.invalidate('buttons')
+            self.compositor.invalidate('leaderboard')
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
             # Handle mouse wheel for scrolling
             if event.type == pygame.MOUSEWHEEL:
-                self.target_scroll = min(0, max(-400, self.target_scroll + event.y * 30))
+                self.target_scroll = self.grid.clamp_scroll(self.target_scroll + event.y * 30)
             
             # Handle keyboard navigation
             if event.type == pygame.KEYDOWN:
-                games_per_row = 3
-                current_row = self.selected_game_index // games_per_row
-                current_col = self.selected_game_index % games_per_row
+                games_per_row = self.grid.columns
                 
-                if event.key in [pygame.K_LEFT, pygame.K_a]:
+                if event.key == pygame.K_F9:
+                    capture.toggle('launcher')
+                    self.update_caption()
+
+                elif event.key in [pygame.K_LEFT, pygame.K_a]:
                     new_index = self.selected_game_index - 1
                     if new_index >= 0:      
                         self.update_selected_game(new_index)
@@ -357,133 +606,339 @@ class GameLauncher:
                     selected_game = self.game_buttons[self.selected_game_index]
                     self.launch_game(selected_game)
                 
+                elif event.key == pygame.K_F11:
+                    self.toggle_fullscreen()
+
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
+
+            if event.type == pygame.VIDEORESIZE:
+                self.screen = window.sync()
+                self.relayout()
             
-            # Handle mouse events
-            for button_name, button in self.buttons.items():
-                if button.handle_event(event):
-                    if button_name == 'exit':
-                        self.running = False
-                    else:
-                        # Update selection when clicking a game
-                        if button_name in self.game_buttons:
-                            self.update_selected_game(self.game_buttons.index(button_name))
-                        self.launch_game(button_name)
-
-    def draw_background(self):
+            # Handle mouse events; only on-screen tiles can be hit
+            if self.exit_button.handle_event(event):
+                self.running = False
+            clicked = None
+            pos = getattr(event, 'pos', None)
+            in_view = pos is None or self.grid.viewport.collidepoint(pos)
+            for index, tile in self.tiles.items():
+                if not in_view:
+                    tile.is_hovered = False
+                elif tile.handle_event(event):
+                    clicked = index
+            if clicked is not None:
+                # Update selection when clicking a game
+                self.update_selected_game(clicked)
+                self.launch_game(self.game_buttons[clicked])
+
+    def update_caption(self):
+        window.set_caption("Game Center" + (" [REC]" if capture.recording else ""))
+
+    def apply_quality(self, settings):
+        for name, value in settings.items():
+            setattr(self, name, value)
+        self.compositor.invalidate('background')
+
+    def draw_background(self, surface):
         # Draw gradient background
-        for i in range(SCREEN_HEIGHT):
-            progress = i / SCREEN_HEIGHT
-            color = self.interpolate_color(DARK_BG, DARKER_BG, progress)
-            pygame.draw.line(self.screen, color, (0, i), (SCREEN_WIDTH, i))
+        if self.background_gradient:
+            for i in range(self.height):
+                progress = i / self.height
+                color = self.interpolate_color(DARK_BG, DARKER_BG, progress)
+                pygame.draw.line(surface, color, (0, i), (self.width, i))
+        else:
+            surface.fill(DARK_BG)
 
         # Draw subtle grid pattern
-        grid_spacing = 30
-        grid_color = (30, 30, 30)  # Darker color for grid lines
-        for x in range(0, SCREEN_WIDTH, grid_spacing):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, grid_spacing):
-            pygame.draw.line(self.screen, grid_color, (0, y), (SCREEN_WIDTH, y))
+        if self.background_grid:
+            grid_spacing = 30
+            grid_color = (30, 30, 30)  # Darker color for grid lines
+            for x in range(0, self.width, grid_spacing):
+                pygame.draw.line(surface, grid_color, (x, 0), (x, self.height))
+            for y in range(0, self.height, grid_spacing):
+                pygame.draw.line(surface, grid_color, (0, y), (self.width, y))
+
+        # Category header backgrounds and the help line never change
+        y_pos = 80
+        for category in self.categories.keys():
+            header_bg = pygame.Rect(40, y_pos, self.width - 80, 40)
+            pygame.draw.rect(surface, DARKER_BG, header_bg, border_radius=5)
+
+        self.draw_controls_help(surface)
 
     def interpolate_color(self, color1, color2, progress):
         return tuple(int(c1 + (c2 - c1) * progress) for c1, c2 in zip(color1, color2))
 
-    def draw_category_headers(self):
-        header_font = pygame.font.Font(None, 48)
+    def draw_category_headers(self, surface):
+        # The pulse colour changes every frame, so render directly from the
+        # shared font instead of churning the text cache
+        header_font = get_font(48)
         y_pos = 80
         for category in self.categories.keys():
-            # Draw category background
-            header_bg = pygame.Rect(40, y_pos, SCREEN_WIDTH - 80, 40)
-            pygame.draw.rect(self.screen, DARKER_BG, header_bg, border_radius=5)
-            
             # Draw category text with pulsing effect
             color = self.interpolate_color(WHITE, ACCENT_BLUE, 
                                         (math.sin(self.animation_time * 0.02) + 1) / 2)
             text = header_font.render(category, True, color)
-            self.screen.blit(text, (50, y_pos + 5))
+            surface.blit(text, (50, y_pos + 5))
 
-    def draw_controls_help(self):
+    def draw_controls_help(self, surface):
         help_text = "Arrow Keys/WASD to navigate  |  Enter/Space to select  |  ESC to exit"
-        text_surface = self.controls_font.render(help_text, True, GRAY)
-        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
-        self.screen.blit(text_surface, text_rect)
+        text_surface = render_text(help_text, 24, GRAY)
+        text_rect = text_surface.get_rect(center=(self.width // 2, self.height - 20))
+        surface.blit(text_surface, text_rect)
+
+    def draw_title(self, surface):
+        # Draw animated title with username
+        title_font = get_font(72)
+        title_color = self.interpolate_color(ACCENT_BLUE, ACCENT_GREEN, 
+                                          (math.sin(self.animation_time * 0.02) + 1) / 2)
+        title = title_font.render(f"Welcome, {self.username}!", True, title_color)
+        title_shadow = render_text(f"Welcome, {self.username}!", 72, DARKER_BG)
+        
+        # Draw title with shadow effect
+        surface.blit(title_shadow, (self.width//2 - title.get_width()//2 + 2, 22))
+        surface.blit(title, (self.width//2 - title.get_width()//2, 20))
+        
+        # Draw category headers
+        self.draw_category_headers(surface)
+
+    def draw_buttons(self, surface):
+        surface.set_clip(self.grid.viewport)
+        for tile in self.tiles.values():
+            tile.draw(surface)
+        surface.set_clip(None)
+        self.exit_button.draw(surface)
+
+    def draw_leaderboard(self, surface):
+        # Panel to the right of the grid; cached and only redrawn when the
+        # selection changes or new scores have been written
+        self.leaderboard_version = self.score_store.version
+        panel_x = self.grid.origin[0] + self.grid.columns * (self.grid.tile_width + self.grid.spacing)
+        panel_width = self.width - panel_x - 20
+        if panel_width < 120 or not self.game_buttons:
+            return
+
+        spec = registry.get_game(self.game_buttons[self.selected_game_index])
+        panel = pygame.Rect(panel_x, self.grid.viewport.top, panel_width, 250)
+        pygame.draw.rect(surface, DARKER_BG, panel, border_radius=8)
+        title = render_text("Top Scores", 28, WHITE)
+        surface.blit(title, (panel.x + 10, panel.y + 10))
+        name = render_text(spec.name, 24, LIGHT_GRAY)
+        surface.blit(name, (panel.x + 10, panel.y + 38))
+
+        y = panel.y + 70
+        if not spec.scored:
+            rows = []
+            message = "No leaderboard"
+        else:
+            rows = self.leaderboard.get(spec.key, spec.lower_is_better)
+            message = "Loading..." if rows is None else "No scores yet"
+        if not rows:
+            text = render_text(message, 24, GRAY)
+            surface.blit(text, (panel.x + 10, y))
+            return
+
+        for rank, (username, score, _) in enumerate(rows, 1):
+            label = render_text(f"{rank}. {username[:10]}", 24, WHITE)
+            value = render_text(f"{score:g}", 24, ACCENT_YELLOW)
+            surface.blit(label, (panel.x + 10, y))
+            surface.blit(value, value.get_rect(topright=(panel.right - 10, y)))
+            y += 30
 
     def run(self):
         while self.running:
-            self.handle_events()
+            # Full rate only while a tween is running; otherwise the title
+            # pulse is advanced at the idle rate or on input
+            events = self.scheduler.poll(self.animating)
+            started = time.perf_counter()
+            played = self.games_played
+            self.handle_events(events)
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            # A frame that ran a game says nothing about the launcher's cost
+            if self.quality is not None and self.games_played == played:
+                self.quality.record((time.perf_counter() - started) * 1000)
 
     def update(self):
         # Smooth scrolling animation
-        self.scroll_offset += (self.target_scroll - self.scroll_offset) * 0.1
+        scrolling = abs(self.target_scroll - self.scroll_offset) > 0.5
+        if scrolling:
+            self.scroll_offset += (self.target_scroll - self.scroll_offset) * 0.1
+        else:
+            self.scroll_offset = self.target_scroll
         
-        # Update button positions based on scroll
-        for button in self.buttons.values():
-            button.rect.y = button.rect.y + (self.target_scroll - self.scroll_offset)
-
-        self.animation_time = (self.animation_time + 1) % 360
+        # Position on-screen tiles from the scroll offset and step their hover
+        buttons_changed = self.sync_tiles()
+        for tile in self.tiles.values():
+            if tile.update():
+                buttons_changed = True
+        if self.exit_button.update():
+            buttons_changed = True
+
+        if buttons_changed:
+            self.compositor.invalidate('buttons')
+
+        self.animating = buttons_changed or scrolling
+
+        # Checking the store version is an attribute read, not a query
+        if self.leaderboard.poll() or self.score_store.version != self.leaderboard_version:
+            self.compositor.invalidate('leaderboard')
+        self.update_prewarm()
+
+        # Pulse is measured in 60 FPS frames so its speed is independent of
+        # the current tick rate; wrap on a whole sine period
+        self.animation_time += self.scheduler.dt * FPS / 1000
+        self.animation_time %= 2 * math.pi / 0.02
+
+    def focused_game(self):
+        # The hovered tile wins over the keyboard selection
+        for index, tile in self.tiles.items():
+            if tile.is_hovered:
+                return self.game_buttons[index]
+        if self.game_buttons:
+            return self.game_buttons[self.selected_game_index]
+        return None
+
+    def update_prewarm(self):
+        # Warm the focused game once the cursor has rested on it for a moment
+        focus = self.focused_game()
+        now = pygame.time.get_ticks()
+        if focus != self.prewarm_focus:
+            self.prewarm_focus = focus
+            self.prewarm_since = now
+        elif focus is not None and now - self.prewarm_since >= PREWARM_DELAY_MS:
+            self.prewarmer.request(focus)
 
     def draw(self):
-        self.draw_background()
-        
-        # Draw animated title with username
-        title_font = pygame.font.Font(None, 72)
-        title_color = self.interpolate_color(ACCENT_BLUE, ACCENT_GREEN, 
-                                          (math.sin(self.animation_time * 0.02) + 1) / 2)
-        title = title_font.render(f"Welcome, {self.username}!", True, title_color)
-        title_shadow = title_font.render(f"Welcome, {self.username}!", True, DARKER_BG)
-        
-        # Draw title with shadow effect
-        self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 2, 22))
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 20))
-        
-        # Draw category headers
-        self.draw_category_headers()
-        
-        # Draw buttons
-        for button in self.buttons.values():
-            button.draw(self.screen)
-        
-        # Draw controls help
-        self.draw_controls_help()
-        
+        self.compositor.compose(self.screen)
         pygame.display.flip()
+        capture.grab(self.screen)
 
     def launch_game(self, game_name):
-        if game_name == 'snake':
-            from games.snake_game import SnakeGame
-            game = SnakeGame()
-            game.run()
-        elif game_name == 'pong':
-            from games.pong_game import PongGame
-            game = PongGame()
-            game.run()
-        elif game_name == 'pacman':
-            from games.pacman_game import PacmanGame
-            game = PacmanGame()
-            game.run()
-        elif game_name == 'tictactoe':
-            from games.tictactoe_game import TicTacToeGame
-            game = TicTacToeGame()
-            game.run()
-        elif game_name == 'brickbaker':
-            from games.brickbaker_game import BrickbakerGame
-            game = BrickbakerGame()
-            game.run()
-        elif game_name == 'flappybird':
-            from games.flappy_game import FlappyGame
-            game = FlappyGame()
-            game.run()
-        elif game_name == 'memorymatch':
-            from games.memory_match_game import MemoryMatchGame
-            game = MemoryMatchGame()
-            game.run()
+        spec = registry.get_game(game_name)
+        if spec is None:
+            return
 
-if __name__ == "__main__":
-    launcher = GameLauncher()
+        if self.record_dir:
+            # A recording replays against a freshly constructed game, so
+            # record one rather than a pooled instance
+            game = spec.create()
+            recorder = InputRecorder(spec.key, game.seed, game.screen.get_size())
+            game.input = RecordingInput(game.input, recorder)
+        else:
+            game = self.game_pool.acquire(spec.key, spec.create)
+        game.player_name = self.username
+        self.current_game = game
+        game.run()
+        self.current_game = None
+        self.games_played += 1
+        if self.record_dir:
+            game.input.finish()
+            self.save_recording(spec.key, recorder)
+        else:
+            self.game_pool.release(spec.key, game)
+
+        self.sync_display()
+
+    def save_recording(self, key, recorder):
+        os.makedirs(self.record_dir, exist_ok=True)
+        path = os.path.join(self.record_dir, f"{key}-{time.strftime('%Y%m%d-%H%M%S')}.gcinput")
+        try:
+            recorder.save(path)
+            print(f"Recorded {recorder.frame_count} frames to {path}")
+        except OSError as e:
+            print(f"Could not save recording: {e}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Game Center launcher")
+    parser.add_argument('--trace-startup', action='store_true',
+                        help="print a timeline of the startup phases")
+    parser.add_argument('--profile-frames', metavar='PREFIX',
+                        help="write each game's frame timings to PREFIX-<game>.csv/.json")
+    parser.add_argument('--profile-allocs', metavar='PREFIX',
+                        help="trace allocations and GC pauses per frame phase into "
+                             "PREFIX-<game>-allocs.json (slow)")
+    parser.add_argument('--record', metavar='DIR',
+                        help="record every game session's input to DIR for replay")
+    parser.add_argument('--resolution', metavar='WxH', type=parse_size,
+                        help="draw games at this fixed size and scale them to the window")
+    parser.add_argument('--scale', choices=('nearest', 'smooth'), default='smooth',
+                        help="filter used to scale --resolution to the window")
+    parser.add_argument('--fixed-quality', action='store_true',
+                        help="never lower drawing quality to hold the frame rate")
+    parser.add_argument('--capture-dir', default='captures',
+                        help="where F9 screen captures are written")
+    parser.add_argument('--capture-format', choices=CAPTURE_FORMATS, default='png',
+                        help="PNG sequence, or an animated GIF/APNG (needs Pillow)")
+    parser.add_argument('--capture-rate', type=float, default=15,
+                        help="frames per second kept while capturing")
+    parser.add_argument('--capture-scale', type=float, default=0.5,
+                        help="size of captured frames relative to the screen")
+    parser.add_argument('--bench-launch', action='store_true',
+                        help="time launching every game headlessly and print JSON")
+    parser.add_argument('--bench-runs', type=int, default=5,
+                        help="launches per game for --bench-launch")
+    parser.add_argument('--bench-games', nargs='+', metavar='KEY',
+                        help="only benchmark these game keys")
+    parser.add_argument('--bench-out', metavar='PATH',
+                        help="write the --bench-launch report here instead of stdout")
+    return parser.parse_args(argv)
+
+def bench_launch(args):
+    # Headless: no window, no audio device, no login
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from utils.launch_bench import LaunchBench, write_report
+
+    pygame.display.init()
+    pygame.font.init()
+    launcher = GameLauncher(username='bench')
+    try:
+        report = LaunchBench(launcher, runs=args.bench_runs).run(args.bench_games)
+    finally:
+        launcher.accounts.shutdown()
+        launcher.leaderboard.shutdown()
+        scores.close_store()
+        pygame.quit()
+    write_report(report, args.bench_out)
+
+def main(argv=None):
+    args = parse_args(argv)
+    trace.enabled = trace.enabled or args.trace_startup
+    from utils.game_base import GameBase
+    if args.profile_frames:
+        GameBase.profile_prefix = args.profile_frames
+    if args.profile_allocs:
+        GameBase.alloc_prefix = args.profile_allocs
+    GameBase.logical_size = args.resolution
+    GameBase.scale_filter = args.scale
+    GameBase.adaptive_quality = GameLauncher.adaptive_quality = not args.fixed_quality
+    capture.out_dir = args.capture_dir
+    capture.fmt = args.capture_format
+    capture.rate = args.capture_rate
+    capture.scale = args.capture_scale
+    if args.bench_launch:
+        bench_launch(args)
+        return
+
+    # Only what the login screen needs is initialised up front; the mixer
+    # comes up on a background thread while the player types
+    with trace.phase('init'):
+        pygame.display.init()
+        pygame.font.init()
+
+    music = BackgroundMusic(os.path.join('assets', 'sounds', 'background.wav'))
+    music.start()
+
+    launcher = GameLauncher(music, record_dir=args.record)
     launcher.run()
+    capture.stop(wait=True)
+    launcher.accounts.shutdown()
+    launcher.leaderboard.shutdown()
+    scores.close_store()
     pygame.quit()
+
+if __name__ == "__main__":
+    main()
     sys.exit()
\ No newline at end of file
@@ -0,0 +1,139 @@
+import hashlib
+import hmac
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# scrypt cost: 2**14 * 8 * 128 bytes = 16 MiB of memory per hash
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 240000  # Fallback when OpenSSL lacks scrypt
+SALT_BYTES = 16
+MIN_PASSWORD_LENGTH = 4
+MAX_USERNAME_LENGTH = 32
+
+
+class AccountError(Exception):
+    pass
+
+
+def hash_password(password, salt=None, scheme=None):
+    """Return (scheme, salt, digest) for a password.
+
+    ``scheme`` records the KDF and its parameters so stored hashes keep
+    verifying if the defaults are raised later.
+    """
+    if salt is None:
+        salt = os.urandom(SALT_BYTES)
+    if scheme is None:
+        if hasattr(hashlib, 'scrypt'):
+            scheme = f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}"
+        else:
+            scheme = f"pbkdf2_sha256${PBKDF2_ITERATIONS}"
+
+    name, *params = scheme.split('$')
+    data = password.encode('utf-8')
+    if name == 'scrypt':
+        n, r, p = (int(value) for value in params)
+        digest = hashlib.scrypt(data, salt=salt, n=n, r=r, p=p,
+                                maxmem=n * r * 256, dklen=32)
+    elif name == 'pbkdf2_sha256':
+        digest = hashlib.pbkdf2_hmac('sha256', data, salt, int(params[0]), dklen=32)
+    else:
+        raise AccountError(f"Unknown password scheme: {name}")
+    return scheme, salt, digest
+
+
+def verify_password(password, scheme, salt, digest):
+    _, _, candidate = hash_password(password, salt, scheme)
+    return hmac.compare_digest(candidate, digest)
+
+
+class AccountStore:
+    """SQLite-backed user table. Use from a single thread."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL COLLATE NOCASE,
+            scheme TEXT NOT NULL,
+            salt BLOB NOT NULL,
+            password_hash BLOB NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users (username);
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(self.SCHEMA)
+        # Hash checked against when the user does not exist, so unknown
+        # usernames take as long to reject as wrong passwords
+        self.dummy_record = hash_password('')
+
+    def get_user(self, username):
+        return self.connection.execute(
+            "SELECT scheme, salt, password_hash FROM users WHERE username = ?",
+            (username,)
+        ).fetchone()
+
+    def create_user(self, username, password):
+        if not username or len(username) > MAX_USERNAME_LENGTH:
+            raise AccountError(f"Username must be 1-{MAX_USERNAME_LENGTH} characters")
+        if len(password) < MIN_PASSWORD_LENGTH:
+            raise AccountError(f"Password must be at least {MIN_PASSWORD_LENGTH} characters")
+        scheme, salt, digest = hash_password(password)
+        try:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO users (username, scheme, salt, password_hash, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (username, scheme, salt, digest, time.time())
+                )
+        except sqlite3.IntegrityError:
+            raise AccountError("Username is already taken")
+
+    def authenticate(self, username, password):
+        record = self.get_user(username)
+        if record is None:
+            verify_password(password, *self.dummy_record)
+            return False
+        return verify_password(password, *record)
+
+    def close(self):
+        self.connection.close()
+
+
+class AccountService:
+    """Runs account operations on one worker thread.
+
+    Key derivation takes 100+ ms by design, so the render loop submits work
+    here and polls the returned futures. A single worker also keeps the
+    SQLite connection on the thread that opened it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.store = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='accounts')
+
+    def _get_store(self):
+        if self.store is None:
+            self.store = AccountStore(self.path)
+        return self.store
+
+    def login(self, username, password):
+        return self.executor.submit(lambda: self._get_store().authenticate(username, password))
+
+    def register(self, username, password):
+        return self.executor.submit(lambda: self._get_store().create_user(username, password))
+
+    def shutdown(self):
+        if self.store is not None:
+            self.executor.submit(self.store.close)
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,235 @@
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import deque
+from utils import profiler
+from utils.profiler import PHASES, percentile
+
+
+class AllocationProfiler:
+    """Opt-in allocation and garbage-collector instrumentation.
+
+    Hooked into a FrameProfiler, so it sees the same ``begin_frame`` /
+    ``lap(phase)`` / ``end_frame`` calls. For each phase it records the net
+    change in traced memory and the peak above where the phase started;
+    short-lived objects that are freed again within the phase never show
+    in the net figure but do raise the peak. Collections are timed through
+    ``gc.callbacks`` and charged to the phase they interrupted.
+
+    Allocating call sites are measured on every ``sample_every``-th frame.
+    During a sampled frame the locals and return value of every function
+    that returns are kept alive until the frame ends, so a snapshot diff
+    around the frame also catches objects that would have been freed within
+    it (a Rect built in update(), a string formatted for the HUD). The
+    per-line block and byte counts are summed over the sampled frames and
+    ranked per frame. Temporaries never bound to a name, and small tuples
+    or floats reused from CPython's free lists, are not seen. Sampled frames
+    are left out of the phase figures, since the objects held alive there
+    would inflate them, and the collector is held off during them so the
+    kept objects do not trigger collections that would not otherwise run.
+
+    ``retained_sites`` is the separate comparison of the first and last
+    snapshot: memory allocated during the session and still held at exit.
+    tracemalloc slows everything down noticeably; this is for diagnosis
+    only and tracing starts with the first frame.
+    """
+
+    def __init__(self, depth=1, top=15, history=18000, sample_every=30):
+        self.depth = depth
+        self.top = top
+        self.sample_every = sample_every
+        self.sampled_frames = 0
+        self.sites = {}  # (file, line): [blocks, bytes] over the sampled frames
+        self.sampling = False
+        self.frame_before = None
+        self.kept = []  # Objects held alive until the sampled frame ends
+        self.previous_profile = None
+        self.gc_was_enabled = False
+        self.history = deque(maxlen=history)  # (frame, {phase: (net, peak, gc ms)})
+        self.frame_count = 0
+        self.started = False
+        self.owns_tracing = False
+        self.baseline = None
+        self.final = None
+        self.phase_start = 0
+        self.current = {}
+        self.gc_started = None
+        self.gc_pending = 0.0  # ms of collection not yet charged to a phase
+        self.collections = []  # (frame, generation, ms, collected)
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.depth)
+            self.owns_tracing = True
+        self.baseline = tracemalloc.take_snapshot()
+        gc.callbacks.append(self.on_gc)
+        self.started = True
+
+    def stop(self):
+        if not self.started:
+            return
+        if self.sampling:
+            self.end_sample()
+        self.started = False
+        gc.callbacks.remove(self.on_gc)
+        self.final = tracemalloc.take_snapshot()
+        if self.owns_tracing:
+            tracemalloc.stop()
+            self.owns_tracing = False
+
+    def on_gc(self, phase, info):
+        if phase == 'start':
+            self.gc_started = time.perf_counter()
+        elif self.gc_started is not None:
+            ms = (time.perf_counter() - self.gc_started) * 1000
+            self.gc_started = None
+            self.gc_pending += ms
+            self.collections.append((self.frame_count, info['generation'], ms, info['collected']))
+
+    def begin_frame(self):
+        if not self.started:
+            self.start()
+        if self.sample_every and self.frame_count % self.sample_every == 0:
+            self.begin_sample()
+        self.current = {phase: [0, 0, 0.0] for phase in PHASES}
+        self.phase_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def lap(self, phase):
+        current, peak = tracemalloc.get_traced_memory()
+        stats = self.current[phase]
+        stats[0] += current - self.phase_start
+        stats[1] = max(stats[1], peak - self.phase_start)
+        stats[2] += self.gc_pending
+        self.gc_pending = 0.0
+        self.phase_start = current
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        if self.sampling:
+            self.end_sample()
+        else:
+            self.history.append((self.frame_count, self.current))
+        self.frame_count += 1
+
+    def ignored(self):
+        # The instrumentation's own bookkeeping
+        return [tracemalloc.Filter(False, path)
+                for path in (tracemalloc.__file__, __file__, profiler.__file__)]
+
+    def begin_sample(self):
+        self.gc_was_enabled = gc.isenabled()
+        gc.disable()
+        self.frame_before = tracemalloc.take_snapshot().filter_traces(self.ignored())
+        self.previous_profile = sys.getprofile()
+        self.sampling = True
+        sys.setprofile(self.keep_locals)
+
+    def keep_locals(self, frame, event, arg):
+        if event == 'return':
+            self.kept.append(arg)
+            self.kept.extend(frame.f_locals.values())
+
+    def end_sample(self):
+        sys.setprofile(self.previous_profile)
+        self.sampling = False
+        after = tracemalloc.take_snapshot().filter_traces(self.ignored())
+        for stat in after.compare_to(self.frame_before, 'lineno'):
+            if stat.count_diff > 0 or stat.size_diff > 0:
+                frame = stat.traceback[0]
+                totals = self.sites.setdefault((frame.filename, frame.lineno), [0, 0])
+                totals[0] += max(0, stat.count_diff)
+                totals[1] += max(0, stat.size_diff)
+        self.kept = []
+        self.frame_before = None
+        if self.gc_was_enabled:
+            gc.enable()
+        self.sampled_frames += 1
+
+    def phase_stats(self):
+        stats = {}
+        for phase in PHASES:
+            net = sorted(frame[phase][0] for _, frame in self.history)
+            peak = sorted(frame[phase][1] for _, frame in self.history)
+            stats[phase] = {
+                'net_bytes': {'p50': percentile(net, 0.5), 'p95': percentile(net, 0.95),
+                              'max': net[-1] if net else 0},
+                'peak_bytes': {'p50': percentile(peak, 0.5), 'p95': percentile(peak, 0.95),
+                               'max': peak[-1] if peak else 0},
+                'gc_ms': sum(frame[phase][2] for _, frame in self.history),
+            }
+        return stats
+
+    def gc_stats(self):
+        pauses = sorted(ms for _, _, ms, _ in self.collections)
+        by_generation = {}
+        for _, generation, ms, _ in self.collections:
+            count, total = by_generation.get(generation, (0, 0.0))
+            by_generation[generation] = (count + 1, total + ms)
+        worst = sorted(self.collections, key=lambda item: item[2], reverse=True)[:self.top]
+        return {
+            'collections': len(pauses),
+            'total_ms': sum(pauses),
+            'p95_ms': percentile(pauses, 0.95),
+            'max_ms': pauses[-1] if pauses else 0.0,
+            'by_generation': {str(generation): {'count': count, 'total_ms': total}
+                              for generation, (count, total) in sorted(by_generation.items())},
+            'worst': [{'frame': frame, 'generation': generation, 'ms': ms, 'collected': collected}
+                      for frame, generation, ms, collected in worst],
+        }
+
+    def top_sites(self):
+        """Lines allocating the most blocks (then bytes) per sampled frame."""
+        if not self.sampled_frames:
+            return []
+        ranked = sorted(self.sites.items(), key=lambda item: (item[1][0], item[1][1]), reverse=True)
+        return [{'site': f"{filename}:{lineno}",
+                 'blocks_per_frame': blocks / self.sampled_frames,
+                 'bytes_per_frame': size / self.sampled_frames}
+                for (filename, lineno), (blocks, size) in ranked[:self.top]]
+
+    def retained_sites(self):
+        if self.baseline is None or self.final is None:
+            return []
+        final = self.final.filter_traces(self.ignored())
+        baseline = self.baseline.filter_traces(self.ignored())
+        sites = []
+        for stat in final.compare_to(baseline, 'lineno')[:self.top]:
+            frame = stat.traceback[0]
+            sites.append({'site': f"{frame.filename}:{frame.lineno}", 'size_diff': stat.size_diff,
+                          'count_diff': stat.count_diff, 'size': stat.size, 'count': stat.count})
+        return sites
+
+    def summary(self):
+        return {
+            'frames': self.frame_count,
+            'sampled_frames': self.sampled_frames,
+            'phases': self.phase_stats(),
+            'gc': self.gc_stats(),
+            'top_sites': self.top_sites(),
+            'retained_sites': self.retained_sites(),
+        }
+
+    def export(self, prefix):
+        """Write ``prefix``-allocs.json and return the summary."""
+        summary = self.summary()
+        with open(prefix + '-allocs.json', 'w') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def format_summary(self, summary):
+        lines = [f"{'phase':<8} {'net p50':>9} {'net p95':>9} {'peak p95':>9} {'peak max':>9} {'gc ms':>7}"]
+        for phase, row in summary['phases'].items():
+            lines.append(f"{phase:<8} {row['net_bytes']['p50']:>9} {row['net_bytes']['p95']:>9} "
+                         f"{row['peak_bytes']['p95']:>9} {row['peak_bytes']['max']:>9} "
+                         f"{row['gc_ms']:>7.2f}")
+        gc_row = summary['gc']
+        lines.append(f"gc: {gc_row['collections']} collections, {gc_row['total_ms']:.2f} ms total, "
+                     f"worst {gc_row['max_ms']:.2f} ms")
+        lines.append(f"allocations per frame ({summary['sampled_frames']} sampled frames):")
+        for site in summary['top_sites'][:5]:
+            lines.append(f"  {site['blocks_per_frame']:>7.1f} blocks {site['bytes_per_frame']:>9.0f} B  "
+                         f"{site['site']}")
+        return '\n'.join(lines)
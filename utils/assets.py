@@ -0,0 +1,71 @@
+import threading
+import pygame
+
+# Raw (unconverted) images and sounds are safe to load from a worker thread;
+# display-format conversion and scaling happen on first use in the main thread.
+_lock = threading.Lock()
+_raw_images = {}
+_images = {}
+_sounds = {}
+
+
+def load_raw_image(path):
+    with _lock:
+        surface = _raw_images.get(path)
+    if surface is None:
+        surface = pygame.image.load(path)
+        with _lock:
+            surface = _raw_images.setdefault(path, surface)
+    return surface
+
+
+def load_image(path, alpha=False, size=None):
+    """Return a display-converted (and optionally scaled) image, cached.
+
+    Cached surfaces are shared; callers must copy before drawing on them.
+    """
+    key = (path, alpha, size)
+    surface = _images.get(key)
+    if surface is not None:
+        return surface
+
+    surface = load_raw_image(path)
+    if pygame.display.get_surface():
+        surface = surface.convert_alpha() if alpha else surface.convert()
+    if size is not None:
+        surface = pygame.transform.scale(surface, size)
+    _images[key] = surface
+    return surface
+
+
+def load_sound(path):
+    with _lock:
+        sound = _sounds.get(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        with _lock:
+            sound = _sounds.setdefault(path, sound)
+    return sound
+
+
+def cached_ids():
+    """ids of every cached surface and sound, for telling shared assets apart."""
+    with _lock:
+        return {id(item) for cache in (_raw_images, _images, _sounds) for item in cache.values()}
+
+
+def preload(images=(), sounds=()):
+    """Warm the raw caches; intended to run on a background thread."""
+    for path in images:
+        load_raw_image(path)
+    if pygame.mixer.get_init():
+        for path in sounds:
+            load_sound(path)
+
+
+def clear():
+    """Drop every cached asset, e.g. to measure a cold load."""
+    with _lock:
+        _raw_images.clear()
+        _images.clear()
+        _sounds.clear()
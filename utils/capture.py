@@ -0,0 +1,197 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+FORMATS = ('png', 'gif', 'apng')
+
+
+def png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+
+def write_png(path, size, rgb, level=3):
+    """Write packed RGB bytes as a PNG.
+
+    pygame.image.save keeps the GIL while it encodes, which stalls the game
+    thread; here the only heavy step is zlib, which releases it.
+    """
+    width, height = size
+    stride = width * 3
+    rows = memoryview(rgb)
+    # Each scanline is prefixed with filter type 0 (none)
+    raw = b''.join(b'\x00' + rows[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(png_chunk(b'IHDR', header))
+        f.write(png_chunk(b'IDAT', zlib.compress(raw, level)))
+        f.write(png_chunk(b'IEND', b''))
+
+
+class FrameCapture:
+    """Records the screen to disk without stalling the frame loop.
+
+    ``grab`` is all the main thread does: at most ``rate`` times a second it
+    scales the frame into the next slot of a preallocated ring of surfaces
+    and queues it for a small thread pool. When every slot is still waiting
+    on the encoder the frame is dropped instead of blocking the game.
+
+    ``fmt`` 'png' writes a numbered PNG sequence and needs only pygame;
+    'gif' and 'apng' are assembled with Pillow once recording stops.
+    """
+
+    def __init__(self, out_dir='captures', fmt='png', rate=15, scale=0.5, slots=32, workers=2):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.rate = rate
+        self.scale = scale
+        self.slot_count = slots
+        self.workers = workers
+        self.slots = []
+        self.busy = []  # Set while a slot's frame is queued or being encoded
+        self.size = None  # Frame size of the clip, fixed by its first frame
+        self.recording = False
+        self.pool = None
+        self.clip = None  # (format, path, encoded images) being recorded
+        self.next_slot = 0
+        self.next_grab = 0.0
+        self.frames = 0
+        self.dropped = 0
+
+    def allocate(self, surface):
+        # Slots match the screen's pixel format so scaling into them is a
+        # straight copy; they are reused by later clips of the same shape
+        width, height = surface.get_size()
+        self.size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        if self.slots and self.slots[0].get_size() == self.size and \
+                self.slots[0].get_masks() == surface.get_masks() and len(self.slots) == self.slot_count:
+            return
+        # Encoders still finishing a clip hold on to the old lists
+        self.slots = [pygame.Surface(self.size, 0, surface) for _ in range(self.slot_count)]
+        self.busy = [False] * self.slot_count
+        self.next_slot = 0
+
+    def toggle(self, name):
+        if self.recording:
+            self.stop()
+        else:
+            self.start(name)
+        return self.recording
+
+    def start(self, name):
+        if self.recording:
+            return
+        fmt = self.fmt
+        if fmt in ('gif', 'apng'):
+            try:
+                import PIL.Image  # noqa: F401
+            except ImportError:
+                print("Pillow is needed for GIF/APNG capture; saving a PNG sequence instead")
+                fmt = 'png'
+
+        base = os.path.join(self.out_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}")
+        try:
+            if fmt == 'png':
+                os.makedirs(base, exist_ok=True)
+                path = base
+            else:
+                os.makedirs(self.out_dir, exist_ok=True)
+                path = base + ('.gif' if fmt == 'gif' else '.png')
+        except OSError as e:
+            print(f"Could not start capture: {e}")
+            return
+
+        self.clip = (fmt, path, {})
+        self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix='capture')
+        self.frames = 0
+        self.dropped = 0
+        self.next_grab = 0.0
+        self.size = None
+        self.recording = True
+        print(f"Capturing to {path}")
+
+    def grab(self, surface):
+        if not self.recording:
+            return
+        now = time.perf_counter()
+        if now < self.next_grab:
+            return
+        self.next_grab = now + 1 / self.rate
+        if self.size is None:
+            self.allocate(surface)
+
+        slot = self.next_slot
+        if self.busy[slot]:
+            self.dropped += 1
+            return
+        self.busy[slot] = True
+        self.next_slot = (slot + 1) % self.slot_count
+        target = self.slots[slot]
+        if surface.get_size() == self.size:
+            target.blit(surface, (0, 0))
+        elif surface.get_masks() == target.get_masks() and surface.get_bitsize() == target.get_bitsize():
+            pygame.transform.scale(surface, self.size, target)
+        else:
+            # The screen changed format mid-clip (e.g. a mode switch)
+            target.blit(pygame.transform.scale(surface, self.size), (0, 0))
+        self.pool.submit(self.encode, self.slots[slot], self.busy, slot, self.frames, self.clip)
+        self.frames += 1
+
+    @staticmethod
+    def encode(surface, busy, slot, index, clip):
+        # Runs on the pool; frees the slot as soon as its pixels are copied
+        fmt, path, images = clip
+        try:
+            data = pygame.image.tobytes(surface, 'RGB')
+            busy[slot] = False
+            if fmt == 'png':
+                write_png(os.path.join(path, f"{index:05d}.png"), surface.get_size(), data)
+                return
+            from PIL import Image
+            image = Image.frombytes('RGB', surface.get_size(), data)
+            if fmt == 'gif':
+                # Palette reduction is the slow part, so it runs per frame here
+                image = image.quantize(256)
+            images[index] = image
+        except Exception as e:
+            print(f"Capture frame {index} failed: {e}")
+        finally:
+            busy[slot] = False
+
+    def stop(self, wait=False):
+        """End the recording; ``wait`` blocks until it is on disk (at exit)."""
+        if not self.recording:
+            return
+        self.recording = False
+        # Waiting on the encoders and writing the animation happen off the
+        # main thread too
+        finisher = threading.Thread(target=self.finish,
+                                    args=(self.pool, self.clip, self.frames, self.dropped, self.rate),
+                                    name='capture-finish')
+        finisher.start()
+        self.pool = None
+        self.clip = None
+        if wait:
+            finisher.join()
+
+    @staticmethod
+    def finish(pool, clip, frames, dropped, rate):
+        pool.shutdown(wait=True)
+        fmt, path, images = clip
+        if fmt != 'png' and images:
+            ordered = [images[index] for index in sorted(images)]
+            try:
+                ordered[0].save(path, format='GIF' if fmt == 'gif' else 'PNG', save_all=True,
+                                append_images=ordered[1:], duration=round(1000 / rate), loop=0)
+            except Exception as e:
+                print(f"Could not save capture {path}: {e}")
+                return
+        print(f"Captured {frames} frames to {path} ({dropped} dropped)")
+
+
+# Shared by the launcher and every game
+capture = FrameCapture()
@@ -0,0 +1,29 @@
+import pygame
+
+# Past this share of the screen a single full flip is cheaper than many updates
+FULL_FLIP_FRACTION = 0.5
+
+
+def merge_rects(rects, bounds, max_fraction=FULL_FLIP_FRACTION):
+    """Clip ``rects`` to ``bounds`` and union the ones that touch.
+
+    Returns the merged list, or None when the changed area is large enough
+    that presenting the whole frame is the better deal.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect).clip(bounds)
+        if rect.w <= 0 or rect.h <= 0:
+            continue
+        # Keep absorbing neighbours until the rect overlaps none of them
+        while True:
+            index = rect.inflate(2, 2).collidelist(merged)
+            if index < 0:
+                break
+            rect.union_ip(merged.pop(index))
+        merged.append(rect)
+
+    area = sum(rect.w * rect.h for rect in merged)
+    if area > bounds.w * bounds.h * max_fraction:
+        return None
+    return merged
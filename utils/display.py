@@ -0,0 +1,77 @@
+import pygame
+
+
+def parse_size(text):
+    """Parse "WIDTHxHEIGHT" (as given on the command line) into a tuple."""
+    try:
+        width, height = (int(value) for value in text.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Bad size {text!r}; expected WIDTHxHEIGHT") from None
+    return (width, height)
+
+
+class DisplayContext:
+    """Owns the single window shared by the launcher and every game.
+
+    Callers ask for the mode they want with ``ensure_mode`` and get back the
+    display surface to render into. ``set_mode`` only runs when the size or
+    fullscreen state actually differs, so switching between the launcher and
+    a game at the same resolution never recreates the window.
+    """
+
+    def __init__(self):
+        self.windowed_size = None  # Size to restore when leaving fullscreen
+        self.caption = None
+        self.mode_changes = 0
+
+    @property
+    def surface(self):
+        return pygame.display.get_surface()
+
+    @property
+    def fullscreen(self):
+        surface = self.surface
+        return bool(surface and surface.get_flags() & pygame.FULLSCREEN)
+
+    def desktop_size(self):
+        if not pygame.display.get_init():
+            pygame.display.init()
+        return pygame.display.get_desktop_sizes()[0]
+
+    def ensure_mode(self, size=None, fullscreen=False):
+        """Return a display surface with the requested mode.
+
+        ``size`` defaults to the desktop in fullscreen and to the last
+        windowed size otherwise.
+        """
+        if fullscreen:
+            size = self.desktop_size()
+        elif size is None:
+            size = self.windowed_size or self.desktop_size()
+        size = tuple(size)
+
+        surface = self.surface
+        if surface is not None and surface.get_size() == size and self.fullscreen == fullscreen:
+            return surface
+
+        flags = pygame.FULLSCREEN if fullscreen else 0
+        surface = pygame.display.set_mode(size, flags)
+        self.mode_changes += 1
+        if not fullscreen:
+            self.windowed_size = surface.get_size()
+        return surface
+
+    def sync(self):
+        # Pick up a mode change made by the window manager (VIDEORESIZE)
+        surface = self.surface
+        if surface is not None and not self.fullscreen:
+            self.windowed_size = surface.get_size()
+        return surface
+
+    def set_caption(self, title):
+        if title != self.caption:
+            pygame.display.set_caption(title)
+            self.caption = title
+
+
+window = DisplayContext()
@@ -0,0 +1,48 @@
+import math
+import time
+import pygame
+
+
+class FrameScheduler:
+    """Runs a UI loop at full rate only while something is animating.
+
+    When idle the loop blocks on ``pygame.event.wait`` and wakes either on
+    input or after ``idle_fps`` worth of time (never, if idle_fps is 0).
+    Input always buys a short burst of full-rate frames so that hover and
+    click feedback starts without waiting for the next idle tick.
+    """
+
+    def __init__(self, active_fps=60, idle_fps=10, input_burst_ms=250):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.input_burst_ms = input_burst_ms
+        self.clock = pygame.time.Clock()
+        self.active_until = 0
+        self.dt = 0
+
+    def poll(self, animating, timeout_ms=None):
+        """Wait for the next frame and return the events that arrived.
+
+        ``timeout_ms`` caps an idle wait; None uses the idle rate, or waits
+        for input alone when idle_fps is 0.
+        """
+        now = time.perf_counter()
+        if animating or now < self.active_until:
+            self.dt = self.clock.tick(self.active_fps)
+            events = pygame.event.get()
+        else:
+            if timeout_ms is None and self.idle_fps:
+                timeout_ms = 1000 / self.idle_fps
+            if timeout_ms is None:
+                event = pygame.event.wait()
+            else:
+                # wait(0) would block until input, so a deadline that is
+                # under a millisecond away, or already past, still times out
+                event = pygame.event.wait(max(1, math.ceil(timeout_ms)))
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            self.dt = self.clock.tick()
+
+        if events:
+            self.active_until = time.perf_counter() + self.input_burst_ms / 1000
+        return events
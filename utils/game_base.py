@@ -1,15 +1,66 @@
+import os
+import random
+import time
 import pygame
 from pygame import mixer
+from utils import scores
+from utils.display import window
+from utils.input_source import LiveInput
+from utils.profiler import FrameProfiler
+from utils.alloc_profiler import AllocationProfiler
+from utils.rewind import RewindBuffer
+from utils.dirty_rects import merge_rects
+from utils.quality import QualityGovernor
+from utils.capture import capture
+from utils.hud import Hud, Label, Menu, Overlay
 
 class GameBase:
+    # Whether the launcher may keep this game alive between sessions
+    poolable = True
+    # Registry key results are filed under; None for games without scores
+    game_key = None
+    # Games that draw their own pause indicator turn the shared menu off
+    pause_menu = True
+    # Longest stretch of wall time simulated in one frame; after a longer
+    # hitch the game slows down instead of running a burst of catch-up steps
+    MAX_FRAME_TIME = 0.25
+    # Hotkey for the frame profiler overlay
+    PROFILER_KEY = pygame.K_F3
+    # Starts/stops recording the screen to disk (see utils.capture)
+    CAPTURE_KEY = pygame.K_F9
+    # Games implementing snapshot()/restore() can be rewound while this is held
+    rewindable = False
+    REWIND_KEY = pygame.K_BACKSPACE
+    REWIND_SECONDS = 10
+    # Games that implement moving_rects()/scene_state() (and mark_dirty()
+    # for anything else that changes) only redraw and present those regions
+    dirty_rects = False
+    # More reported regions than this in one frame and a full flip is cheaper
+    DIRTY_LIMIT = 64
+    # When set, frame timings are written to <prefix>-<game>.csv/.json on exit
+    profile_prefix = os.environ.get('GAME_CENTER_PROFILE')
+    # When set, per-phase allocations, GC pauses and the top allocating
+    # lines are traced and written to <prefix>-<game>-allocs.json on exit.
+    # tracemalloc makes every frame much slower, so timings taken alongside
+    # are not representative
+    alloc_prefix = os.environ.get('GAME_CENTER_ALLOCS')
+    # Seed for every game's rng; None picks a fresh one per game instance
+    default_seed = None
+    # When set, games draw at this (width, height) whatever the window size
+    # and each frame is scaled to fit the window with 'nearest' or 'smooth'
+    logical_size = None
+    scale_filter = 'smooth'
+    # (name, {attribute: value}) pairs from best to cheapest; the governor
+    # moves between them when frames miss or comfortably make the budget
+    QUALITY_TIERS = ()
+    adaptive_quality = True
+
     def __init__(self, width=None, height=None, title="Game"):
-        # Get display info for proper screen sizing
-        display_info = pygame.display.Info()
-        self.max_width = display_info.current_w
-        self.max_height = display_info.current_h
+        # Fullscreen always uses the desktop resolution
+        self.max_width, self.max_height = window.desktop_size()
         
         # Use current display mode size if no dimensions provided
-        current_mode = pygame.display.get_surface()
+        current_mode = window.surface
         if current_mode:
             self.width = current_mode.get_width() if width is None else width
             self.height = current_mode.get_height() if height is None else height
@@ -17,17 +68,38 @@ class GameBase:
             # Default to 80% of screen size if no current display
             self.width = int(self.max_width * 0.8) if width is None else width
             self.height = int(self.max_height * 0.8) if height is None else height
+        self.window_size = (self.width, self.height)
+        self.screen = None
         
         # Check if already in fullscreen
-        self.is_fullscreen = bool(pygame.display.get_surface().get_flags() & pygame.FULLSCREEN) if pygame.display.get_surface() else False
+        self.is_fullscreen = window.fullscreen
+        self.title = title
+        self.player_name = "guest"
+        self.reset_clock()
+        # Swapped for a scripted source when running headless
+        self.input = LiveInput()
+        self.reset_profilers()
+        self.show_profiler = False
+        self.dirty = []  # Regions changed since the last frame
+        self.drawn_rects = []
+        self.drawn_state = None
+        self.present_rects = None  # None presents the whole frame
+        self.start_round()
         self.setup_display()
-        pygame.display.set_caption(title)
+        self.update_caption()
         
         # Game settings
         self.clock = pygame.time.Clock()
         self.running = True
         self.paused = False
-        self.FPS = 60
+        self.FPS = 60  # Render rate
+        self.UPDATE_RATE = 60  # Simulation rate
+        self.rewinding = False
+        self.rewind = RewindBuffer(self.REWIND_SECONDS) if self.rewindable else None
+        # Kept across relaunches: the hardware has not changed
+        self.quality = None
+        if self.adaptive_quality and self.QUALITY_TIERS:
+            self.quality = QualityGovernor(title, self.QUALITY_TIERS, self.FPS, self.apply_quality)
 
         # Colors
         self.WHITE = (255, 255, 255)
@@ -35,24 +107,154 @@ class GameBase:
         self.GRAY = (128, 128, 128)
 
         # Pause menu buttons
-        self.pause_font = pygame.font.Font(None, 36)
+        self.pause_font_size = 36
         self.menu_items = ["Resume", "Toggle Fullscreen", "Back to Launcher"]
         self.selected_item = 0
+        # Built on the first paused frame and again after a resize
+        self.pause_layer = None
+        self.pause_layer_size = None
+        self.pause_options = None
+        self.rewind_label = Label("<< REWIND", self.pause_font_size, self.WHITE, anchor='topright')
 
     def setup_display(self):
+        # The window is shared with the launcher; this only changes the mode
+        # when the size or fullscreen state differs from what is showing
         if self.is_fullscreen:
-            self.screen = pygame.display.set_mode((self.max_width, self.max_height), pygame.FULLSCREEN)
-            self.width = self.max_width
-            self.height = self.max_height
+            self.display = window.ensure_mode(fullscreen=True)
+        else:
+            self.display = window.ensure_mode(self.window_size)
+
+        # With a logical resolution the game keeps drawing at the same size
+        # into an offscreen surface and present() scales it into the window
+        self.view = None
+        if self.logical_size and tuple(self.logical_size) != self.display.get_size():
+            if self.screen is None or self.screen is window.surface or \
+                    self.screen.get_size() != tuple(self.logical_size):
+                self.screen = pygame.Surface(self.logical_size).convert()
+            self.view = self.fit_rect(self.display.get_size())
+            self.display.fill((0, 0, 0))
+            self.scaled = self.display.subsurface(self.view)
         else:
-            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.screen = self.display
+        self.width, self.height = self.screen.get_size()
+        self.invalidate()
+
+    def fit_rect(self, display_size):
+        # Largest rect with the logical aspect ratio, centred (letterboxed)
+        logical_w, logical_h = self.logical_size
+        scale = min(display_size[0] / logical_w, display_size[1] / logical_h)
+        rect = pygame.Rect(0, 0, round(logical_w * scale), round(logical_h * scale))
+        rect.center = (display_size[0] // 2, display_size[1] // 2)
+        return rect
+
+    def to_logical(self, pos):
+        # Window coordinates to the coordinates the game draws in
+        if self.view is None:
+            return pos
+        x = (pos[0] - self.view.x) * self.width // self.view.w
+        y = (pos[1] - self.view.y) * self.height // self.view.h
+        return (min(max(x, 0), self.width - 1), min(max(y, 0), self.height - 1))
+
+    def can_relaunch(self):
+        # Layout is derived from the window size, so only reuse an instance
+        # made for the same mode; a fresh one always follows the window
+        surface = window.surface
+        if surface is None or self.is_fullscreen != window.fullscreen:
+            return False
+        return surface.get_size() == self.window_size
+
+    def relaunch(self):
+        # Cheap restart for an instance kept warm by the launcher's game pool
+        self.running = True
+        self.paused = False
+        self.selected_item = 0
+        self.reset_profilers()
+        self.rewinding = False
+        if self.rewind is not None:
+            self.rewind.clear()
+        self.reset_clock()
+        self.setup_display()
+        self.update_caption()
+        self.reset_game()
+
+    def reset_clock(self, seed=None):
+        # All randomness and timing in a game comes from self.rng and
+        # self.game_time, so a run can be replayed exactly from its seed and
+        # stepped faster than real time
+        if seed is None:
+            seed = self.default_seed
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.game_time = 0.0  # Simulated ms, advanced by each update
+
+    def reset_game(self):
+        # To be implemented by child classes
+        pass
+
+    def apply_quality(self, settings):
+        # Tier settings are plain attributes the game's drawing code reads
+        for name, value in settings.items():
+            setattr(self, name, value)
+        self.invalidate()
+
+    def start_round(self):
+        self.round_started_at = time.perf_counter()
+
+    def final_score(self):
+        # The value submit_score() is given at game over; batch runs report
+        # it too so their results are on the same scale
+        return getattr(self, 'score', None)
+
+    def submit_score(self, score):
+        # Hand a game-over result to the shared score store; never blocks
+        store = scores.get_store()
+        if store is None or self.game_key is None:
+            return
+        duration = time.perf_counter() - self.round_started_at
+        store.post(self.game_key, self.player_name, score, duration)
+
+    def update_caption(self):
+        window.set_caption(self.title + (" [REC]" if capture.recording else ""))
+
+    def toggle_capture(self):
+        capture.toggle(self.game_key or self.title.lower())
+        self.update_caption()
 
     def toggle_fullscreen(self):
         self.is_fullscreen = not self.is_fullscreen
+        if not self.is_fullscreen and window.windowed_size:
+            self.window_size = window.windowed_size
         self.setup_display()
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    def poll_events(self):
+        # Every game reads its events through here so that hotkeys shared
+        # by all games work regardless of how handle_events is overridden
+        events = self.input.get_events()
+        if self.view is not None:
+            events = [self.map_mouse(event) for event in events]
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == self.PROFILER_KEY:
+                self.show_profiler = not self.show_profiler
+            elif event.type == pygame.KEYDOWN and event.key == self.CAPTURE_KEY:
+                self.toggle_capture()
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key == self.REWIND_KEY:
+                self.rewinding = event.type == pygame.KEYDOWN and self.rewind is not None
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.invalidate()
+        return events
+
+    def map_mouse(self, event):
+        if not hasattr(event, 'pos'):
+            return event
+        attributes = dict(event.dict, pos=self.to_logical(event.pos))
+        return pygame.event.Event(event.type, attributes)
+
+    def handle_events(self, events=None):
+        if events is None:
+            events = self.poll_events()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return True
@@ -80,44 +282,270 @@ class GameBase:
                             return True
         return False
 
+    def build_pause_layer(self):
+        # Widgets for the pause screen at the current size; games with a
+        # different pause screen override this
+        center_x, center_y = self.width // 2, self.height // 2
+        self.pause_options = Menu(self.menu_items, self.pause_font_size, self.GRAY, self.WHITE,
+                                  (center_x, center_y))
+        title = Label("PAUSED", self.pause_font_size, self.WHITE, (center_x, center_y - 50), 'center')
+        return Hud(Overlay(self.BLACK, 128), title, self.pause_options)
+
     def draw_pause_menu(self):
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill(self.BLACK)
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
-
-        # Draw pause menu title
-        title = self.pause_font.render("PAUSED", True, self.WHITE)
-        title_rect = title.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        self.screen.blit(title, title_rect)
-
-        # Draw pause menu items
-        for i, item in enumerate(self.menu_items):
-            color = self.WHITE if i == self.selected_item else self.GRAY
-            text = self.pause_font.render(item, True, color)
-            text_rect = text.get_rect(center=(self.width // 2, self.height // 2 + i * 50))
-            self.screen.blit(text, text_rect)
+        size = self.screen.get_size()
+        if self.pause_layer is None or self.pause_layer_size != size:
+            self.pause_layer = self.build_pause_layer()
+            self.pause_layer_size = size
+        if self.pause_options is not None:
+            self.pause_options.select(self.selected_item)
+        self.pause_layer.draw(self.screen)
+
+    def update_rate(self):
+        # Simulation steps per second; every update() advances by exactly one
+        return self.UPDATE_RATE
+
+    @property
+    def step_ms(self):
+        return 1000 / self.update_rate()
+
+    @staticmethod
+    def interpolate(previous, current, alpha):
+        return previous + (current - previous) * alpha
+
+    def mark_dirty(self, *rects):
+        # Report screen regions that changed outside of moving_rects()
+        self.dirty.extend(rects)
+        if len(self.dirty) > self.DIRTY_LIMIT:
+            self.dirty = []
+            self.invalidate()
+
+    def invalidate(self):
+        # Scene change: the next frame is drawn and presented in full
+        self.full_redraw = True
+
+    def moving_rects(self, alpha):
+        # Where the game's moving parts are drawn this frame; their old and
+        # new positions are redrawn together
+        return []
+
+    def scene_state(self):
+        # Anything drawn outside moving_rects(), e.g. scores; the whole frame
+        # is redrawn whenever this value changes
+        return None
+
+    def render(self, alpha=1.0):
+        overlays = (self.paused and self.pause_menu) or self.rewinding or self.show_profiler
+        if self.dirty_rects and not (overlays or self.full_redraw):
+            if self.render_dirty(alpha):
+                return
+        self.draw(alpha)
+        if self.paused and self.pause_menu:
+            self.draw_pause_menu()
+        if self.rewinding:
+            self.rewind_label.move((self.width - 20, 20))
+            self.rewind_label.draw(self.screen)
+        if self.show_profiler:
+            self.profiler.draw(self.screen)
+
+        self.present_rects = None
+        self.dirty = []
+        if self.dirty_rects:
+            self.drawn_rects = self.moving_rects(alpha)
+            self.drawn_state = self.scene_state()
+        # Overlays cover the whole frame, so the frame after them is full too
+        self.full_redraw = overlays
+
+    def render_dirty(self, alpha):
+        # Redraw only the changed regions, each clipped so draw() touches no
+        # other pixels; False when a full frame is needed instead
+        state = self.scene_state()
+        if state != self.drawn_state:
+            return False
+        rects = self.moving_rects(alpha)
+        regions = merge_rects(self.dirty + self.drawn_rects + rects, self.screen.get_rect())
+        if regions is None:
+            return False
+        for region in regions:
+            self.screen.set_clip(region)
+            self.draw(alpha)
+        self.screen.set_clip(None)
+        self.present_rects = regions
+        self.dirty = []
+        self.drawn_rects = rects
+        return True
+
+    def present(self):
+        if self.view is not None:
+            # One scale pass straight into the window; dirty regions are not
+            # worth tracking through the scale, so the frame goes out whole
+            if self.scale_filter == 'nearest':
+                pygame.transform.scale(self.screen, self.view.size, self.scaled)
+            else:
+                pygame.transform.smoothscale(self.screen, self.view.size, self.scaled)
+            if self.present_rects is None:
+                pygame.display.flip()  # Full frames also repaint the letterbox
+            else:
+                pygame.display.update(self.view)
+        elif self.present_rects is None:
+            pygame.display.flip()
+        elif self.present_rects:
+            pygame.display.update(self.present_rects)
+        capture.grab(self.screen)
+
+    def advance(self):
+        # One fixed simulation step; while rewinding it steps back instead.
+        # The step length is read before update(), which may change the rate
+        # (Snake speeds up), so the clock and the rewind history agree
+        step_ms = self.step_ms
+        if self.rewind is None:
+            self.update()
+        elif self.rewinding:
+            snapshot = self.rewind.pop()
+            if snapshot is not None:
+                self.restore(snapshot)
+                self.invalidate()
+            return
+        else:
+            if self.rewind.current is None:
+                self.rewind.push(self.snapshot())
+            self.update()
+            snapshot = self.snapshot()
+            # Paused or idle steps would only fill the history with copies
+            if snapshot != self.rewind.current:
+                self.rewind.push(snapshot, step_ms)
+        self.game_time += step_ms
+
+    def snapshot(self):
+        # Rewindable games return their simulation state as compact bytes
+        raise NotImplementedError
+
+    def restore(self, data):
+        raise NotImplementedError
+
+    def step(self, draw=True):
+        """Advance one fixed step without presenting it; False once the game exits."""
+        profiler = self.profiler
+        profiler.begin_frame()
+        if self.handle_events():
+            return False
+        profiler.lap('events')
+
+        if not self.paused:
+            self.advance()
+        profiler.lap('update')
+
+        if draw:
+            self.render()
+            profiler.lap('draw')
+
+        self.input.next_frame()
+        profiler.end_frame()
+        return self.running
 
     def run(self):
+        # Fixed-timestep loop: update() runs at update_rate() no matter how
+        # fast frames are drawn, and draw() gets how far we are into the
+        # next step so motion can be interpolated
+        profiler = self.profiler
+        accumulator = 0.0
+        last = time.perf_counter()
         while self.running:
+            profiler.begin_frame()
+            now = time.perf_counter()
+            accumulator += min(now - last, self.MAX_FRAME_TIME)
+            last = now
+
             if self.handle_events():
                 break
+            profiler.lap('events')
 
-            if not self.paused:
-                self.update()
-            
-            self.draw()
-            if self.paused:
-                self.draw_pause_menu()
-            
-            pygame.display.flip()
+            step = 1 / self.update_rate()
+            steps = 0
+            while accumulator >= step:
+                if not self.paused:
+                    self.advance()
+                accumulator -= step
+                steps += 1
+                step = 1 / self.update_rate()
+            profiler.lap('update')
+
+            self.render(1.0 if self.paused else accumulator / step)
+            profiler.lap('draw')
+            self.present()
+            profiler.lap('flip')
+            if self.quality is not None:
+                self.quality.record(profiler.elapsed())
+            # Recorders need the step count to reproduce this frame exactly
+            self.input.next_frame(steps)
             self.clock.tick(self.FPS)
+            profiler.lap('tick')
+            profiler.end_frame()
+        self.export_profile()
+
+    def run_headless(self, frames, draw=True):
+        """Step up to ``frames`` fixed steps as fast as possible, never presenting.
+
+        Returns the number of steps actually run.
+        """
+        for frame in range(frames):
+            if not self.step(draw):
+                break
+        else:
+            frame = frames - 1
+        self.export_profile()
+        return frame + 1
+
+    def run_replay(self, draw=False):
+        """Play back a recording (``self.input`` is a ReplayInput) at full speed.
+
+        Each recorded frame runs exactly the number of fixed steps it ran
+        live, so the game ends up in the same state. Returns frames played.
+        """
+        frames = 0
+        while self.running and not self.input.finished:
+            if self.handle_events():
+                break
+            for _ in range(self.input.steps):
+                if not self.paused:
+                    self.advance()
+            if draw:
+                self.render()
+            self.input.next_frame()
+            frames += 1
+        return frames
+
+    def reset_profilers(self):
+        self.profiler = FrameProfiler()
+        if self.alloc_prefix:
+            # Tracing itself only starts with the first profiled frame
+            self.profiler.allocations = AllocationProfiler()
+
+    def export_profile(self):
+        name = self.game_key or self.title.lower().replace(' ', '')
+        allocations = self.profiler.allocations
+        if allocations is not None and allocations.started:
+            allocations.stop()
+            prefix = f"{self.alloc_prefix}-{name}"
+            try:
+                summary = allocations.export(prefix)
+                print(allocations.format_summary(summary))
+                print(f"Allocation profile written to {prefix}-allocs.json")
+            except OSError as e:
+                print(f"Could not write allocation profile: {e}")
+        if not self.profile_prefix or self.profiler.frame_count == 0:
+            return
+        prefix = f"{self.profile_prefix}-{name}"
+        try:
+            self.profiler.export(prefix)
+            print(f"Frame profile written to {prefix}.csv and {prefix}.json")
+        except OSError as e:
+            print(f"Could not write frame profile: {e}")
 
     def update(self):
         # To be implemented by child classes
         pass
 
-    def draw(self):
-        # To be implemented by child classes
+    def draw(self, alpha=1.0):
+        # To be implemented by child classes; alpha is the fraction of the
+        # next fixed step that has elapsed, for interpolating motion
         pass
\ No newline at end of file
@@ -0,0 +1,88 @@
+import pygame
+from collections import OrderedDict
+from utils import assets
+from utils.display import window
+
+# Rough per-instance overhead for objects that own no surfaces or sounds
+BASE_INSTANCE_COST = 16 * 1024
+
+
+def _sound_bytes(sound):
+    mixer_init = pygame.mixer.get_init()
+    if not mixer_init:
+        return 0
+    frequency, size, channels = mixer_init
+    return int(sound.get_length() * frequency * channels * (abs(size) // 8))
+
+
+def estimate_size(obj, seen=None, depth=0):
+    """Approximate the pixel and sample memory a game object owns.
+
+    Cached assets are shared by every instance and stay loaded anyway, and
+    the window (with its subsurfaces) belongs to the launcher, so neither
+    is counted.
+    """
+    if seen is None:
+        seen = assets.cached_ids()
+    if id(obj) in seen or depth > 4:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pygame.Surface):
+        if window.surface is not None and obj.get_abs_parent() is window.surface:
+            return 0
+        return obj.get_pitch() * obj.get_height()
+    if isinstance(obj, pygame.mixer.Sound):
+        return _sound_bytes(obj)
+    if isinstance(obj, pygame.sprite.AbstractGroup):
+        return sum(estimate_size(sprite, seen, depth + 1) for sprite in obj.sprites())
+    if isinstance(obj, (list, tuple, set)):
+        return sum(estimate_size(item, seen, depth + 1) for item in obj)
+    if isinstance(obj, dict):
+        return sum(estimate_size(item, seen, depth + 1) for item in obj.values())
+    if hasattr(obj, '__dict__'):
+        return sum(estimate_size(item, seen, depth + 1) for item in vars(obj).values())
+    return 0
+
+
+class GamePool:
+    """Keeps recently exited game instances warm under a memory budget.
+
+    Instances are evicted least-recently-used first. A pooled instance is
+    handed back through ``relaunch()`` instead of being constructed again.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, key, factory):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            game, cost = entry
+            self.bytes -= cost
+            if game.can_relaunch():
+                game.relaunch()
+                self.hits += 1
+                return game
+        self.misses += 1
+        return factory()
+
+    def release(self, key, game):
+        if not getattr(game, 'poolable', False):
+            return
+        cost = BASE_INSTANCE_COST + estimate_size(game)
+        if cost > self.max_bytes:
+            return
+        self.entries[key] = (game, cost)
+        self.bytes += cost
+        while self.bytes > self.max_bytes:
+            _, (_, evicted_cost) = self.entries.popitem(last=False)
+            self.bytes -= evicted_cost
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
@@ -0,0 +1,125 @@
+import pygame
+from utils.text_cache import render_text
+
+
+class Label:
+    """A line of text that keeps its rendered surface between frames.
+
+    The surface is only rendered again when the text, size, color or
+    antialias setting changes, and its rect only recomputed when it moves.
+    ``anchor`` is any pygame.Rect position attribute; ``pos`` is where that
+    point goes.
+    """
+
+    def __init__(self, text='', size=36, color=(255, 255, 255), pos=(0, 0), anchor='topleft',
+                 antialias=True, font=None):
+        self.text = text
+        self.size = size
+        self.color = color
+        self.pos = pos
+        self.anchor = anchor
+        self.antialias = antialias
+        self.font = font
+        self.surface = None
+        self.rect = None
+        self.rendered = None  # (text, size, color, antialias) the surface shows
+
+    def set(self, text):
+        self.text = text
+
+    def move(self, pos):
+        if pos != self.pos:
+            self.pos = pos
+            self.rect = None
+
+    def refresh(self):
+        state = (self.text, self.size, self.color, self.antialias)
+        if state != self.rendered:
+            self.surface = render_text(self.text, self.size, self.color, self.antialias, self.font)
+            self.rendered = state
+            self.rect = None
+        if self.rect is None:
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+
+    def draw(self, target):
+        self.refresh()
+        target.blit(self.surface, self.rect)
+
+
+class Counter(Label):
+    """A label showing a value through a format string, e.g. 'Score: {}'.
+
+    Formatting happens only when the value changes, so the game can call
+    ``set`` every frame.
+    """
+
+    def __init__(self, fmt='{}', value=0, **kwargs):
+        super().__init__(fmt.format(value), **kwargs)
+        self.fmt = fmt
+        self.value = value
+
+    def set(self, value):
+        if value != self.value:
+            self.value = value
+            self.text = self.fmt.format(value)
+
+
+class Menu:
+    """A vertical list of options with one highlighted.
+
+    Both looks of every option are kept, so moving the selection only
+    changes which cached surfaces are drawn.
+    """
+
+    def __init__(self, items, size=36, color=(128, 128, 128), selected_color=(255, 255, 255),
+                 center=(0, 0), spacing=50):
+        x, y = center
+        self.options = [(Label(item, size, color, (x, y + i * spacing), 'center'),
+                         Label(item, size, selected_color, (x, y + i * spacing), 'center'))
+                        for i, item in enumerate(items)]
+        self.selected = 0
+
+    def select(self, index):
+        self.selected = index
+
+    def draw(self, target):
+        for i, (normal, highlighted) in enumerate(self.options):
+            (highlighted if i == self.selected else normal).draw(target)
+
+
+class Overlay:
+    """A translucent full-screen fill, allocated once per target size."""
+
+    def __init__(self, color=(0, 0, 0), alpha=128):
+        self.color = color
+        self.alpha = alpha
+        self.surface = None
+
+    def draw(self, target):
+        size = target.get_size()
+        if self.surface is None or self.surface.get_size() != size:
+            # Surface alpha on an opaque surface blends faster than per-pixel alpha
+            self.surface = pygame.Surface(size)
+            if pygame.display.get_surface():
+                self.surface = self.surface.convert()
+            self.surface.fill(self.color)
+            self.surface.set_alpha(self.alpha)
+        target.blit(self.surface, (0, 0))
+
+
+class Hud:
+    """Widgets drawn over the game in order, e.g. a menu above its overlay."""
+
+    def __init__(self, *widgets):
+        self.widgets = list(widgets)
+        self.visible = True
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def draw(self, target):
+        if not self.visible:
+            return
+        for widget in self.widgets:
+            widget.draw(target)
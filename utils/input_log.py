@@ -0,0 +1,306 @@
+import zlib
+import pygame
+from utils.input_source import KeyState
+
+MAGIC = b'GCIN'
+VERSION = 1
+
+# Only the events games act on are kept
+EVENT_CODES = {
+    pygame.KEYDOWN: 0,
+    pygame.KEYUP: 1,
+    pygame.MOUSEBUTTONDOWN: 2,
+    pygame.MOUSEBUTTONUP: 3,
+    pygame.MOUSEMOTION: 4,
+    pygame.MOUSEWHEEL: 5,
+    pygame.QUIT: 6,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+# Frame records
+IDLE_RUN = 0  # steps, count: frames with no events and unchanged key state
+FRAME = 1     # steps, events, optional key state
+
+
+def write_int(buf, value):
+    # Zigzag varint: small magnitudes of either sign take one byte
+    value = (value << 1) ^ (value >> 63)
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def write_text(buf, text):
+    data = text.encode('utf-8')
+    write_int(buf, len(data))
+    buf.extend(data)
+
+
+class _Reader:
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def int(self):
+        result = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        return (result >> 1) ^ -(result & 1)
+
+    def text(self):
+        length = self.int()
+        data = self.data[self.pos:self.pos + length]
+        self.pos += length
+        return data.decode('utf-8')
+
+    def at_end(self):
+        return self.pos >= len(self.data)
+
+
+def encode_event(buf, event):
+    code = EVENT_CODES[event.type]
+    buf.append(code)
+    if event.type == pygame.KEYDOWN:
+        write_int(buf, event.key)
+        write_int(buf, getattr(event, 'mod', 0))
+        write_int(buf, getattr(event, 'scancode', 0))
+        write_text(buf, getattr(event, 'unicode', ''))
+    elif event.type == pygame.KEYUP:
+        write_int(buf, event.key)
+        write_int(buf, getattr(event, 'mod', 0))
+        write_int(buf, getattr(event, 'scancode', 0))
+    elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        write_int(buf, event.button)
+        write_int(buf, event.pos[0])
+        write_int(buf, event.pos[1])
+    elif event.type == pygame.MOUSEMOTION:
+        write_int(buf, event.pos[0])
+        write_int(buf, event.pos[1])
+        write_int(buf, event.rel[0])
+        write_int(buf, event.rel[1])
+        write_int(buf, sum(1 << i for i, down in enumerate(event.buttons) if down))
+    elif event.type == pygame.MOUSEWHEEL:
+        write_int(buf, event.x)
+        write_int(buf, event.y)
+
+
+def decode_event(reader):
+    event_type = EVENT_TYPES[reader.data[reader.pos]]
+    reader.pos += 1
+    if event_type == pygame.KEYDOWN:
+        return pygame.event.Event(event_type, key=reader.int(), mod=reader.int(),
+                                  scancode=reader.int(), unicode=reader.text())
+    if event_type == pygame.KEYUP:
+        return pygame.event.Event(event_type, key=reader.int(), mod=reader.int(),
+                                  scancode=reader.int())
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        button = reader.int()
+        return pygame.event.Event(event_type, button=button, pos=(reader.int(), reader.int()))
+    if event_type == pygame.MOUSEMOTION:
+        pos = (reader.int(), reader.int())
+        rel = (reader.int(), reader.int())
+        mask = reader.int()
+        return pygame.event.Event(event_type, pos=pos, rel=rel,
+                                  buttons=tuple(bool(mask & (1 << i)) for i in range(3)))
+    if event_type == pygame.MOUSEWHEEL:
+        return pygame.event.Event(event_type, x=reader.int(), y=reader.int())
+    return pygame.event.Event(event_type)
+
+
+class InputRecorder:
+    """Encodes a session one rendered frame at a time.
+
+    Each frame stores how many fixed steps ran, the events handled and the
+    pressed keys the game looked at. Runs of quiet frames collapse into a
+    single record and the body is zlib-compressed on save.
+    """
+
+    def __init__(self, game_key, seed, size):
+        self.game_key = game_key
+        self.seed = seed
+        self.size = size
+        self.body = bytearray()
+        self.frame_count = 0
+        self.idle = None  # [steps, count] of the quiet run being collected
+
+    def add_frame(self, steps, events, held=None):
+        """Append a frame; ``held`` is None when the key state is unchanged."""
+        self.frame_count += 1
+        if not events and held is None:
+            if self.idle is not None and self.idle[0] == steps:
+                self.idle[1] += 1
+                return
+            self.flush_idle()
+            self.idle = [steps, 1]
+            return
+
+        self.flush_idle()
+        buf = self.body
+        buf.append(FRAME)
+        write_int(buf, steps)
+        write_int(buf, len(events))
+        for event in events:
+            encode_event(buf, event)
+        if held is None:
+            buf.append(0)
+        else:
+            buf.append(1)
+            write_int(buf, len(held))
+            for key in sorted(held):
+                write_int(buf, key)
+
+    def flush_idle(self):
+        if self.idle is not None:
+            self.body.append(IDLE_RUN)
+            write_int(self.body, self.idle[0])
+            write_int(self.body, self.idle[1])
+            self.idle = None
+
+    def to_bytes(self):
+        self.flush_idle()
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        write_text(header, self.game_key or '')
+        write_int(header, self.seed)
+        write_int(header, self.size[0])
+        write_int(header, self.size[1])
+        write_int(header, self.frame_count)
+        return bytes(header) + zlib.compress(bytes(self.body), 6)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+
+class InputLog:
+    """A decoded recording; iterating yields (steps, events, held) per frame."""
+
+    def __init__(self, data):
+        if data[:4] != MAGIC:
+            raise ValueError("Not an input recording")
+        if data[4] != VERSION:
+            raise ValueError(f"Unsupported input recording version {data[4]}")
+        reader = _Reader(data, 5)
+        self.game_key = reader.text()
+        self.seed = reader.int()
+        self.size = (reader.int(), reader.int())
+        self.frame_count = reader.int()
+        self.body = zlib.decompress(data[reader.pos:])
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def __iter__(self):
+        reader = _Reader(self.body)
+        while not reader.at_end():
+            kind = reader.data[reader.pos]
+            reader.pos += 1
+            if kind == IDLE_RUN:
+                steps = reader.int()
+                for _ in range(reader.int()):
+                    yield steps, (), None
+            elif kind == FRAME:
+                steps = reader.int()
+                events = [decode_event(reader) for _ in range(reader.int())]
+                held = None
+                has_held = reader.data[reader.pos]
+                reader.pos += 1
+                if has_held:
+                    held = frozenset(reader.int() for _ in range(reader.int()))
+                yield steps, events, held
+            else:
+                raise ValueError(f"Corrupt input recording (record type {kind})")
+
+
+class _RecordingKeys:
+    # Passes key lookups through, remembering which keys were seen held
+    def __init__(self, pressed, owner):
+        self.pressed = pressed
+        self.owner = owner
+
+    def __getitem__(self, key):
+        value = self.pressed[key]
+        self.owner.queried = True
+        if value:
+            self.owner.frame_held.add(key)
+        return value
+
+
+class RecordingInput:
+    """Wraps another input source and records what the game sees from it.
+
+    Key state is captured as the set of keys the game asked about and found
+    held, which is all a replay needs to answer the same questions.
+    """
+
+    def __init__(self, source, recorder):
+        self.source = source
+        self.recorder = recorder
+        self.frame_events = []
+        self.frame_held = set()
+        self.last_held = frozenset()
+        self.queried = False
+
+    def get_events(self):
+        events = self.source.get_events()
+        self.frame_events.extend(event for event in events if event.type in EVENT_CODES)
+        return events
+
+    def get_pressed(self):
+        return _RecordingKeys(self.source.get_pressed(), self)
+
+    def next_frame(self, steps=1):
+        held = None
+        if self.queried:
+            current = frozenset(self.frame_held)
+            if current != self.last_held:
+                held = self.last_held = current
+        self.recorder.add_frame(steps, self.frame_events, held)
+        self.frame_events = []
+        self.frame_held = set()
+        self.queried = False
+        self.source.next_frame(steps)
+
+    def finish(self):
+        # Events from a frame cut short (e.g. quitting) still belong in the log
+        if self.frame_events:
+            self.recorder.add_frame(0, self.frame_events)
+            self.frame_events = []
+
+
+class ReplayInput:
+    """Feeds a recording back frame by frame; see ``GameBase.run_replay``."""
+
+    def __init__(self, log):
+        self.frames = iter(log)
+        self.held = frozenset()
+        self.events = []
+        self.steps = 0
+        self.finished = False
+        self.next_frame()
+
+    def get_events(self):
+        pygame.event.clear()
+        return self.events
+
+    def get_pressed(self):
+        return KeyState(self.held)
+
+    def next_frame(self, steps=1):
+        try:
+            self.steps, events, held = next(self.frames)
+        except StopIteration:
+            self.finished = True
+            self.steps, events, held = 0, [], None
+        self.events = list(events)
+        if held is not None:
+            self.held = held
+
@@ -0,0 +1,86 @@
+import pygame
+
+
+class LiveInput:
+    """Reads the real pygame event queue and keyboard state."""
+
+    def get_events(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def next_frame(self, steps=1):
+        pass
+
+
+class KeyState:
+    """Stand-in for ``pygame.key.get_pressed()`` backed by a set of keys."""
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """Feeds a fixed, frame-indexed list of events to a game.
+
+    ``script`` is an iterable of (frame, event) pairs. Key state for
+    ``get_pressed`` follows the scripted KEYDOWN/KEYUP events. Whatever
+    arrives on the real queue is discarded so runs are reproducible.
+    """
+
+    def __init__(self, script=()):
+        self.script = sorted(script, key=lambda item: item[0])
+        self.position = 0
+        self.frame = 0
+        self.held = set()
+
+    @classmethod
+    def from_taps(cls, spec):
+        """Build a script from "FRAME:KEY[:HOLD],..." (e.g. "10:space,40:left:5").
+
+        Each key is pressed on FRAME and released HOLD frames later (1 by
+        default). Key names are the ones ``pygame.key.key_code`` accepts.
+        """
+        script = []
+        for item in spec.split(','):
+            if not item.strip():
+                continue
+            parts = item.strip().split(':')
+            if len(parts) not in (2, 3):
+                raise ValueError(f"Bad key tap {item!r}; expected FRAME:KEY[:HOLD]")
+            frame = int(parts[0])
+            hold = int(parts[2]) if len(parts) == 3 else 1
+            key = pygame.key.key_code(parts[1])
+            script.append((frame, pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='')))
+            script.append((frame + hold, pygame.event.Event(pygame.KEYUP, key=key, mod=0)))
+        return cls(script)
+
+    def get_events(self):
+        pygame.event.clear()
+        events = []
+        while self.position < len(self.script) and self.script[self.position][0] <= self.frame:
+            event = self.script[self.position][1]
+            self.position += 1
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held.discard(event.key)
+            events.append(event)
+        return events
+
+    def get_pressed(self):
+        return KeyState(self.held)
+
+    def next_frame(self, steps=1):
+        self.frame += 1
+
+
+class NullInput(ScriptedInput):
+    """No input at all; the game only ever sees its own simulation."""
+
+    def __init__(self):
+        super().__init__(())
@@ -0,0 +1,151 @@
+import json
+import platform
+import statistics
+import sys
+import time
+import pygame
+from games import registry
+from utils import assets
+from utils.display import DisplayContext
+from utils.game_pool import GamePool
+
+PHASES = ('import', 'construct', 'assets', 'display', 'frame')
+
+
+class _Probe:
+    """Accumulates time spent in wrapped callables.
+
+    Nested calls (e.g. load_image -> load_raw_image) are only counted once,
+    at the outermost level.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.depth = 0
+
+    def wrap(self, func):
+        def timed(*args, **kwargs):
+            self.depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.total += time.perf_counter() - start
+        return timed
+
+
+class LaunchBench:
+    """Times ``GameLauncher.launch_game`` from the call to the first present.
+
+    Every run is cold: the game's module is unimported, the asset caches are
+    emptied and the launcher's pool keeps nothing, so each launch imports,
+    constructs and loads from scratch. The game is stopped right after its
+    first ``display.flip``/``display.update``.
+    """
+
+    def __init__(self, launcher, runs=5):
+        self.launcher = launcher
+        self.runs = runs
+        self.presented_at = None
+
+    def _present(self, func):
+        def present(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if self.presented_at is None:
+                self.presented_at = time.perf_counter()
+                game = self.launcher.current_game
+                if game is not None:
+                    game.running = False
+            return result
+        return present
+
+    def measure(self, spec):
+        sys.modules.pop(spec.module, None)
+        assets.clear()
+
+        probes = {name: _Probe() for name in ('import', 'create', 'assets', 'display')}
+        patches = [
+            (registry.GameSpec, 'load', probes['import'].wrap(registry.GameSpec.load)),
+            (registry.GameSpec, 'create', probes['create'].wrap(registry.GameSpec.create)),
+            (DisplayContext, 'ensure_mode', probes['display'].wrap(DisplayContext.ensure_mode)),
+            (pygame.display, 'flip', self._present(pygame.display.flip)),
+            (pygame.display, 'update', self._present(pygame.display.update)),
+        ]
+        for name in ('load_raw_image', 'load_image', 'load_sound'):
+            patches.append((assets, name, probes['assets'].wrap(getattr(assets, name))))
+        patches.append((pygame.image, 'load', probes['assets'].wrap(pygame.image.load)))
+
+        originals = [(owner, name, getattr(owner, name)) for owner, name, _ in patches]
+        for owner, name, replacement in patches:
+            setattr(owner, name, replacement)
+        self.presented_at = None
+        try:
+            start = time.perf_counter()
+            self.launcher.launch_game(spec.key)
+        finally:
+            for owner, name, original in originals:
+                setattr(owner, name, original)
+
+        if self.presented_at is None:
+            return None
+        total = self.presented_at - start
+        imported = probes['import'].total
+        loaded = probes['assets'].total
+        display = probes['display'].total
+        # Construction is what create() spent on anything but the above
+        construct = probes['create'].total - imported - loaded - display
+        sample = {
+            'import': imported,
+            'construct': max(0.0, construct),
+            'assets': loaded,
+            'display': display,
+        }
+        sample['frame'] = max(0.0, total - sum(sample.values()))
+        sample['total'] = total
+        return {name: round(value * 1000, 3) for name, value in sample.items()}
+
+    def run(self, keys=None):
+        # Nothing may be kept warm between runs
+        self.launcher.game_pool = GamePool(0)
+        specs = [registry.get_game(key) for key in keys] if keys else registry.GAMES
+        results = {}
+        for spec in specs:
+            if spec is None:
+                continue
+            if spec.external:
+                results[spec.key] = {'skipped': "runs in a separate process"}
+                continue
+            samples = [sample for sample in (self.measure(spec) for _ in range(self.runs))
+                       if sample is not None]
+            if not samples:
+                results[spec.key] = {'skipped': "never presented a frame"}
+                continue
+            summary = {}
+            for name in PHASES + ('total',):
+                values = [sample[name] for sample in samples]
+                summary[name] = {
+                    'median': round(statistics.median(values), 3),
+                    'min': min(values),
+                    'max': max(values),
+                }
+            results[spec.key] = {'ms': summary, 'samples': samples}
+
+        return {
+            'benchmark': 'launch-to-first-frame',
+            'runs': self.runs,
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'video_driver': pygame.display.get_driver(),
+            'games': results,
+        }
+
+
+def write_report(report, path=None):
+    text = json.dumps(report, indent=2)
+    if path:
+        with open(path, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
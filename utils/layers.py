@@ -0,0 +1,92 @@
+import pygame
+
+
+class Layer:
+    """A single compositing layer.
+
+    Cached layers keep their own surface and only call ``render`` again after
+    ``invalidate``; uncached layers draw straight onto the target every frame
+    (used for small animated elements where a full-size buffer is wasteful).
+    """
+
+    def __init__(self, name, render, transparent=False, cached=True):
+        self.name = name
+        self.render = render
+        self.transparent = transparent
+        self.cached = cached
+        self.visible = True
+        self.surface = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def resize(self, size):
+        if self.surface is not None and self.surface.get_size() == size:
+            return
+        # Drop the buffer; it is recreated at the new size on the next compose
+        self.surface = None
+        self.dirty = True
+
+    def _ensure_surface(self, size):
+        if self.surface is None or self.surface.get_size() != size:
+            if self.transparent:
+                self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            else:
+                self.surface = pygame.Surface(size)
+                if pygame.display.get_surface():
+                    self.surface = self.surface.convert()
+            self.dirty = True
+
+    def compose(self, target):
+        if not self.visible:
+            return
+        if not self.cached:
+            self.render(target)
+            return
+
+        self._ensure_surface(target.get_size())
+        if self.dirty:
+            if self.transparent:
+                self.surface.fill((0, 0, 0, 0))
+            self.render(self.surface)
+            self.dirty = False
+        target.blit(self.surface, (0, 0))
+
+
+class Compositor:
+    """Draws an ordered stack of layers, bottom first."""
+
+    def __init__(self):
+        self.layers = []
+        self.size = None
+
+    def add_layer(self, name, render, transparent=False, cached=True):
+        layer = Layer(name, render, transparent, cached)
+        self.layers.append(layer)
+        return layer
+
+    def get_layer(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def invalidate(self, name=None):
+        if name is None:
+            for layer in self.layers:
+                layer.invalidate()
+        else:
+            self.get_layer(name).invalidate()
+
+    def resize(self, size):
+        self.size = size
+        for layer in self.layers:
+            layer.resize(size)
+
+    def compose(self, target):
+        size = target.get_size()
+        if size != self.size:
+            self.resize(size)
+        for layer in self.layers:
+            layer.compose(target)
@@ -0,0 +1,138 @@
+import csv
+import json
+import time
+from collections import deque
+import pygame
+from utils.text_cache import render_text
+
+PHASES = ('events', 'update', 'draw', 'flip', 'tick')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling percentiles.
+
+    The game loop calls ``begin_frame``, then ``lap(phase)`` after each
+    phase, then ``end_frame``. Percentiles cover the last ``window`` frames;
+    ``history`` bounds how many frames are kept for CSV export. All times
+    are in milliseconds.
+
+    ``allocations``, when set to an AllocationProfiler, is stepped through
+    the same phases.
+    """
+
+    allocations = None
+
+    def __init__(self, window=600, history=18000, refresh_ms=250):
+        self.window = {phase: deque(maxlen=window) for phase in PHASES + ('frame',)}
+        self.history = deque(maxlen=history)
+        self.refresh_ms = refresh_ms
+        self.frame_count = 0
+        self.worst = None  # (total, {phase: ms}) of the slowest frame seen
+        self.current = {}
+        self.frame_start = 0.0
+        self.last = 0.0
+        self.overlay = None
+        self.overlay_at = 0.0
+
+    def begin_frame(self):
+        self.frame_start = self.last = time.perf_counter()
+        self.current = dict.fromkeys(PHASES, 0.0)
+        if self.allocations is not None:
+            self.allocations.begin_frame()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last) * 1000
+        self.last = now
+        if self.allocations is not None:
+            self.allocations.lap(phase)
+
+    def elapsed(self):
+        # Milliseconds from begin_frame to the latest lap
+        return (self.last - self.frame_start) * 1000
+
+    def end_frame(self):
+        total = (self.last - self.frame_start) * 1000
+        for phase, value in self.current.items():
+            self.window[phase].append(value)
+        self.window['frame'].append(total)
+        self.history.append((self.frame_count, total) + tuple(self.current[phase] for phase in PHASES))
+        if self.worst is None or total > self.worst[0]:
+            self.worst = (total, dict(self.current))
+        self.frame_count += 1
+        if self.allocations is not None:
+            self.allocations.end_frame()
+
+    def stats(self):
+        stats = {}
+        for phase, values in self.window.items():
+            ordered = sorted(values)
+            stats[phase] = {
+                'p50': percentile(ordered, 0.50),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0,
+            }
+        return stats
+
+    def draw(self, surface, pos=(10, 10)):
+        # Percentiles are re-rendered a few times a second, not every frame
+        now = time.perf_counter() * 1000
+        if self.overlay is None or now - self.overlay_at >= self.refresh_ms:
+            self.overlay = self.render_overlay()
+            self.overlay_at = now
+        surface.blit(self.overlay, pos)
+
+    def render_overlay(self):
+        stats = self.stats()
+        rows = [('ms', 'p50', 'p95', 'p99', 'max')]
+        for phase in PHASES + ('frame',):
+            row = stats[phase]
+            rows.append((phase,) + tuple(f"{row[key]:.2f}" for key in ('p50', 'p95', 'p99', 'max')))
+        footer = None
+        if self.worst is not None:
+            footer = f"worst frame {self.worst[0]:.1f} ms"
+
+        # Columns are laid out by hand so numbers line up in the default font
+        size, color = 20, (255, 255, 255)
+        label_width, column_width, line_height = 70, 60, 20
+        lines = len(rows) + (1 if footer else 0)
+        overlay = pygame.Surface((label_width + column_width * 4 + 12, line_height * lines + 12),
+                                 pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, row in enumerate(rows):
+            y = 6 + i * line_height
+            overlay.blit(render_text(row[0], size, color), (6, y))
+            for column, cell in enumerate(row[1:]):
+                text = render_text(cell, size, color)
+                right = 6 + label_width + (column + 1) * column_width
+                overlay.blit(text, (right - text.get_width(), y))
+        if footer:
+            overlay.blit(render_text(footer, size, color), (6, 6 + len(rows) * line_height))
+        return overlay
+
+    def summary(self):
+        return {
+            'frames': self.frame_count,
+            'window': len(self.window['frame']),
+            'phases': self.stats(),
+            'worst_frame': None if self.worst is None else {
+                'total': self.worst[0], 'phases': self.worst[1]},
+        }
+
+    def export(self, prefix):
+        """Write ``prefix``.csv (one row per kept frame) and ``prefix``.json (summary)."""
+        with open(prefix + '.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('frame', 'total') + PHASES)
+            for row in self.history:
+                writer.writerow([row[0]] + [f"{value:.4f}" for value in row[1:]])
+        with open(prefix + '.json', 'w') as f:
+            json.dump(self.summary(), f, indent=2)
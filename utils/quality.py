@@ -0,0 +1,71 @@
+from utils.profiler import percentile
+
+
+class QualityGovernor:
+    """Steps between quality tiers to keep frame work inside the budget.
+
+    ``tiers`` run from best to cheapest as (name, settings) pairs and
+    ``apply`` is called with the settings of each newly chosen tier. Every
+    ``window`` frames the 90th percentile of work time (everything but the
+    sleep before the next frame) is checked: near the budget drops a tier,
+    well under it for a while climbs back one. A climb that fails straight
+    away doubles the wait before the next try, so the tier does not flap.
+    """
+
+    DOWNGRADE_AT = 0.9  # Fractions of the frame budget
+    UPGRADE_AT = 0.5
+    MAX_UPGRADE_WAIT = 32  # Windows
+
+    def __init__(self, name, tiers, fps, apply, window=90):
+        self.name = name
+        self.tiers = list(tiers)
+        self.budget = 1000 / fps
+        self.apply = apply
+        self.window = window
+        self.samples = []
+        self.level = 0
+        self.calm_windows = 0
+        self.upgrade_wait = 2
+        self.just_raised = False
+
+    @property
+    def tier_name(self):
+        return self.tiers[self.level][0]
+
+    def record(self, work_ms):
+        """Add one frame's work time; returns True when the tier changed."""
+        if len(self.tiers) < 2:
+            return False
+        self.samples.append(work_ms)
+        if len(self.samples) < self.window:
+            return False
+        self.samples.sort()
+        p90 = percentile(self.samples, 0.9)
+        self.samples.clear()
+
+        just_raised, self.just_raised = self.just_raised, False
+        if p90 > self.budget * self.DOWNGRADE_AT:
+            self.calm_windows = 0
+            if self.level == len(self.tiers) - 1:
+                return False
+            if just_raised:
+                self.upgrade_wait = min(self.upgrade_wait * 2, self.MAX_UPGRADE_WAIT)
+            self.set_level(self.level + 1, p90)
+            return True
+        if p90 < self.budget * self.UPGRADE_AT and self.level > 0:
+            self.calm_windows += 1
+            if self.calm_windows >= self.upgrade_wait:
+                self.calm_windows = 0
+                self.just_raised = True
+                self.set_level(self.level - 1, p90)
+                return True
+            return False
+        self.calm_windows = 0
+        return False
+
+    def set_level(self, level, p90=None):
+        previous = self.tier_name
+        self.level = level
+        self.apply(self.tiers[level][1])
+        reason = f" (p90 work {p90:.1f} ms, budget {self.budget:.1f} ms)" if p90 is not None else ""
+        print(f"{self.name}: quality {previous} -> {self.tier_name}{reason}")
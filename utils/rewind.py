@@ -0,0 +1,76 @@
+import struct
+import zlib
+from collections import deque
+
+_LENGTH = struct.Struct('<H')
+
+
+def encode_delta(previous, current):
+    """Bytes that turn ``current`` back into ``previous``.
+
+    The two snapshots are XORed (padded to the same length), so fields that
+    did not change become zero bytes and compress to almost nothing.
+    """
+    size = max(len(previous), len(current))
+    mixed = (int.from_bytes(previous, 'little') ^ int.from_bytes(current, 'little'))
+    return _LENGTH.pack(len(previous)) + zlib.compress(mixed.to_bytes(size, 'little'), 1)
+
+
+def decode_delta(current, delta):
+    (length,) = _LENGTH.unpack_from(delta)
+    mixed = zlib.decompress(delta[_LENGTH.size:])
+    previous = int.from_bytes(current, 'little') ^ int.from_bytes(mixed, 'little')
+    return previous.to_bytes(len(mixed), 'little')[:length]
+
+
+class RewindBuffer:
+    """History of game snapshots stored as reverse deltas, bounded by time.
+
+    Only the newest snapshot is kept whole; each older one is a compressed
+    delta against its successor. Every push records the simulated time its
+    step covered, and once the total passes ``seconds`` the oldest steps
+    are dropped, so games with a slower (or changing) update rate keep the
+    same span of history as 60 Hz ones.
+    """
+
+    def __init__(self, seconds):
+        self.budget_ms = seconds * 1000
+        self.deltas = deque()  # (delta, step ms), oldest first
+        self.span_ms = 0.0
+        self.current = None
+        self.bytes = 0
+
+    @property
+    def count(self):
+        return len(self.deltas)
+
+    def push(self, snapshot, step_ms=0.0):
+        if self.current is not None:
+            delta = encode_delta(self.current, snapshot)
+            self.deltas.append((delta, step_ms))
+            self.bytes += len(delta)
+            self.span_ms += step_ms
+            while self.span_ms > self.budget_ms:
+                old, old_ms = self.deltas.popleft()
+                self.bytes -= len(old)
+                self.span_ms -= old_ms
+        self.current = snapshot
+
+    def pop(self):
+        """Step back once; returns the older snapshot or None when exhausted."""
+        if not self.deltas:
+            return None
+        delta, step_ms = self.deltas.pop()
+        self.bytes -= len(delta)
+        self.span_ms -= step_ms
+        self.current = decode_delta(self.current, delta)
+        return self.current
+
+    def clear(self):
+        self.deltas.clear()
+        self.span_ms = 0.0
+        self.current = None
+        self.bytes = 0
+
+    def memory_bytes(self):
+        return self.bytes + (len(self.current) if self.current else 0)
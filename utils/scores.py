@@ -0,0 +1,188 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+_STOP = object()
+
+
+class ScoreStore:
+    """Cross-game score table with a background batching writer.
+
+    ``post`` only enqueues, so games can report results from the render
+    loop. A writer thread drains the queue in batches, one transaction per
+    batch. Reads use a per-thread connection; WAL mode lets them run while
+    the writer is committing.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            game TEXT NOT NULL,
+            username TEXT NOT NULL COLLATE NOCASE,
+            score REAL NOT NULL,
+            duration REAL NOT NULL,
+            played_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_scores_game_score ON scores (game, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_scores_user_game_score ON scores (username, game, score DESC);
+    """
+
+    def __init__(self, path, batch_size=64, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.local = threading.local()
+        # Bumped after every committed batch so caches can tell they are stale
+        self.version = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connect()
+        connection.executescript(self.SCHEMA)
+        connection.close()
+
+        self.writer = threading.Thread(target=self._write_loop, name='score-writer', daemon=True)
+        self.writer.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def post(self, game, username, score, duration=0.0):
+        """Queue a result; never blocks on the database."""
+        self.queue.put((game, username, float(score), float(duration), time.time()))
+
+    def _write_loop(self):
+        connection = self._connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            # Give a burst of results a moment to arrive so they share a commit
+            deadline = time.perf_counter() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            running = len(rows) == len(batch)
+            if rows:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO scores (game, username, score, duration, played_at) "
+                            "VALUES (?, ?, ?, ?, ?)", rows)
+                    self.version += 1
+                except sqlite3.Error as e:
+                    print(f"Could not save {len(rows)} score(s): {e}")
+            for _ in batch:
+                self.queue.task_done()
+        connection.close()
+
+    def _reader(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            self.local.connection = connection
+        return connection
+
+    def top_scores(self, game, limit=10, ascending=False):
+        order = "ASC" if ascending else "DESC"
+        return self._reader().execute(
+            f"SELECT username, score, played_at FROM scores WHERE game = ? "
+            f"ORDER BY score {order} LIMIT ?", (game, limit)
+        ).fetchall()
+
+    def top_for_user(self, username, game, limit=10, ascending=False):
+        order = "ASC" if ascending else "DESC"
+        return self._reader().execute(
+            f"SELECT score, played_at FROM scores WHERE username = ? AND game = ? "
+            f"ORDER BY score {order} LIMIT ?", (username, game, limit)
+        ).fetchall()
+
+    def flush(self):
+        """Block until everything posted so far has been written."""
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(_STOP)
+        self.writer.join()
+
+
+class LeaderboardCache:
+    """Top-N lists per game, refreshed off the render thread.
+
+    ``get`` never touches the database: it returns what is cached and, if
+    that is missing or older than the store, schedules a refresh. ``poll``
+    reports when refreshed data has landed so the caller can redraw once.
+    """
+
+    def __init__(self, store, limit=5):
+        self.store = store
+        self.limit = limit
+        self.entries = {}
+        self.pending = set()
+        self.updated = False
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='leaderboard')
+
+    def get(self, game, ascending=False):
+        with self.lock:
+            entry = self.entries.get(game)
+            stale = entry is None or entry[0] != self.store.version
+            if stale and game not in self.pending:
+                self.pending.add(game)
+                self.executor.submit(self._refresh, game, ascending)
+        return entry[1] if entry is not None else None
+
+    def _refresh(self, game, ascending):
+        version = self.store.version
+        try:
+            rows = self.store.top_scores(game, self.limit, ascending)
+        except sqlite3.Error as e:
+            print(f"Could not load leaderboard for {game}: {e}")
+            rows = []
+        with self.lock:
+            self.entries[game] = (version, rows)
+            self.pending.discard(game)
+            self.updated = True
+
+    def poll(self):
+        with self.lock:
+            updated, self.updated = self.updated, False
+        return updated
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+_store = None
+
+
+def open_store(path):
+    global _store
+    if _store is None:
+        _store = ScoreStore(path)
+    return _store
+
+
+def get_store():
+    return _store
+
+
+def close_store():
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
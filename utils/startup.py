@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Taken as the process start; import this module before anything heavy
+PROCESS_START = time.perf_counter()
+
+
+class StartupTrace:
+    """Records named startup phases and prints them as a timeline.
+
+    Phases are always recorded (it costs a couple of perf_counter calls);
+    the timeline is only printed when tracing is enabled.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.phases = []
+        self.marks = []
+        self.open_phases = {}
+        self.reported = False
+
+    def now_ms(self):
+        return (time.perf_counter() - PROCESS_START) * 1000
+
+    def begin(self, name):
+        self.open_phases[name] = self.now_ms()
+
+    def end(self, name):
+        start = self.open_phases.pop(name, None)
+        if start is None:
+            return
+        with self.lock:
+            self.phases.append((name, start, self.now_ms(), threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def mark(self, name):
+        with self.lock:
+            if not any(mark == name for mark, _ in self.marks):
+                self.marks.append((name, self.now_ms()))
+
+    def get_mark(self, name):
+        for mark, at in self.marks:
+            if mark == name:
+                return at
+        return None
+
+    def report(self, budget_mark=None, budget_ms=None):
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        with self.lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+            marks = list(self.marks)
+
+        print("Startup timeline (ms since process start)")
+        print(f"  {'phase':<12} {'start':>8} {'end':>8} {'dur':>8}  thread")
+        for name, start, end, thread in phases:
+            print(f"  {name:<12} {start:8.1f} {end:8.1f} {end - start:8.1f}  {thread}")
+        for name, at in marks:
+            print(f"  * {name} at {at:.1f}")
+
+        if budget_mark is not None and budget_ms is not None:
+            at = self.get_mark(budget_mark)
+            if at is None:
+                print(f"  {budget_mark} was never reached")
+            else:
+                status = "OK" if at <= budget_ms else "OVER BUDGET"
+                print(f"  {budget_mark}: {at:.1f} ms (budget {budget_ms} ms) {status}")
+
+
+trace = StartupTrace(enabled='--trace-startup' in sys.argv
+                     or bool(os.environ.get('GAME_CENTER_TRACE_STARTUP')))
+trace.begin('import')
@@ -0,0 +1,80 @@
+import pygame
+from collections import OrderedDict
+
+# One Font object per (face, size) for the whole process
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Return the shared Font for a face/size, creating it on first use."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by pixel memory.
+
+    Surfaces handed out are shared between callers and must not be drawn on.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, size, color, antialias=True, name=None):
+        key = (name, size, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(size, name).render(text, antialias, color)
+        cost = surface.get_pitch() * surface.get_height()
+        # Oversized strings are returned but never cached
+        if cost <= self.max_bytes:
+            self.entries[key] = surface
+            self.bytes += cost
+            self._evict()
+        return surface
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self.entries:
+            _, surface = self.entries.popitem(last=False)
+            self.bytes -= surface.get_pitch() * surface.get_height()
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(text, size, color, antialias=True, name=None):
+    """Render text through the process-wide cache."""
+    return text_cache.render(text, size, color, antialias, name)
@@ -0,0 +1,72 @@
+import pygame
+
+
+class VirtualGrid:
+    """Geometry for a vertically scrolling grid of equally sized tiles.
+
+    Tile positions are computed from the index and the scroll offset, so
+    callers only ever need to materialise the tiles in ``visible_range``.
+    """
+
+    def __init__(self, count, columns, tile_width, tile_height, spacing,
+                 origin, viewport):
+        self.count = count
+        self.columns = columns
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.spacing = spacing
+        self.origin = origin  # Top-left of the first tile at scroll 0
+        self.viewport = pygame.Rect(viewport)  # Area tiles may be scrolled through
+
+    @property
+    def row_pitch(self):
+        return self.tile_height + self.spacing
+
+    @property
+    def rows(self):
+        return (self.count + self.columns - 1) // self.columns
+
+    def content_bottom(self):
+        return self.origin[1] + self.rows * self.row_pitch - self.spacing
+
+    def min_scroll(self):
+        # Most negative offset that still keeps the last row inside the viewport
+        return min(0, self.viewport.bottom - self.content_bottom())
+
+    def clamp_scroll(self, scroll):
+        return max(self.min_scroll(), min(0, scroll))
+
+    def tile_rect(self, index, scroll):
+        row, col = divmod(index, self.columns)
+        x = self.origin[0] + col * (self.tile_width + self.spacing)
+        y = self.origin[1] + row * self.row_pitch + int(round(scroll))
+        return pygame.Rect(x, y, self.tile_width, self.tile_height)
+
+    def visible_range(self, scroll, area=None):
+        """Indices of tiles whose rows intersect ``area`` (the screen by default)."""
+        if self.count == 0:
+            return range(0)
+        area = self.viewport if area is None else area
+        top = area.top - self.origin[1] - int(round(scroll))
+        bottom = area.bottom - self.origin[1] - int(round(scroll))
+        first_row = max(0, top // self.row_pitch)
+        last_row = min(self.rows - 1, bottom // self.row_pitch)
+        if last_row < first_row:
+            return range(0)
+        return range(first_row * self.columns,
+                     min(self.count, (last_row + 1) * self.columns))
+
+    def scroll_to_show(self, index, scroll):
+        """Return the nearest scroll offset that puts a tile fully in view."""
+        rect = self.tile_rect(index, scroll)
+        if rect.top < self.viewport.top:
+            scroll += self.viewport.top - rect.top
+        elif rect.bottom > self.viewport.bottom:
+            scroll -= rect.bottom - self.viewport.bottom
+        return self.clamp_scroll(scroll)
+
+    def index_at(self, pos, scroll):
+        for index in self.visible_range(scroll):
+            if self.tile_rect(index, scroll).collidepoint(pos):
+                return index
+        return None